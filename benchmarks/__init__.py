@@ -0,0 +1 @@
+"""Benchmarks do motor de corte (python -m benchmarks)"""
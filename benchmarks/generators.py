@@ -0,0 +1,83 @@
+"""
+Geradores de pedidos reprodutíveis para os benchmarks.
+
+Cada gerador recebe a semente e a largura do rolo e devolve a lista de
+peças ({'w', 'h', 'qty'}) no formato da interface. A mesma semente gera
+sempre o mesmo pedido, então os resultados podem ser comparados entre
+versões do motor.
+"""
+
+from random import Random
+
+
+def few_types(seed, roll_width):
+    """Poucos tamanhos com quantidades altas (pedido típico de produção)"""
+    rng = Random(seed)
+    return [{'w': rng.randint(roll_width // 6, roll_width // 2),
+             'h': rng.randint(300, 1200),
+             'qty': rng.randint(200, 2000)}
+            for _ in range(rng.randint(3, 5))]
+
+
+def many_unique(seed, roll_width, count=150):
+    """Muitos tamanhos diferentes, uma a três unidades de cada"""
+    rng = Random(seed)
+    sizes = set()
+    while len(sizes) < count:
+        sizes.add((rng.randint(80, roll_width * 2 // 3), rng.randint(100, 1500)))
+    return [{'w': w, 'h': h, 'qty': rng.randint(1, 3)} for w, h in sorted(sizes)]
+
+
+def near_width(seed, roll_width):
+    """Peças quase da largura do rolo, mais algumas estreitas para completar"""
+    rng = Random(seed)
+    wide = [{'w': rng.randint(roll_width * 8 // 10, roll_width),
+             'h': rng.randint(400, 1200),
+             'qty': rng.randint(20, 200)}
+            for _ in range(6)]
+    narrow = [{'w': rng.randint(30, roll_width // 5),
+               'h': rng.randint(400, 1200),
+               'qty': rng.randint(20, 100)}
+              for _ in range(4)]
+    return wide + narrow
+
+
+def tiny_fillers(seed, roll_width):
+    """Peças pequenas em grande quantidade (muitas peças por faixa)"""
+    rng = Random(seed)
+    return [{'w': rng.randint(20, 120), 'h': rng.randint(20, 150),
+             'qty': rng.randint(500, 5000)}
+            for _ in range(12)]
+
+
+def mixed(seed, roll_width):
+    """Combinação dos outros perfis, como um pedido misto real"""
+    rng = Random(seed)
+    pieces = (few_types(rng.random(), roll_width)
+              + many_unique(rng.random(), roll_width, count=40)
+              + near_width(rng.random(), roll_width)[:3]
+              + tiny_fillers(rng.random(), roll_width)[:4])
+    # Junta tamanhos repetidos entre os perfis
+    merged = {}
+    for piece in pieces:
+        key = (piece['w'], piece['h'])
+        merged[key] = merged.get(key, 0) + piece['qty']
+    return [{'w': w, 'h': h, 'qty': qty} for (w, h), qty in sorted(merged.items())]
+
+
+# Cenários: nome → (gerador, largura do rolo, comprimento do rolo)
+SCENARIOS = {
+    'few_types': (few_types, 1050, 50000),
+    'many_unique': (many_unique, 1050, 50000),
+    'near_width': (near_width, 1050, 50000),
+    'tiny_fillers': (tiny_fillers, 1050, 50000),
+    'mixed': (mixed, 1050, 50000),
+    'few_types_3200': (few_types, 3200, 50000),
+    'many_unique_3200': (many_unique, 3200, 50000),
+}
+
+
+def make_order(name, seed=1):
+    """Pedido e rolo de um cenário: (peças, largura, comprimento)"""
+    generator, roll_width, roll_height = SCENARIOS[name]
+    return generator(seed, roll_width), roll_width, roll_height
@@ -0,0 +1,107 @@
+"""
+Compara a mochila da faixa (_best_row) com e sem NumPy.
+
+    python -m benchmarks.kernel                  # todos os cenários
+    python -m benchmarks.kernel -s many_unique -s many_unique_3200
+
+Para cada cenário mede a primeira faixa do pedido (o estado mais caro, com
+todas as peças) e o plano guloso inteiro, no laço em Python e nos vetores
+NumPy, e confere que as duas versões escolhem as mesmas faixas. Sem NumPy
+instalado só a versão em Python é medida.
+"""
+
+import argparse
+import sys
+import time
+from contextlib import contextmanager
+
+from cut_optimizer import engine
+from cut_optimizer.engine import _best_row, aggregate_pieces, pack_pieces, row_cache
+
+from .generators import SCENARIOS, make_order
+
+
+@contextmanager
+def without_numpy():
+    """Força o laço em Python durante o bloco"""
+    np, engine.np = engine.np, None
+    try:
+        yield
+    finally:
+        engine.np = np
+
+
+def _best_time(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        row_cache.clear()
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def _signature(rows):
+    """Faixas do plano comparáveis entre execuções (PieceType não define igualdade)"""
+    return [(row['height'], [(t.w, t.h, rotated, n) for t, rotated, n in row['runs']])
+            for row in rows]
+
+
+def measure(name, seed=1, repeat=5):
+    """{'python': (faixa, plano), 'numpy': (faixa, plano) ou None} em segundos"""
+    pieces, roll_width, roll_height = make_order(name, seed)
+    types, counts = aggregate_pieces(pieces)
+
+    def first_row():
+        return _best_row(types, list(counts), roll_width, roll_height)
+
+    def plan():
+        return _signature(pack_pieces(pieces, roll_width, roll_height, 'greedy'))
+
+    with without_numpy():
+        row_python, row = _best_time(first_row, repeat)
+        plan_python, rows = _best_time(plan, repeat)
+    results = {'roll_width': roll_width, 'python': (row_python, plan_python), 'numpy': None}
+    if engine.np is not None:
+        row_numpy, row_np = _best_time(first_row, repeat)
+        plan_numpy, rows_np = _best_time(plan, repeat)
+        if row_np != row or rows_np != rows:
+            raise AssertionError(f"{name}: NumPy e Python escolheram faixas diferentes")
+        results['numpy'] = (row_numpy, plan_numpy)
+    return results
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.kernel',
+                                     description="Mochila da faixa com e sem NumPy")
+    parser.add_argument('-s', '--scenario', action='append', choices=sorted(SCENARIOS),
+                        help="cenário a medir (repetível; padrão: todos)")
+    parser.add_argument('--seed', type=int, default=1, help="semente dos pedidos (padrão: 1)")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="execuções por medição; vale a mais rápida (padrão: 5)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if engine.np is None:
+        print("NumPy não instalado: só o laço em Python é medido", file=sys.stderr)
+    print(f"{'cenário':<20} {'rolo':>5}  {'faixa Python':>12} {'faixa NumPy':>12} {'×':>6}"
+          f"  {'plano Python':>12} {'plano NumPy':>12} {'×':>6}")
+    for name in args.scenario or list(SCENARIOS):
+        result = measure(name, args.seed, args.repeat)
+        row_python, plan_python = result['python']
+        line = f"{name:<20} {result['roll_width']:>5}  {row_python:>11.5f}s"
+        if result['numpy'] is None:
+            line += f" {'-':>12} {'-':>6}  {plan_python:>11.4f}s {'-':>12} {'-':>6}"
+        else:
+            row_numpy, plan_numpy = result['numpy']
+            line += (f" {row_numpy:>11.5f}s {row_python / row_numpy:>5.1f}×"
+                     f"  {plan_python:>11.4f}s {plan_numpy:>11.4f}s {plan_python / plan_numpy:>5.1f}×")
+        print(line, flush=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,181 @@
+"""
+Confere as faixas da mochila (_best_row) e exata (_best_row_exact) contra
+uma busca exaustiva.
+
+    python -m benchmarks.oracle                  # 3000 casos aleatórios
+    python -m benchmarks.oracle --cases 10000 --seed 2
+
+Cada caso sorteia poucos tipos de peça, com quantidades pequenas, em rolos
+estreitos, e enumera todas as faixas possíveis: a melhor é a de maior
+largura ocupada e, entre essas, a de menor perda de área acima das peças
+(com min_offcut, só as que ocupam a largura toda ou deixam ao menos
+min_offcut livre). A faixa da mochila precisa ter a mesma largura, sem
+passar da quantidade de nenhum tipo; a do branch-and-bound, a mesma largura
+e a mesma perda. O branch-and-bound roda também com um limite de poucos
+nós, para conferir que a troca pela faixa da mochila mantém a maior
+largura.
+
+Com NumPy instalado, confere também que a mochila vetorizada
+(_best_row_numpy) escolhe as mesmas faixas que o laço em Python, em casos
+maiores: muitos tipos, quantidades altas, rolos de até 3200 mm, limite de
+comprimento e sobra mínima.
+"""
+
+import argparse
+import sys
+from contextlib import contextmanager
+from random import Random
+
+from cut_optimizer import engine
+from cut_optimizer.engine import (PieceType, _best_row, _best_row_exact, _narrow_offcut,
+                                  _orientations)
+
+from .kernel import without_numpy
+
+FALLBACK_NODES = 5  # limite de nós que força a troca pela faixa da mochila
+
+SIZES = (100, 150, 200, 250, 300, 350, 500, 700)
+ROLL_WIDTHS = (300, 600, 1050)
+
+
+def brute_force(types, remaining, roll_width, min_offcut=0):
+    """(largura, perda) da melhor faixa, enumerando todas as quantidades"""
+    options = [(t, width, height) for t, piece_type in enumerate(types) if remaining[t] > 0
+               for _, width, height in _orientations(piece_type, roll_width)]
+    left = list(remaining)
+    best = (0, 0)
+
+    def visit(i, fill, height, area):
+        nonlocal best
+        if i == len(options):
+            waste = height * fill - area
+            if not _narrow_offcut(roll_width, fill, min_offcut) and \
+                    (fill > best[0] or (fill == best[0] and waste < best[1])):
+                best = (fill, waste)
+            return
+        t, width, option_height = options[i]
+        for k in range(min(left[t], (roll_width - fill) // width) + 1):
+            left[t] -= k
+            visit(i + 1, fill + k * width, max(height, option_height) if k else height,
+                  area + k * width * option_height)
+            left[t] += k
+
+    visit(0, 0, 0, 0)
+    if best == (0, 0) and min_offcut:
+        # Como em _best_row_exact(): sem sobra válida, a sobra estreita vira perda
+        return brute_force(types, remaining, roll_width)
+    return best
+
+
+def row_score(types, row):
+    """(largura, perda) de uma faixa (tipo, rotacionada, quantidade)"""
+    width = sum((types[t].h if rotated else types[t].w) * n for t, rotated, n in row)
+    height = max((types[t].w if rotated else types[t].h for t, rotated, _ in row), default=0)
+    return width, height * width - sum(types[t].w * types[t].h * n for t, _, n in row)
+
+
+def random_case(rng):
+    types = [PieceType(rng.choice(SIZES), rng.choice(SIZES)) for _ in range(rng.randint(1, 4))]
+    remaining = [rng.randint(1, 3) for _ in types]
+    return types, remaining, rng.choice(ROLL_WIDTHS), rng.choice((0, 0, 80))
+
+
+@contextmanager
+def node_limit(nodes):
+    """Limita o branch-and-bound a `nodes` nós durante o bloco"""
+    saved = engine.ROW_NODE_MIN, engine.ROW_NODE_RATIO
+    engine.ROW_NODE_MIN, engine.ROW_NODE_RATIO = nodes, float('inf')
+    try:
+        yield
+    finally:
+        engine.ROW_NODE_MIN, engine.ROW_NODE_RATIO = saved
+
+
+def _overused(remaining, row):
+    used = [0] * len(remaining)
+    for t, _, n in row:
+        used[t] += n
+    return any(n > left for n, left in zip(used, remaining))
+
+
+def check(cases=3000, seed=1):
+    """Lista dos casos em que a mochila ou a faixa exata diferem da busca exaustiva"""
+    rng = Random(seed)
+    failures = []
+    for _ in range(cases):
+        types, remaining, roll_width, min_offcut = random_case(rng)
+        expected = brute_force(types, remaining, roll_width, min_offcut)
+        case = {'types': [(t.w, t.h) for t in types], 'remaining': remaining,
+                'roll_width': roll_width, 'min_offcut': min_offcut, 'expected': expected}
+        row = _best_row(types, remaining, roll_width, min_offcut=min_offcut)
+        found = row_score(types, row)
+        if found[0] != expected[0] or _overused(remaining, row):
+            failures.append(dict(case, solver='_best_row', found=found))
+        found = row_score(types, _best_row_exact(types, remaining, roll_width,
+                                                 min_offcut=min_offcut))
+        if found != expected:
+            failures.append(dict(case, solver='_best_row_exact', found=found))
+        with node_limit(FALLBACK_NODES):
+            row = _best_row_exact(types, remaining, roll_width, min_offcut=min_offcut)
+        found = row_score(types, row)
+        if found[0] != expected[0] or _overused(remaining, row):
+            failures.append(dict(case, solver='_best_row_exact (limite de nós)', found=found))
+    return failures
+
+
+def random_kernel_case(rng):
+    types = [PieceType(rng.randint(20, 700), rng.randint(20, 700))
+             for _ in range(rng.randint(1, 12))]
+    remaining = [rng.choice((1, 2, 3, 5, 20, 500)) for _ in types]
+    return (types, remaining, rng.choice((300, 1050, 3200)), rng.choice((None, None, 400)),
+            rng.choice((0, 0, 80)))
+
+
+def check_kernel(cases=3000, seed=1):
+    """Lista dos casos em que a mochila NumPy e o laço em Python diferem"""
+    rng = Random(seed)
+    failures = []
+    for _ in range(cases):
+        types, remaining, roll_width, roll_height, min_offcut = random_kernel_case(rng)
+        found = _best_row(types, remaining, roll_width, roll_height, min_offcut)
+        with without_numpy():
+            expected = _best_row(types, remaining, roll_width, roll_height, min_offcut)
+        if found != expected:
+            failures.append({'types': [(t.w, t.h) for t in types], 'remaining': remaining,
+                             'roll_width': roll_width, 'roll_height': roll_height,
+                             'min_offcut': min_offcut, 'expected': expected, 'found': found})
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.oracle',
+                                     description="Mochila e faixa exata contra busca exaustiva")
+    parser.add_argument('--cases', type=int, default=3000, help="casos (padrão: 3000)")
+    parser.add_argument('--seed', type=int, default=1, help="semente (padrão: 1)")
+    args = parser.parse_args(argv)
+
+    failures = check(args.cases, args.seed)
+    for failure in failures[:10]:
+        print(failure, file=sys.stderr)
+    if failures:
+        print(f"❌ {len(failures)} de {args.cases} casos diferentes da busca exaustiva",
+              file=sys.stderr)
+    else:
+        print(f"✅ {args.cases} casos iguais à busca exaustiva", file=sys.stderr)
+
+    if engine.np is None:
+        print("NumPy não instalado: mochila vetorizada não conferida", file=sys.stderr)
+        return 1 if failures else 0
+    mismatches = check_kernel(args.cases, args.seed)
+    for mismatch in mismatches[:10]:
+        print(mismatch, file=sys.stderr)
+    if mismatches:
+        print(f"❌ {len(mismatches)} de {args.cases} casos com faixas diferentes entre "
+              f"NumPy e Python", file=sys.stderr)
+    else:
+        print(f"✅ {args.cases} casos com as mesmas faixas em NumPy e Python", file=sys.stderr)
+    return 1 if failures or mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,247 @@
+"""
+Mede o motor em cada cenário e compara com a linha de base gravada.
+
+    python -m benchmarks                      # roda e compara com baseline.json
+    python -m benchmarks --save               # grava uma nova linha de base
+    python -m benchmarks -s mixed -e greedy   # só alguns cenários/estratégias
+
+Para cada cenário × estratégia registra o tempo (a execução mais rápida
+entre ao menos --repeat execuções e --min-time segundos, divididos em
+--rounds rodadas, cada uma com todas as combinações em um processo novo), o
+aproveitamento, o comprimento, o número de faixas e o pico de memória. O
+pico é o aumento do RSS até o máximo durante uma execução em um processo
+novo (/proc no Linux, resource.getrusage no macOS): tracemalloc deixaria o
+motor dezenas de vezes mais lento. No Windows a memória não é medida. O
+cache de faixas é limpo antes de cada execução. Todas as combinações são
+medidas do mesmo jeito, na gravação e na comparação. Retorna 1 se houver
+regressão de tempo, memória ou aproveitamento além das tolerâncias.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+from cut_optimizer.engine import (ENGINE_VERSION, STRATEGIES, pack_pieces, plan_length,
+                                  plan_utilization, row_cache)
+
+from .generators import SCENARIOS, make_order
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# Tolerâncias da comparação com a linha de base
+TIME_TOLERANCE = 0.3         # até 30% mais lento
+MIN_TIME = 0.5               # segundos mínimos de execuções por medição
+ROUNDS = 5                   # rodadas de medição, cada uma em um processo novo
+MEMORY_TOLERANCE = 0.25      # até 25% mais memória
+MEMORY_FLOOR = 1024          # diferenças menores que 1 MB (em KB) são ruído
+UTILIZATION_TOLERANCE = 0.05  # pontos percentuais de aproveitamento
+
+
+def _proc_status_kb(field):
+    """Campo de /proc/self/status em KB (Linux), ou None"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith(field + ':'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def _max_rss_kb():
+    import resource
+    # ru_maxrss é em KB no Linux e em bytes no macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def _peak_job(name, seed, strategy):
+    """Aumento do RSS, em KB, até o pico ao planejar um cenário (roda em processo novo)"""
+    pieces, roll_width, roll_height = make_order(name, seed)
+    if _proc_status_kb('VmHWM') is not None:
+        # Linux: zera o pico (VmHWM) e mede a partir do RSS atual. ru_maxrss
+        # não serve aqui porque é herdado do processo pai no fork
+        try:
+            with open('/proc/self/clear_refs', 'w') as f:
+                f.write('5')
+        except OSError:
+            pass
+        before = _proc_status_kb('VmRSS')
+        pack_pieces(pieces, roll_width, roll_height, strategy)
+        return max(_proc_status_kb('VmHWM') - before, 0)
+    try:
+        before = _max_rss_kb()
+    except ImportError:  # Windows
+        return None
+    pack_pieces(pieces, roll_width, roll_height, strategy)
+    return max(_max_rss_kb() - before, 0)
+
+
+def peak_memory(name, seed, strategy):
+    """Pico de memória de um cenário, medido em um processo novo"""
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as executor:
+        return executor.submit(_peak_job, name, seed, strategy).result()
+
+
+def fastest(name, strategy, seed=1, repeat=5, min_time=MIN_TIME):
+    """
+    (segundos, faixas) da execução mais rápida de pack_pieces no cenário,
+    entre ao menos repeat execuções e min_time segundos
+    """
+    pieces, roll_width, roll_height = make_order(name, seed)
+    best = None
+    runs = total = 0
+    while runs < repeat or total < min_time:
+        row_cache.clear()
+        start = time.perf_counter()
+        rows = pack_pieces(pieces, roll_width, roll_height, strategy)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        runs += 1
+        total += elapsed
+    return best, rows
+
+
+def measure(name, strategy, seed=1, repeat=5, min_time=MIN_TIME):
+    """Métricas de pack_pieces no cenário, sem a memória (tempo de fastest())"""
+    seconds, rows = fastest(name, strategy, seed, repeat, min_time)
+    roll_width = SCENARIOS[name][1]
+    return {
+        'seconds': round(seconds, 6),
+        'utilization': round(plan_utilization(rows, roll_width), 2),
+        'length': plan_length(rows),
+        'rows': len(rows),
+    }
+
+
+def _round_job(keys, seed, repeat, min_time):
+    return {key: measure(*key.split('/'), seed, repeat, min_time) for key in keys}
+
+
+def run(scenarios, strategies, seed=1, repeat=5, emit=None, min_time=MIN_TIME,
+        rounds=ROUNDS):
+    """
+    Resultados {'cenário/estratégia': métricas}; emit(chave, métricas) a cada
+    medição completa.
+
+    Cada rodada mede todas as combinações em um processo novo, com repeat e
+    min_time divididos entre as rodadas, e vale o menor tempo de cada
+    combinação. O tempo de uma mesma combinação varia de um processo para
+    outro (disposição da memória) e com fases lentas da máquina; com várias
+    rodadas, nenhuma das duas coisas pega todas as execuções de uma
+    combinação.
+    """
+    keys = [f"{name}/{strategy}" for name in scenarios for strategy in strategies]
+    repeat, min_time = -(-repeat // rounds), min_time / rounds
+    results = {}
+    for i in range(rounds):
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as executor:
+            measured = executor.submit(_round_job, keys, seed, repeat, min_time).result()
+        print(f"rodada {i + 1}/{rounds}", file=sys.stderr, flush=True)
+        for key, metrics in measured.items():
+            if key in results:
+                results[key]['seconds'] = min(results[key]['seconds'], metrics['seconds'])
+            else:
+                results[key] = metrics
+    for key in keys:
+        name, strategy = key.split('/')
+        results[key]['peak_kb'] = peak_memory(name, seed, strategy)
+        if emit:
+            emit(key, results[key])
+    return results
+
+
+def compare(results, baseline, time_tolerance=TIME_TOLERANCE):
+    """Lista de regressões (texto) em relação às medições da linha de base"""
+    regressions = []
+    for key, new in results.items():
+        old = baseline.get(key)
+        if old is None:
+            continue
+        if new['seconds'] > old['seconds'] * (1 + time_tolerance):
+            regressions.append(f"{key}: tempo {old['seconds']:.4f}s → {new['seconds']:.4f}s")
+        if (new['peak_kb'] is not None and old['peak_kb'] is not None
+                and new['peak_kb'] - old['peak_kb'] > MEMORY_FLOOR
+                and new['peak_kb'] > old['peak_kb'] * (1 + MEMORY_TOLERANCE)):
+            regressions.append(f"{key}: memória {old['peak_kb']} KB → {new['peak_kb']} KB")
+        if new['utilization'] < old['utilization'] - UTILIZATION_TOLERANCE:
+            regressions.append(f"{key}: aproveitamento {old['utilization']:.2f}% → "
+                               f"{new['utilization']:.2f}%")
+    return regressions
+
+
+def _line(key, metrics, old=None):
+    line = (f"{key:<32} {metrics['seconds']:>9.4f}s {metrics['utilization']:>7.2f}% "
+            f"{metrics['rows']:>6} faixas {metrics['peak_kb'] if metrics['peak_kb'] is not None else '-':>9} KB")
+    if old:
+        ratio = metrics['seconds'] / old['seconds'] if old['seconds'] else 1.0
+        line += (f"   (base {old['seconds']:.4f}s ×{ratio:.2f}, "
+                 f"{metrics['utilization'] - old['utilization']:+.2f} pp)")
+    return line
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description="Benchmarks do motor de corte")
+    parser.add_argument('-s', '--scenario', action='append', choices=sorted(SCENARIOS),
+                        help="cenário a medir (repetível; padrão: todos)")
+    parser.add_argument('-e', '--strategy', action='append', choices=sorted(STRATEGIES),
+                        help="estratégia a medir (repetível; padrão: todas)")
+    parser.add_argument('--seed', type=int, default=1, help="semente dos pedidos (padrão: 1)")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="execuções por medição; vale a mais rápida (padrão: 5)")
+    parser.add_argument('--min-time', type=float, default=MIN_TIME,
+                        help=f"segundos mínimos de execuções por medição (padrão: {MIN_TIME})")
+    parser.add_argument('--rounds', type=int, default=ROUNDS,
+                        help=f"rodadas em processos novos; vale o menor tempo (padrão: {ROUNDS})")
+    parser.add_argument('--time-tolerance', type=float, default=TIME_TOLERANCE,
+                        help=f"aumento de tempo aceito, em fração (padrão: {TIME_TOLERANCE})")
+    parser.add_argument('--baseline', default=BASELINE, help="arquivo da linha de base")
+    parser.add_argument('--save', action='store_true',
+                        help="grava os resultados como nova linha de base")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    scenarios = args.scenario or list(SCENARIOS)
+    strategies = args.strategy or list(STRATEGIES)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as f:
+            stored = json.load(f)
+        if stored.get('seed') == args.seed:
+            baseline = stored['results']
+
+    results = run(scenarios, strategies, args.seed, args.repeat,
+                  emit=lambda key, metrics: print(_line(key, metrics, baseline.get(key)),
+                                                  flush=True),
+                  min_time=args.min_time, rounds=args.rounds)
+
+    if args.save:
+        # Mantém as medições de cenários que não foram rodados agora
+        merged = dict(baseline, **results)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({'engine_version': ENGINE_VERSION, 'seed': args.seed,
+                       'python': platform.python_version(), 'machine': platform.machine(),
+                       'results': dict(sorted(merged.items()))}, f, indent=2)
+            f.write('\n')
+        print(f"Linha de base gravada em {args.baseline}", file=sys.stderr)
+        return 0
+
+    if not baseline:
+        print("Sem linha de base para comparar (use --save)", file=sys.stderr)
+        return 0
+    regressions = compare(results, baseline, args.time_tolerance)
+    for regression in regressions:
+        print(f"❌ {regression}", file=sys.stderr)
+    if not regressions:
+        print("✅ Nenhuma regressão em relação à linha de base", file=sys.stderr)
+    return 1 if regressions else 0
@@ -0,0 +1,74 @@
+"""
+Otimizador de Cortes de Mantas PRI.
+
+    from cut_optimizer import pack_pieces
+    rows = pack_pieces([{'w': 800, 'h': 500, 'qty': 2}], roll_width=1050)
+
+O pacote expõe o motor (cut_optimizer.engine), que não importa Tkinter.
+A interface gráfica fica em cut_optimizer.gui e é aberta por
+`python -m cut_optimizer`.
+"""
+
+from .engine import (
+    ROLL_WIDTH,
+    ENGINE_VERSION,
+    TIME_BUDGET,
+    STRATEGIES,
+    PieceType,
+    CutSettings,
+    NO_CUTS,
+    RowCache,
+    PlanCancelled,
+    row_cache,
+    aggregate_pieces,
+    assign_rolls,
+    pack_pieces,
+    pack_pieces_cached,
+    pack_pieces_parallel,
+    fill_remnants,
+    search_variants,
+    validate_pieces,
+    plan_length,
+    plan_utilization,
+    format_measurement,
+    format_area_m2,
+    create_visual_row,
+    iter_visual_row,
+    create_pieces_summary,
+    create_visual_summary,
+    create_report,
+    iter_report,
+    iter_remnant_report,
+    write_report,
+)
+
+# Exportação, impressão, cache e estoque dependem de módulos pesados da
+# biblioteca padrão (sqlite3, subprocess, xml, ...); são carregados no
+# primeiro acesso, para que importar o motor continue barato
+_LAZY = {
+    'write_plan_pdf': 'pdf',
+    'PlanCache': 'plan_cache',
+    'build_plan': 'plan_format',
+    'plan_rows': 'plan_format',
+    'write_json': 'plan_format',
+    'encode_binary': 'plan_format',
+    'decode_binary': 'plan_format',
+    'print_report': 'printing',
+    'RemnantStore': 'remnants',
+    'PlanStats': 'profiling',
+    'profile': 'profiling',
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
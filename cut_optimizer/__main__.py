@@ -0,0 +1,19 @@
+"""
+python -m cut_optimizer            abre a interface gráfica
+python -m cut_optimizer plan ...   planejamento em lote (veja cut_optimizer.cli)
+python -m cut_optimizer remnants   estoque de sobras (veja cut_optimizer.remnants)
+"""
+
+import multiprocessing
+import sys
+
+if __name__ == '__main__':
+    # Necessário para a busca paralela em executáveis congelados (PyInstaller)
+    multiprocessing.freeze_support()
+    
+    if len(sys.argv) > 1:
+        from cut_optimizer.cli import main
+        sys.exit(main())
+    
+    from cut_optimizer.gui import main
+    main()
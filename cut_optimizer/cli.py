@@ -0,0 +1,416 @@
+"""
+Planejamento em lote pela linha de comando.
+
+    python -m cut_optimizer plan pedidos/*.csv --roll 1050x50000 --out planos/
+    python -m cut_optimizer plan pedidos/ --kerf 3 --trim 10 --min-offcut 80
+    python -m cut_optimizer plan pedidos/ --remnants
+    python -m cut_optimizer remnants --min-width 200 --max-width 400
+
+Cada pedido (CSV ou JSON) vira um plano em --out (JSON, binário compacto, relatório
+em texto e/ou PDF, conforme --format) e uma linha JSON de resumo na saída
+padrão; mensagens para pessoas vão para a saída de erro. Os pedidos são
+processados em paralelo, um processo por pedido. Com --remnants, cada pedido
+é cortado primeiro nas sobras do estoque (cut_optimizer/remnants.py) e as
+sobras do seu plano voltam ao estoque; o comando remnants lista e edita o estoque.
+"""
+
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from . import profiling
+from .engine import (ROLL_WIDTH, TIME_BUDGET, STRATEGIES, CutSettings, iter_remnant_report,
+                     pack_pieces, pack_pieces_cached, validate_pieces, write_report)
+from .pdf import write_plan_pdf
+from .plan_format import build_plan, write_json, encode_binary
+from .remnants import RemnantStore, write_uses_json
+
+# Códigos de saída
+EXIT_OK = 0       # todos os pedidos planejados
+EXIT_FAILED = 1   # ao menos um pedido falhou
+EXIT_USAGE = 2    # argumentos inválidos ou nenhum pedido encontrado
+
+ORDER_EXTENSIONS = ('.csv', '.json')
+
+# Formatos de saída e extensão dos arquivos gerados
+OUTPUT_FORMATS = {'json': '.plan.json', 'bin': '.cutplan', 'txt': '.txt', 'pdf': '.pdf'}
+
+# Formatos do perfil (--profile) e extensão dos arquivos gerados
+PROFILE_FORMATS = {'json': '.profile.json', 'cprofile': '.prof'}
+
+# Nomes de coluna aceitos nos arquivos de pedido
+COLUMNS = {
+    'w': ('w', 'largura', 'width'),
+    'h': ('h', 'altura', 'height'),
+    'qty': ('qty', 'quantidade', 'quantity', 'qtd'),
+}
+
+
+def parse_roll(text):
+    """Converte '1050x50000' (largura × comprimento do rolo, em mm) em (1050, 50000)"""
+    try:
+        parts = [int(p) for p in text.lower().replace('×', 'x').split('x')]
+    except ValueError:
+        parts = []
+    if len(parts) not in (1, 2) or min(parts) <= 0:
+        raise argparse.ArgumentTypeError(f"rolo inválido: {text!r} (use LARGURAxCOMPRIMENTO)")
+    return parts[0], parts[1] if len(parts) == 2 else None
+
+
+def _piece(record, where):
+    """Lê uma peça de um dicionário com nomes de coluna flexíveis"""
+    fields = {k.strip().lower(): v for k, v in record.items() if k}
+    piece = {}
+    for key, names in COLUMNS.items():
+        value = next((fields[n] for n in names if n in fields), None)
+        try:
+            piece[key] = int(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"{where}: valor inválido para '{key}': {value!r}") from None
+        if piece[key] <= 0:
+            raise ValueError(f"{where}: '{key}' deve ser maior que zero")
+    return piece
+
+
+def read_order(path):
+    """
+    Lê as peças de um pedido.
+
+    CSV: cabeçalho com w,h,qty (ou largura,altura,quantidade), uma peça por linha.
+    JSON: lista de peças ou objeto {"pieces": [...]}.
+    """
+    if path.lower().endswith('.json'):
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            data = data.get('pieces', [])
+        return [_piece(p, f"{path} peça {i}") for i, p in enumerate(data, 1)]
+
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        return [_piece(row, f"{path} linha {line}")
+                for line, row in enumerate(csv.DictReader(f), 2)
+                if any((v or '').strip() for v in row.values())]
+
+
+def find_orders(patterns):
+    """
+    Expande padrões e diretórios em uma lista ordenada de arquivos de pedido.
+    Levanta ValueError se algum padrão não corresponder a nenhum arquivo.
+    """
+    paths = []
+    unmatched = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = [os.path.join(pattern, name) for name in os.listdir(pattern)]
+        elif os.path.exists(pattern):
+            matches = [pattern]
+        else:
+            # O shell do Windows não expande curingas
+            matches = glob.glob(pattern)
+            if not matches:
+                unmatched.append(pattern)
+        paths.extend(p for p in matches
+                     if p.lower().endswith(ORDER_EXTENSIONS) or p == pattern)
+    if unmatched:
+        raise ValueError(f"Nenhum arquivo corresponde a: {', '.join(unmatched)}")
+    return sorted(set(paths))
+
+
+def output_names(paths):
+    """
+    Nome base dos arquivos de saída de cada pedido em --out: o nome do
+    arquivo sem extensão; se dois pedidos tiverem o mesmo (a.csv e a.json),
+    o nome com extensão; se ainda coincidirem (pedidos de mesmo nome em
+    pastas diferentes), um sufixo -2, -3, ... na ordem dos pedidos
+    """
+    stems = [os.path.splitext(os.path.basename(path))[0] for path in paths]
+    names = {}
+    taken = set()
+    for path, stem in zip(paths, stems):
+        name = stem if stems.count(stem) == 1 else os.path.basename(path)
+        unique, n = name, 1
+        while unique in taken:
+            n += 1
+            unique = f"{name}-{n}"
+        taken.add(unique)
+        names[path] = unique
+    return names
+
+
+def parse_remnant(text):
+    """Converte '300x2400' (largura × comprimento da sobra, em mm) em (300, 2400)"""
+    width, length = parse_roll(text)
+    if length is None:
+        raise argparse.ArgumentTypeError(f"sobra inválida: {text!r} (use LARGURAxCOMPRIMENTO)")
+    return width, length
+
+
+def non_negative_mm(text):
+    """Medida em mm maior ou igual a zero (lâmina, refilo, sobra mínima)"""
+    try:
+        value = int(text)
+    except ValueError:
+        value = -1
+    if value < 0:
+        raise argparse.ArgumentTypeError(f"medida inválida: {text!r} (use mm inteiros, >= 0)")
+    return value
+
+
+def parse_formats(text):
+    """Converte 'json,txt' na lista de formatos de saída"""
+    formats = [f.strip() for f in text.split(',') if f.strip()]
+    unknown = [f for f in formats if f not in OUTPUT_FORMATS]
+    if not formats or unknown:
+        raise argparse.ArgumentTypeError(
+            f"formato inválido: {text!r} (use {', '.join(OUTPUT_FORMATS)})")
+    return formats
+
+
+def write_outputs(pieces, rows, roll_width, roll_height, base, formats, cuts=None, uses=()):
+    """
+    Grava o plano nos formatos pedidos; o relatório em texto só é montado
+    se 'txt' estiver entre eles. As peças cortadas de sobras do estoque
+    (uses, ver RemnantStore.reserve()) vão para <base>.remnants.json e para
+    o fim do relatório em texto. Retorna (plano estruturado, arquivos).
+    """
+    plan = build_plan(rows, roll_width, roll_height, cuts)
+    outputs = []
+    for fmt in formats:
+        output = base + OUTPUT_FORMATS[fmt]
+        if fmt == 'json':
+            with open(output, 'w', encoding='utf-8') as f:
+                write_json(plan, f)
+        elif fmt == 'bin':
+            with open(output, 'wb') as f:
+                f.write(encode_binary(plan))
+        elif fmt == 'pdf':
+            with open(output, 'wb') as f:
+                write_plan_pdf(f, plan, pieces)
+        else:
+            with open(output, 'w', encoding='utf-8') as f:
+                write_report(f, pieces, rows, roll_width, roll_height, cuts=cuts)
+                if uses:
+                    f.writelines(iter_remnant_report(uses, cuts))
+        outputs.append(output)
+    if uses:
+        output = base + '.remnants.json'
+        with open(output, 'w', encoding='utf-8') as f:
+            write_uses_json(uses, f, cuts)
+        outputs.append(output)
+    return plan, outputs
+
+
+def _plan_and_write(pieces, roll_width, roll_height, base, strategy, time_budget, formats,
+                    profile, cuts, uses, summary):
+    """Calcula e grava o plano de plan_order(); retorna (faixas, plano estruturado, arquivos)"""
+    if profile:
+        with profiling.profile(cprofile=profile == 'cprofile') as stats:
+            rows = pack_pieces(pieces, roll_width, roll_height, strategy,
+                               time_budget=time_budget, cuts=cuts)
+            plan, outputs = write_outputs(pieces, rows, roll_width, roll_height,
+                                          base, formats, cuts, uses)
+        summary['profile'] = base + PROFILE_FORMATS[profile]
+        if profile == 'cprofile':
+            stats.dump_cprofile(summary['profile'])
+        else:
+            with open(summary['profile'], 'w', encoding='utf-8') as f:
+                stats.write_json(f)
+    else:
+        rows = pack_pieces_cached(pieces, roll_width, roll_height, strategy,
+                                  time_budget=time_budget, cuts=cuts)
+        plan, outputs = write_outputs(pieces, rows, roll_width, roll_height,
+                                      base, formats, cuts, uses)
+    return rows, plan, outputs
+
+
+def plan_order(path, roll_width, roll_height, out_dir, strategy, time_budget,
+               formats=('json',), profile=None, cuts=None, remnants=False, name=None):
+    """
+    Planeja um pedido e grava o resultado em out_dir, com o nome base name
+    (padrão: o nome do arquivo sem extensão; ver output_names()),
+    descontando as perdas de corte de cuts (CutSettings), se houver.
+    Com remnants, corta primeiro o que puder nas sobras do estoque e guarda
+    as sobras do plano; o plano e o relatório cobrem só o rolo novo. Se o
+    pedido falhar depois da reserva, as sobras reservadas voltam ao estoque.
+    Com profile ('json' ou 'cprofile') grava também o perfil do motor; nesse
+    caso o cache de planos é ignorado, para que o plano seja de fato calculado.
+    Retorna o resumo do pedido (nunca levanta exceção).
+    """
+    start = time.perf_counter()
+    summary = {'order': path, 'status': 'ok'}
+    try:
+        pieces = read_order(path)
+        if not pieces:
+            raise ValueError("nenhuma peça no pedido")
+        validate_pieces(pieces, roll_width, roll_height, cuts)
+        base = os.path.join(out_dir, name or os.path.splitext(os.path.basename(path))[0])
+        uses = []
+        if remnants:
+            store = RemnantStore()
+            uses, pieces = store.reserve(pieces, cuts)
+
+        try:
+            rows, plan, outputs = _plan_and_write(pieces, roll_width, roll_height, base,
+                                                  strategy, time_budget, formats, profile,
+                                                  cuts, uses, summary)
+            if remnants:
+                added = store.add_plan(rows, roll_width, cuts, source=path)
+        except BaseException:
+            if uses:
+                store.release(uses)
+            raise
+
+        summary.update({
+            'pieces': plan['pieces'],
+            'rows': len(rows),
+            'rolls': plan['rolls'],
+            'length_mm': plan['length'],
+            'utilization': plan['utilization'],
+            'outputs': outputs,
+        })
+        if remnants:
+            summary.update({
+                'remnants_used': len(uses),
+                'remnant_pieces': sum(len(r['items']) for use in uses for r in use['rows']),
+                'remnants_added': added,
+            })
+    except Exception as e:
+        summary.update({'status': 'error', 'error': str(e)})
+    summary['seconds'] = round(time.perf_counter() - start, 3)
+    return summary
+
+
+def plan_orders(paths, roll_width, roll_height, out_dir, strategy='greedy',
+                time_budget=TIME_BUDGET, jobs=None, emit=None, formats=('json',),
+                profile=None, cuts=None, remnants=False):
+    """
+    Planeja vários pedidos em paralelo (jobs processos; 1 = no processo atual).
+    Pedidos de mesmo nome não sobrescrevem as saídas uns dos outros (ver
+    output_names()). emit(resumo) é chamado para cada pedido assim que ele
+    termina. Retorna a lista de resumos na ordem dos pedidos.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    args = (roll_width, roll_height, out_dir, strategy, time_budget, formats, profile, cuts,
+            remnants)
+    names = output_names(paths)
+    summaries = {}
+
+    if jobs == 1 or len(paths) == 1:
+        for path in paths:
+            summaries[path] = plan_order(path, *args, name=names[path])
+            if emit:
+                emit(summaries[path])
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [executor.submit(plan_order, path, *args, name=names[path])
+                       for path in paths]
+            for future in as_completed(futures):
+                summary = future.result()
+                summaries[summary['order']] = summary
+                if emit:
+                    emit(summary)
+
+    return [summaries[path] for path in paths]
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='cut-optimizer',
+                                     description="Otimizador de Cortes de Mantas PRI")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    plan = commands.add_parser('plan', help="planeja pedidos em lote (CSV/JSON)")
+    plan.add_argument('orders', nargs='+', help="arquivos, curingas ou diretórios de pedidos")
+    plan.add_argument('--roll', type=parse_roll, default=(ROLL_WIDTH, None),
+                      help="rolo LARGURAxCOMPRIMENTO em mm (padrão: 1050, sem limite)")
+    plan.add_argument('--out', default='plans', help="diretório dos planos (padrão: plans)")
+    plan.add_argument('--format', type=parse_formats, default=['json'],
+                      help="formatos de saída separados por vírgula: json, bin, txt, pdf "
+                           "(padrão: json)")
+    plan.add_argument('--strategy', choices=sorted(STRATEGIES), default='greedy')
+    plan.add_argument('--kerf', type=non_negative_mm, default=0,
+                      help="largura da lâmina em mm, entre peças e entre faixas (padrão: 0)")
+    plan.add_argument('--trim', type=non_negative_mm, default=0,
+                      help="refilo de cada borda do rolo em mm (padrão: 0)")
+    plan.add_argument('--min-offcut', type=non_negative_mm, default=0,
+                      help="menor sobra de largura aproveitável em mm; faixas não deixam "
+                           "sobras menores (padrão: 0 = qualquer sobra)")
+    plan.add_argument('--time-budget', type=float, default=TIME_BUDGET,
+                      help=f"segundos por pedido (padrão: {TIME_BUDGET}; 0 = sem prazo)")
+    plan.add_argument('--jobs', type=int, default=None,
+                      help="processos em paralelo (padrão: núcleos da máquina)")
+    plan.add_argument('--profile', nargs='?', const='json', choices=sorted(PROFILE_FORMATS),
+                      help="grava o perfil do motor de cada pedido: json (tempos e "
+                           "contadores por faixa, padrão) ou cprofile (.prof); ignora o "
+                           "cache de planos")
+    plan.add_argument('--remnants', action='store_true',
+                      help="corta primeiro nas sobras do estoque e guarda as sobras do "
+                           "plano (arquivo em CUT_OPTIMIZER_REMNANTS)")
+
+    remnants = commands.add_parser('remnants', help="lista ou edita o estoque de sobras")
+    remnants.add_argument('--min-width', type=non_negative_mm, default=0)
+    remnants.add_argument('--max-width', type=non_negative_mm)
+    remnants.add_argument('--min-length', type=non_negative_mm, default=0)
+    remnants.add_argument('--max-length', type=non_negative_mm)
+    remnants.add_argument('--add', type=parse_remnant, action='append', default=[],
+                          metavar='LARGURAxCOMPRIMENTO', help="guarda uma sobra (repetível)")
+    remnants.add_argument('--remove', type=int, action='append', default=[], metavar='N',
+                          help="tira a sobra número N do estoque (repetível)")
+    remnants.add_argument('--clear', action='store_true', help="esvazia o estoque")
+    return parser
+
+
+def manage_remnants(args):
+    """
+    Comando remnants: aplica --clear, --remove e --add, nesta ordem, e lista
+    as sobras nas faixas de medidas pedidas, uma linha JSON por sobra
+    """
+    store = RemnantStore()
+    if args.clear:
+        store.clear()
+    missing = [n for n in args.remove if not store.remove(n)]
+    for width, length in args.add:
+        store.add(width, length, source='cli')
+    for remnant in store.find(args.min_width, args.min_length, args.max_width, args.max_length):
+        print(json.dumps(remnant, ensure_ascii=False))
+    print(f"♻️ {store.count()} sobras no estoque", file=sys.stderr)
+    if missing:
+        print(f"⚠️ Sobras não encontradas: {', '.join(map(str, missing))}", file=sys.stderr)
+        return EXIT_FAILED
+    return EXIT_OK
+
+
+def main(argv=None):
+    """Ponto de entrada da linha de comando; retorna o código de saída"""
+    args = build_parser().parse_args(argv)
+    if args.command == 'remnants':
+        return manage_remnants(args)
+
+    try:
+        paths = find_orders(args.orders)
+    except ValueError as e:
+        print(f"⚠️ {e}", file=sys.stderr)
+        return EXIT_USAGE
+    if not paths:
+        print("⚠️ Nenhum pedido encontrado", file=sys.stderr)
+        return EXIT_USAGE
+
+    roll_width, roll_height = args.roll
+    time_budget = args.time_budget or None
+
+    def emit(summary):
+        print(json.dumps(summary, ensure_ascii=False), flush=True)
+
+    cuts = CutSettings(args.kerf, args.trim, args.min_offcut)
+    summaries = plan_orders(paths, roll_width, roll_height, args.out, args.strategy,
+                            time_budget, args.jobs, emit, args.format, args.profile,
+                            cuts or None, args.remnants)
+
+    failed = sum(1 for s in summaries if s['status'] != 'ok')
+    print(f"✅ {len(summaries) - failed} pedidos planejados, ❌ {failed} com erro",
+          file=sys.stderr)
+    return EXIT_FAILED if failed else EXIT_OK
@@ -0,0 +1,1903 @@
+"""
+Motor de otimização de cortes: empacotamento das peças em faixas e rolos,
+cache de planos e formatação dos relatórios.
+
+Não depende de Tkinter nem de tela; pode ser importado por scripts em lote,
+pela CLI e pelos processos da busca paralela.
+"""
+
+import time
+from array import array
+from math import gcd
+from collections import OrderedDict
+from random import Random
+
+from . import profiling
+
+# multiprocessing, concurrent.futures e o cache de planos (sqlite3) são
+# importados só por pack_pieces_parallel() e pack_pieces_cached(): importar
+# o motor fica em poucos milissegundos para scripts e processos de trabalho
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: acelera as mochilas das faixas e dos padrões
+    np = None
+
+ROLL_WIDTH = 1050  # largura fixa do rolo em mm
+# Entra na chave do cache de planos: incrementar em toda mudança que possa alterar as
+# faixas devolvidas (2.1: estratégia 'exact' e perdas de corte; 2.2: desempate da 'exact')
+ENGINE_VERSION = "2.4"
+TIME_BUDGET = 2.0  # segundos para otimizar um plano a partir da interface
+_EPS = 1e-9  # tolerância numérica do simplex
+ROW_NODE_RATIO = 64  # células da mochila por nó do branch-and-bound (limite de nós da busca)
+ROW_NODE_MIN = 1000  # limite de nós do branch-and-bound em faixas pequenas
+NUMPY_ROUNDS = 4  # até quantas peças por faixa a mochila NumPy avança peça a peça
+NUMPY_UNREACHED = 1 << 40  # número de peças das larguras não alcançadas na mochila NumPy
+
+
+class PieceType:
+    """Dimensões originais de um tipo de peça, compartilhadas por todas as unidades iguais"""
+    __slots__ = ('w', 'h')
+
+    def __init__(self, w, h):
+        self.w = w
+        self.h = h
+
+    def __repr__(self):
+        return f"PieceType({self.w}, {self.h})"
+
+
+class CutSettings:
+    """
+    Perdas do processo de corte, em mm.
+
+    kerf: largura consumida pela lâmina em cada corte, entre peças vizinhas
+        de uma faixa e entre faixas vizinhas de um rolo
+    trim: refilo de cada borda lateral do rolo
+    min_offcut: menor sobra de largura aproveitável, medida depois do corte
+        que a separa; a faixa vai de refilo a refilo ou deixa ao menos esta
+        sobra (0 = qualquer sobra)
+    """
+    __slots__ = ('kerf', 'trim', 'min_offcut')
+
+    def __init__(self, kerf=0, trim=0, min_offcut=0):
+        for name, value in (('kerf', kerf), ('trim', trim), ('min_offcut', min_offcut)):
+            if value < 0:
+                raise ValueError(f"{name} não pode ser negativo: {value}")
+        self.kerf = kerf
+        self.trim = trim
+        self.min_offcut = min_offcut
+
+    def __bool__(self):
+        return bool(self.kerf or self.trim or self.min_offcut)
+
+    def __repr__(self):
+        return f"CutSettings(kerf={self.kerf}, trim={self.trim}, min_offcut={self.min_offcut})"
+
+    def to_dict(self):
+        return {'kerf': self.kerf, 'trim': self.trim, 'min_offcut': self.min_offcut}
+
+    def usable_width(self, roll_width):
+        """Largura do rolo depois do refilo das duas bordas"""
+        return roll_width - 2 * self.trim
+
+    def positions(self, items):
+        """Posição x (a partir da borda do rolo) de cada peça da faixa"""
+        positions = []
+        x = self.trim
+        for item in items:
+            positions.append(x)
+            x += item['w'] + self.kerf
+        return positions
+
+    def free_width(self, row, roll_width):
+        """Largura livre depois da última peça, até o refilo"""
+        return (self.usable_width(roll_width) - row['used_width']
+                - self.kerf * (len(row['items']) - 1))
+
+    def offcut(self, row, roll_width):
+        """Sobra da faixa depois do corte que a separa da última peça"""
+        free = self.free_width(row, roll_width)
+        return max(free - self.kerf, 0) if free > 0 else 0
+
+
+NO_CUTS = CutSettings()  # corte ideal: sem lâmina, refilo nem sobra mínima
+
+
+def aggregate_pieces(pieces):
+    """
+    Agrupa peças de mesmas dimensões em um vetor compacto de quantidades.
+
+    Returns:
+        (tipos, quantidades): lista de PieceType e array com a quantidade de cada tipo
+    """
+    index = {}
+    types = []
+    counts = array('q')
+    for p in pieces:
+        key = (p['w'], p['h'])
+        if key not in index:
+            index[key] = len(types)
+            types.append(PieceType(p['w'], p['h']))
+            counts.append(0)
+        counts[index[key]] += p['qty']
+    return types, counts
+
+
+def _orientations(piece_type, roll_width, roll_height=None):
+    """
+    Orientações viáveis de um tipo de peça: (rotacionada, largura, altura).
+    A largura precisa caber no rolo e a altura no comprimento do rolo.
+    """
+    w, h = piece_type.w, piece_type.h
+    for rotated, width, height in ((False, w, h), (True, h, w)):
+        if rotated and w == h:
+            continue
+        if width > roll_width or (roll_height is not None and height > roll_height):
+            continue
+        yield rotated, width, height
+
+
+def _narrow_offcut(roll_width, fill, min_offcut):
+    """A faixa deixaria uma sobra estreita demais para aproveitar (entre 0 e min_offcut)"""
+    return 0 < roll_width - fill < min_offcut < roll_width
+
+
+def _best_row(types, remaining, roll_width, roll_height=None, min_offcut=0):
+    """
+    Escolhe a composição da próxima faixa como uma mochila limitada.
+
+    Para cada tipo de peça marca as larguras alcançáveis de 0 até
+    roll_width numa única passada crescente, com as duas orientações juntas:
+    count[c] é o menor número de peças do tipo que leva de uma largura já
+    alcançada pelos tipos anteriores até c, count[c] = min(count[c - w],
+    count[c - h]) + 1, e c só é alcançada se esse número couber na
+    quantidade restante. Assim a largura é a máxima mesmo quando só uma
+    mistura de orientações a alcança; a faixa guarda só a largura de cada
+    tipo, dividida entre as orientações por _split_spans(). Custo:
+    O(tipos × roll_width) por faixa. Com NumPy a marcação é vetorizada
+    (_best_row_numpy()), com o mesmo resultado.
+
+    Com min_offcut, a faixa ocupa a largura toda ou deixa ao menos min_offcut
+    livre. Se a maior largura alcançável não é a largura toda, nenhuma faixa
+    é, então a resposta é a maior largura alcançável até roll_width -
+    min_offcut, lida na mesma tabela. Se nenhuma peça couber nela, a sobra
+    estreita fica como perda.
+
+    Returns:
+        Lista de (tipo, rotacionada, quantidade) com a maior largura ocupada.
+    """
+    if np is not None:
+        return _best_row_numpy(types, remaining, roll_width, roll_height, min_offcut)
+
+    reach = bytearray(roll_width + 1)
+    reach[0] = 1
+    # origin[c] = tipo de peça que alcançou c pela primeira vez; back[c] = largura anterior
+    origin = [None] * (roll_width + 1)
+    back = [0] * (roll_width + 1)
+    candidates = 0
+
+    for t, piece_type in enumerate(types):
+        qty = remaining[t]
+        if qty <= 0:
+            continue
+        widths = [width for _, width, _ in _orientations(piece_type, roll_width, roll_height)]
+        if not widths:
+            continue
+        candidates += sum(roll_width + 1 - width for width in widths)
+        # count[c] = menor número de peças deste tipo para chegar a c; as larguras
+        # alcançadas pelos tipos anteriores valem 0 e as não alcançadas não são lidas
+        count = [0] * (roll_width + 1)
+        first = widths[0]
+        second = widths[-1]  # igual à primeira se o tipo tiver uma orientação só
+        for c in range(min(first, second), roll_width + 1):
+            if reach[c]:
+                continue
+            best = qty
+            prev = c - first
+            if prev >= 0 and reach[prev]:
+                best, came = count[prev], prev
+            prev = c - second
+            if prev >= 0 and reach[prev] and count[prev] < best:
+                best, came = count[prev], prev
+            if best < qty:
+                count[c] = best + 1
+                reach[c] = 1
+                origin[c] = t
+                back[c] = came
+        if reach[roll_width]:  # preenchimento perfeito
+            break
+
+    stats = profiling.current()
+    if stats is not None:
+        stats.count('candidates', candidates)
+        # Tipos que nem chegaram a ser avaliados por causa do preenchimento perfeito
+        stats.count('pruned', sum(1 for n in remaining[t + 1:] if n > 0) if types else 0)
+
+    best_fill = roll_width
+    while best_fill > 0 and not reach[best_fill]:
+        best_fill -= 1
+    if _narrow_offcut(roll_width, best_fill, min_offcut):
+        c = roll_width - min_offcut
+        while c > 0 and not reach[c]:
+            c -= 1
+        best_fill = c or best_fill
+
+    spans = {}  # largura ocupada por tipo
+    c = best_fill
+    while c > 0:
+        spans[origin[c]] = spans.get(origin[c], 0) + c - back[c]
+        c = back[c]
+
+    return _split_spans(types, remaining, spans, roll_width, roll_height)
+
+
+def _split_spans(types, remaining, spans, roll_width, roll_height=None):
+    """
+    Divide a largura ocupada por cada tipo entre as duas orientações.
+
+    A tabela da mochila só garante que a largura de cada tipo é alcançável
+    com a quantidade restante; qualquer divisão com a mesma largura serve.
+    Fica a de uma orientação só (a original antes da rotacionada), que não
+    mistura alturas do mesmo tipo na faixa; se nenhuma servir, a que usa
+    mais peças na orientação original.
+    """
+    row = []
+    for t, span in sorted(spans.items()):
+        qty = remaining[t]
+        orientations = [(rotated, width) for rotated, width, _
+                        in _orientations(types[t], roll_width, roll_height)]
+        split = None
+        for rotated, width in orientations:
+            if span % width == 0 and span // width <= qty:
+                split = [(rotated, span // width)]
+                break
+        if split is None:
+            (_, first), (_, second) = orientations
+            for n in range(min(qty, span // first), -1, -1):
+                rest = span - n * first
+                if rest % second == 0 and n + rest // second <= qty:
+                    split = [(False, n), (True, rest // second)]
+                    break
+        row.extend((t, rotated, n) for rotated, n in split if n)
+    return row
+
+
+def _column_min(values, width):
+    """
+    min(values[c - k·width] + k) para k = 0, 1, ...: as larguras c, c + w,
+    c + 2w, ... formam uma coluna de uma matriz com w colunas, e o mínimo é
+    acumulado coluna abaixo
+    """
+    size = values.size
+    steps = -(-size // width)
+    grid = np.full(steps * width, NUMPY_UNREACHED, dtype=np.int64)
+    grid[:size] = values
+    row = np.arange(steps, dtype=np.int64)[:, None]
+    grid = np.minimum.accumulate(grid.reshape(steps, width) - row, axis=0) + row
+    return grid.ravel()[:size]
+
+
+def _best_row_numpy(types, remaining, roll_width, roll_height=None, min_offcut=0):
+    """
+    _best_row() com as larguras alcançáveis em vetores NumPy.
+
+    O menor número de peças do tipo até cada largura (count[c] no laço em
+    Python) sai de _column_min(): primeiro na largura da orientação
+    original, a partir das larguras já alcançadas, e depois na da
+    rotacionada. Cada orientação custa algumas operações vetorizadas sobre
+    0..roll_width, sem laço em Python por largura. Tipos com poucas peças
+    por faixa avançam uma peça por rodada, só a partir das larguras novas.
+    Nos dois casos a largura anterior é a da orientação original sempre que
+    ela leva ao mesmo número de peças, como no laço em Python, então a faixa
+    escolhida é a mesma, inclusive nos empates.
+    """
+    size = roll_width + 1
+    reach = np.zeros(size, dtype=bool)
+    reach[0] = True
+    # Tipo e largura anterior da primeira vez que cada largura foi alcançada
+    origin = np.zeros(size, dtype=np.int32)
+    back = np.zeros(size, dtype=np.int32)
+    candidates = 0
+
+    for t, piece_type in enumerate(types):
+        qty = remaining[t]
+        if qty <= 0:
+            continue
+        widths = [width for _, width, _ in _orientations(piece_type, roll_width, roll_height)]
+        if not widths:
+            continue
+        candidates += sum(size - width for width in widths)
+        if min(qty, roll_width // min(widths)) <= NUMPY_ROUNDS:
+            # Poucas peças por faixa: uma peça por rodada, a partir das larguras novas
+            frontier = np.flatnonzero(reach)
+            for _ in range(qty):
+                added = []
+                for width in widths:
+                    cells = frontier + width
+                    cells = cells[cells < size]
+                    cells = cells[~reach[cells]]
+                    reach[cells] = True
+                    origin[cells] = t
+                    back[cells] = cells - width
+                    added.append(cells)
+                frontier = np.concatenate(added)
+                if not frontier.size:
+                    break
+        else:
+            count = np.where(reach, 0, NUMPY_UNREACHED)
+            for width in widths:
+                count = _column_min(count, width)
+            cells = np.flatnonzero(~reach & (count <= qty))
+            first = widths[0]
+            before = np.maximum(cells - first, 0)
+            back[cells] = np.where((cells >= first) & (count[before] == count[cells] - 1),
+                                   cells - first, cells - widths[-1])
+            reach[cells] = True
+            origin[cells] = t
+        if reach[roll_width]:  # preenchimento perfeito
+            break
+
+    stats = profiling.current()
+    if stats is not None:
+        stats.count('candidates', candidates)
+        stats.count('pruned', sum(1 for n in remaining[t + 1:] if n > 0) if types else 0)
+
+    filled = np.flatnonzero(reach)
+    c = int(filled[-1])
+    if _narrow_offcut(roll_width, c, min_offcut):
+        c = int(filled[filled <= roll_width - min_offcut][-1]) or c
+
+    spans = {}  # largura ocupada por tipo
+    while c > 0:
+        t, prev = int(origin[c]), int(back[c])
+        spans[t] = spans.get(t, 0) + c - prev
+        c = prev
+
+    return _split_spans(types, remaining, spans, roll_width, roll_height)
+
+
+def _best_row_exact(types, remaining, roll_width, roll_height=None, min_offcut=0):
+    """
+    Faixa de maior largura ocupada (como _best_row()) por branch-and-bound;
+    entre as de mesma largura, a de menor perda de área acima das peças
+    (altura da faixa × largura ocupada − área das peças).
+
+    As orientações são percorridas da mais larga para a mais estreita e, em
+    cada uma, escolhe-se quantas peças usar (da maior quantidade possível
+    para zero); peças iguais são uma única escolha de quantidade, então as
+    permutações delas nunca são geradas, e a quantidade nunca passa da
+    folga. Um ramo é podado assim que não pode superar a melhor faixa já
+    encontrada: a folga, arredondada para o MDC das larguras que faltam, e
+    a capacidade delas limitam o ganho, e a perda só cresce (cada peça
+    nova soma a sua perda ou aumenta a altura de todas). Orientações
+    de mesma largura e mesma altura (um tipo e outro rotacionado com as
+    mesmas medidas) só são usadas se a anterior estiver esgotada: trocar
+    peças entre elas daria a mesma faixa. Com alturas diferentes a troca
+    muda a altura da faixa, então não vale.
+
+    Sem limite de peças por faixa. Se a busca passar de um número de nós
+    proporcional ao custo da mochila, a faixa encontrada é comparada com a
+    da mochila (_best_row()) e fica a mais larga; na mesma largura, a de
+    menor perda. O tempo fica na ordem do da mochila, e a largura continua a
+    maior possível, que a mochila sempre alcança.
+    Com min_offcut, só faixas que ocupam a largura toda ou deixam ao menos
+    min_offcut livre entram como solução (ver _best_row()). O resultado é
+    conferido contra uma busca exaustiva por `python -m benchmarks.oracle`.
+
+    Returns:
+        Lista de (tipo, rotacionada, quantidade), como _best_row().
+    """
+    # (largura, tipo, rotacionada, altura), da mais larga para a mais estreita; na mesma
+    # largura, da mais baixa para a mais alta, então medidas iguais ficam vizinhas
+    options = []
+    for t, piece_type in enumerate(types):
+        if remaining[t] > 0:
+            for rotated, width, height in _orientations(piece_type, roll_width, roll_height):
+                options.append((width, t, rotated, height))
+    options.sort(key=lambda option: (-option[0], option[3]))
+    n = len(options)
+    if not n:
+        return []
+
+    # Limites do sufixo i..n: capacidade total e MDC das larguras
+    capacity = [0] * (n + 1)
+    step = [0] * (n + 1)
+    for i in range(n - 1, -1, -1):
+        width, t, _, _ = options[i]
+        capacity[i] = capacity[i + 1] + width * min(remaining[t], roll_width // width)
+        step[i] = gcd(step[i + 1], width)
+    narrowest = options[-1][0]
+    cells = sum(roll_width + 1 - option[0] for option in options)
+    node_limit = max(ROW_NODE_MIN, cells // ROW_NODE_RATIO)
+
+    left = {option[1]: remaining[option[1]] for option in options}
+    chosen = [0] * n    # quantidade escolhida em cada nível
+    most = [0] * n      # maior quantidade possível em cada nível
+    heights = [0] * (n + 1)  # altura da faixa até cada nível
+    areas = [0] * (n + 1)    # área das peças até cada nível
+    best_fill = best_waste = 0
+    best = []
+    nodes = pruned = 0
+    level = fill = 0
+    entering = True
+    exhausted = False
+    while True:
+        if entering:
+            nodes += 1
+            height = heights[level]
+            waste = height * fill - areas[level]
+            if (fill > best_fill or (fill == best_fill and waste < best_waste)) \
+                    and not _narrow_offcut(roll_width, fill, min_offcut):
+                best_fill, best_waste, best = fill, waste, chosen[:level]
+                if fill == roll_width and not waste:  # não há faixa melhor
+                    break
+            if nodes > node_limit:
+                exhausted = True
+                break
+            free = roll_width - fill
+            if level < n and free >= narrowest:
+                bound = fill + min(free // step[level] * step[level], capacity[level])
+                if bound > best_fill or (bound == best_fill and waste < best_waste):
+                    width, t, _, option_height = options[level]
+                    k = min(left[t], free // width)
+                    if level and options[level - 1][0] == width \
+                            and options[level - 1][3] == option_height \
+                            and chosen[level - 1] < most[level - 1]:
+                        k = 0
+                    most[level] = chosen[level] = k
+                    left[t] -= k
+                    fill += k * width
+                    heights[level + 1] = max(height, option_height) if k else height
+                    areas[level + 1] = areas[level] + k * width * option_height
+                    level += 1
+                    continue
+                pruned += 1
+        # Volta ao nível anterior e tenta uma peça a menos
+        level -= 1
+        if level < 0:
+            break
+        width, t, _, option_height = options[level]
+        if chosen[level] > 0:
+            chosen[level] -= 1
+            left[t] += 1
+            fill -= width
+            areas[level + 1] -= width * option_height
+            if not chosen[level]:
+                heights[level + 1] = heights[level]
+            level += 1
+            entering = True
+        else:
+            entering = False
+
+    stats = profiling.current()
+    if stats is not None:
+        stats.count('candidates', nodes)
+        stats.count('pruned', pruned)
+        if exhausted:
+            stats.count('exact_fallbacks')
+    if exhausted:
+        # Busca interrompida: fica a mais larga entre a faixa encontrada e a da
+        # mochila; na mesma largura, a de menor perda
+        fallback = _best_row(types, remaining, roll_width, roll_height, min_offcut)
+        fallback_fill = _row_width(types, fallback)
+        fallback_height = max((types[t].w if rotated else types[t].h
+                               for t, rotated, _ in fallback), default=0)
+        fallback_waste = fallback_height * fallback_fill - sum(
+            types[t].w * types[t].h * k for t, _, k in fallback)
+        if fallback_fill > best_fill or \
+                (fallback_fill == best_fill and fallback_waste < best_waste):
+            return fallback
+    if not best_fill and min_offcut:
+        # Nenhuma faixa deixa uma sobra aproveitável: a sobra estreita fica como perda
+        return _best_row_exact(types, remaining, roll_width, roll_height)
+
+    counts = {}
+    for (_, t, rotated, _), k in zip(options, best):
+        if k:
+            counts[(t, rotated)] = counts.get((t, rotated), 0) + k
+    return [(t, rotated, k) for (t, rotated), k in sorted(counts.items())]
+
+
+def _row_runs(types, best_row):
+    """
+    Converte a solução da mochila em runs (tipo, rotacionada, quantidade) e
+    na lista de itens da faixa. Cada item é um único dicionário por tipo e
+    orientação, referenciado quantas vezes a peça aparece na faixa.
+    """
+    runs = []
+    items = []
+    for t, rotated, n in best_row:
+        piece_type = types[t]
+        orig_w, orig_h = piece_type.w, piece_type.h
+        w, h = (orig_h, orig_w) if rotated else (orig_w, orig_h)
+        runs.append((piece_type, rotated, n))
+        items.extend([{'w': w, 'h': h, 'orig_w': orig_w, 'orig_h': orig_h}] * n)
+    return runs, items
+
+
+def _row_width(types, pattern):
+    """Largura ocupada pelas peças de uma composição (tipo, rotacionada, quantidade)"""
+    return sum((types[t].h if rotated else types[t].w) * n for t, rotated, n in pattern)
+
+
+def _max_repeat(pattern, remaining):
+    """Quantas vezes a faixa pode ser repetida com as peças restantes"""
+    per_type = {}
+    for t, _, n in pattern:
+        per_type[t] = per_type.get(t, 0) + n
+    return min(remaining[t] // n for t, n in per_type.items())
+
+
+def _append_rows(rows, types, best_row, repeat):
+    """Adiciona `repeat` faixas iguais (que compartilham runs e items) ao plano"""
+    runs, items = _row_runs(types, best_row)
+    used_width = sum(item['w'] for item in items)
+    max_height = max(item['h'] for item in items)
+    
+    for _ in range(repeat):
+        rows.append({
+            'runs': runs,
+            'items': items,
+            'used_width': used_width,
+            'height': max_height
+        })
+
+
+# Ordens em que os tipos de peça são oferecidos à mochila (desempate).
+# Além destas, 'random' embaralha os tipos com uma semente fixa.
+ORDERINGS = {
+    'width': lambda entry: (-entry[0], -entry[1]),             # mais largas primeiro
+    'height': lambda entry: (-entry[1], -entry[0]),            # mais altas primeiro
+    'area': lambda entry: (-entry[0] * entry[1], entry[0]),    # maiores áreas primeiro
+}
+
+
+class RowCache:
+    """
+    Cache LRU de soluções de faixa, com contadores de acertos e falhas.
+
+    A chave é o multiconjunto (largura, altura, quantidade) das peças
+    restantes mais as dimensões do rolo. A quantidade é limitada ao máximo
+    que cabe em uma faixa, então estados que só diferem em peças que não
+    caberiam na faixa compartilham a mesma solução.
+    """
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def solve(self, best_row_fn, types, remaining, roll_width, roll_height=None,
+              order=None, seed=0, min_offcut=0):
+        """
+        Retorna best_row_fn(...) do cache ou calcula e armazena a solução.
+        order/seed escolhem a ordem em que os tipos são oferecidos à mochila
+        (ver ORDERINGS), que decide os empates entre faixas equivalentes.
+        min_offcut é repassado a best_row_fn (ver _best_row()).
+        """
+        state = sorted(
+            (piece_type.w, piece_type.h,
+             min(remaining[t], roll_width // min(piece_type.w, piece_type.h)), t)
+            for t, piece_type in enumerate(types) if remaining[t] > 0)
+        if order == 'random':
+            Random(seed).shuffle(state)
+        elif order is not None:
+            state.sort(key=ORDERINGS[order])
+        # A ordem do estado faz parte da chave: a solução depende só da chave
+        key = (best_row_fn.__name__, roll_width, roll_height, min_offcut,
+               tuple(entry[:3] for entry in state))
+        
+        solution = self._entries.get(key)
+        if solution is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        else:
+            self.misses += 1
+            canon_types = [PieceType(w, h) for w, h, _, _ in state]
+            canon_counts = [n for _, _, n, _ in state]
+            solution = tuple(best_row_fn(canon_types, canon_counts, roll_width, roll_height,
+                                         min_offcut))
+            if self.maxsize > 0:
+                self._entries[key] = solution
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        
+        return [(state[i][3], rotated, n) for i, rotated, n in solution]
+
+    def info(self):
+        """Resumo de efetividade do cache"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Cache compartilhado por todas as chamadas de pack_pieces no processo
+row_cache = RowCache()
+
+
+def _pack_greedy(types, remaining, roll_width, roll_height, rows, should_stop=None,
+                 order=None, seed=0, best_row_fn=None, min_offcut=0):
+    """
+    Gulosa: melhor faixa por largura, repetida enquanto houver peças.
+    Se should_stop() indicar prazo esgotado ou cancelamento, para e deixa as
+    peças restantes em remaining. min_offcut: ver RowCache.solve().
+    """
+    best_row_fn = best_row_fn or _best_row
+    stats = profiling.current()
+    while any(remaining):
+        if should_stop is not None and should_stop():
+            break
+        if stats is not None:
+            start, hits, mark = time.perf_counter(), row_cache.hits, stats.mark()
+        # Busca melhor combinação para esta faixa
+        best_row = row_cache.solve(best_row_fn, types, remaining, roll_width, roll_height,
+                                   order, seed, min_offcut)
+        
+        if not best_row:
+            break
+        
+        # A mesma faixa continua ótima enquanto houver peças para repeti-la
+        repeat = _max_repeat(best_row, remaining)
+        for t, _, n in best_row:
+            remaining[t] -= n * repeat
+        
+        _append_rows(rows, types, best_row, repeat)
+        if stats is not None:
+            cached = row_cache.hits > hits
+            stats.count('row_cache_hits' if cached else 'row_cache_misses')
+            stats.row(best_row_fn.__name__, time.perf_counter() - start, cached, mark,
+                      repeat, sum(n for _, _, n in best_row))
+
+
+def _solve_master(patterns, costs, demand):
+    """
+    Resolve o problema mestre relaxado min Σ custo·x, A·x ≥ demanda, x ≥ 0.
+
+    O simplex é aplicado ao dual (max demanda·y, Aᵀ·y ≤ custo, y ≥ 0), que já
+    começa viável pela base das folgas. As multiplicidades x das faixas são
+    lidas na linha objetivo, nas colunas das folgas.
+
+    Returns:
+        (y, x): valores duais por tipo e multiplicidade (fracionária) por padrão
+    """
+    n = len(demand)
+    m = len(patterns)
+    width = n + m
+    tableau = []
+    for j, pattern in enumerate(patterns):
+        line = [0.0] * (width + 1)
+        for t, _, count in pattern:
+            line[t] += count
+        line[n + j] = 1.0
+        line[width] = float(costs[j])
+        tableau.append(line)
+    objective = [-float(d) for d in demand] + [0.0] * (m + 1)
+    basis = [n + j for j in range(m)]
+
+    for _ in range(50 * width):
+        col = min(range(width), key=objective.__getitem__)
+        if objective[col] >= -_EPS:
+            break
+        pivot = None
+        best_ratio = None
+        for r in range(m):
+            a = tableau[r][col]
+            if a > _EPS:
+                ratio = tableau[r][width] / a
+                if best_ratio is None or ratio < best_ratio - _EPS:
+                    pivot, best_ratio = r, ratio
+        if pivot is None:  # ilimitado: algum tipo não aparece em nenhum padrão
+            break
+        line = tableau[pivot]
+        a = line[col]
+        for k in range(width + 1):
+            line[k] /= a
+        for other in tableau:
+            if other is not line:
+                f = other[col]
+                if f:
+                    for k in range(width + 1):
+                        other[k] -= f * line[k]
+        f = objective[col]
+        for k in range(width + 1):
+            objective[k] -= f * line[k]
+        basis[pivot] = col
+
+    y = [0.0] * n
+    for r, col in enumerate(basis):
+        if col < n:
+            y[col] = tableau[r][width]
+    x = [max(0.0, objective[n + j]) for j in range(m)]
+    return y, x
+
+
+def _knapsack_by_height(types, counts, values, roll_width, roll_height=None, min_offcut=0):
+    """
+    Mochila por classe de altura: para cada altura de faixa H, escolhe as
+    orientações de altura ≤ H que maximizam Σ valor/H. As orientações entram
+    em ordem crescente de altura, então uma única passada avalia todas as
+    classes. A passada termina assim que o valor total disponível dividido
+    pela próxima altura não supera a melhor razão encontrada. Usa NumPy
+    quando disponível.
+
+    Args:
+        counts: Quantidade disponível de cada tipo
+        values: Valor de uma peça de cada tipo
+        min_offcut: Se a melhor faixa deixar uma sobra entre 0 e min_offcut,
+            usa a melhor classe com roll_width - min_offcut de largura, lida
+            na mesma tabela (a poda continua pela largura toda)
+
+    Returns:
+        (razão, padrão) da melhor classe, com padrão em (tipo, rotacionada,
+        quantidade), ou None se nenhuma peça tiver valor.
+    """
+    # Itens 0/1 por divisão binária da quantidade de cada orientação
+    items = []
+    for t, piece_type in enumerate(types):
+        if counts[t] <= 0 or values[t] <= _EPS:
+            continue
+        for rotated, width, height in _orientations(piece_type, roll_width, roll_height):
+            cap = min(counts[t], roll_width // width)
+            chunk = 1
+            while cap > 0:
+                k = min(chunk, cap)
+                items.append((height, t, rotated, k, width * k, values[t] * k))
+                cap -= k
+                chunk *= 2
+    items.sort(key=lambda item: item[0])
+    total_value = sum(item[5] for item in items)
+
+    if np is not None:
+        dp = np.zeros(roll_width + 1)
+    else:
+        dp = [0.0] * (roll_width + 1)
+    keep = []
+    best = None  # (valor/altura, índice final)
+    narrow = roll_width - min_offcut if 0 < min_offcut < roll_width else None
+    best_narrow = None  # o mesmo, com a sobra mínima livre
+    stats = profiling.current()
+
+    for i, (height, t, rotated, k, width, value) in enumerate(items):
+        if stats is not None:
+            stats.count('candidates', roll_width + 1 - width)
+        if np is not None:
+            candidate = dp[:roll_width + 1 - width] + value
+            take = candidate > dp[width:] + _EPS
+            dp[width:] = np.where(take, candidate, dp[width:])
+            mask = np.zeros(roll_width + 1, dtype=bool)
+            mask[width:] = take
+            keep.append(mask)
+        else:
+            mask = bytearray(roll_width + 1)
+            for c in range(roll_width, width - 1, -1):
+                candidate = dp[c - width] + value
+                if candidate > dp[c] + _EPS:
+                    dp[c] = candidate
+                    mask[c] = 1
+            keep.append(mask)
+
+        # Fim de uma classe de altura: avalia a faixa desta altura
+        if i + 1 == len(items) or items[i + 1][0] != height:
+            ratio = float(dp[roll_width]) / height
+            if best is None or ratio > best[0] + _EPS:
+                best = (ratio, i)
+            if narrow is not None:
+                ratio = float(dp[narrow]) / height
+                if best_narrow is None or ratio > best_narrow[0] + _EPS:
+                    best_narrow = (ratio, i)
+            # Poda: nenhuma classe mais alta pode superar a melhor razão
+            if i + 1 < len(items) and total_value / items[i + 1][0] <= best[0] + _EPS:
+                if stats is not None:
+                    stats.count('pruned', len(items) - i - 1)
+                break
+
+    if best is None:
+        return None
+
+    def pattern(last, c):
+        """Composição da classe que termina no item last, com largura até c"""
+        used = {}
+        fill = 0
+        for i in range(last, -1, -1):
+            if keep[i][c]:
+                _, t, rotated, k, width, _ = items[i]
+                used[(t, rotated)] = used.get((t, rotated), 0) + k
+                c -= width
+                fill += width
+        return fill, tuple((t, rotated, n) for (t, rotated), n in sorted(used.items()))
+
+    fill, found = pattern(best[1], roll_width)
+    if _narrow_offcut(roll_width, fill, min_offcut) and best_narrow[0] > _EPS:
+        return best_narrow[0], pattern(best_narrow[1], narrow)[1]
+    return best[0], found
+
+
+def _price_pattern(types, demand, duals, roll_width, roll_height=None, min_offcut=0):
+    """
+    Subproblema de precificação: a faixa de altura H com Σ y·peças > H.
+
+    Returns:
+        Melhor padrão (tipo, rotacionada, quantidade) com custo reduzido negativo,
+        ou None quando o mestre já é ótimo.
+    """
+    found = _knapsack_by_height(types, demand, duals, roll_width, roll_height, min_offcut)
+    if found is None or found[0] <= 1 + _EPS:
+        return None
+    return found[1]
+
+
+def _best_row_area(types, remaining, roll_width, roll_height=None, min_offcut=0):
+    """
+    Escolhe a faixa com maior aproveitamento de área (Σ área das peças /
+    largura × altura da faixa), em vez da maior largura ocupada.
+
+    Returns:
+        Lista de (tipo, rotacionada, quantidade), como _best_row().
+    """
+    areas = [piece_type.w * piece_type.h for piece_type in types]
+    found = _knapsack_by_height(types, remaining, areas, roll_width, roll_height, min_offcut)
+    if found is None:
+        return []
+    
+    # As duas orientações de um tipo são limitadas separadamente na mochila;
+    # corta o excesso para respeitar a quantidade restante do tipo
+    left = {}
+    best_row = []
+    for t, rotated, n in found[1]:
+        n = min(n, left.setdefault(t, remaining[t]))
+        left[t] -= n
+        if n > 0:
+            best_row.append((t, rotated, n))
+    return best_row
+
+
+def _pattern_height(types, pattern):
+    """Altura da faixa de um padrão: a maior altura entre as peças posicionadas"""
+    return max(types[t].w if rotated else types[t].h for t, rotated, _ in pattern)
+
+
+def _pack_patterns(types, remaining, roll_width, roll_height, rows, should_stop=None,
+                   order=None, seed=0, min_offcut=0, max_patterns=200):
+    """
+    Geração de colunas no estilo Gilmore–Gomory.
+
+    Cada padrão é a composição de uma faixa e custa a altura da faixa. O mestre
+    relaxado decide quantas vezes repetir cada padrão; a precificação gera
+    novos padrões até não haver custo reduzido negativo. As multiplicidades
+    são arredondadas para baixo e a demanda residual vai para a gulosa, assim
+    como a dos padrões que deixariam uma sobra menor que min_offcut.
+    Quando should_stop() indica o fim do prazo, a geração de padrões para e
+    o plano é montado com os padrões já conhecidos.
+    """
+    demand = list(remaining)
+    patterns = []
+    for t, piece_type in enumerate(types):
+        if demand[t] <= 0:
+            continue
+        for rotated, width, _ in _orientations(piece_type, roll_width, roll_height):
+            k = min(demand[t], roll_width // width)
+            if _narrow_offcut(roll_width, k * width, min_offcut):
+                k = min(k, (roll_width - min_offcut) // width) or k
+            patterns.append(((t, rotated, k),))
+    # Tipos que não cabem no rolo ficam fora do mestre
+    covered = {t for pattern in patterns for t, _, _ in pattern}
+    demand = [d if t in covered else 0 for t, d in enumerate(demand)]
+    if not patterns:
+        return
+
+    known = set(patterns)
+    costs = [_pattern_height(types, pattern) for pattern in patterns]
+    stats = profiling.current()
+    while True:
+        if stats is not None:
+            start = time.perf_counter()
+        duals, multiplicity = _solve_master(patterns, costs, demand)
+        if stats is not None:
+            stats.add_phase('master', time.perf_counter() - start)
+            stats.count('master_solves')
+        if len(patterns) >= max_patterns:
+            break
+        if should_stop is not None and should_stop():
+            break
+        if stats is not None:
+            start = time.perf_counter()
+        pattern = _price_pattern(types, demand, duals, roll_width, roll_height, min_offcut)
+        if stats is not None:
+            stats.add_phase('pricing', time.perf_counter() - start)
+            stats.count('patterns_priced')
+        if pattern is None or pattern in known:
+            break
+        known.add(pattern)
+        patterns.append(pattern)
+        costs.append(_pattern_height(types, pattern))
+
+    # Padrão × multiplicidade inteira, sem produzir além da demanda
+    by_multiplicity = sorted(range(len(patterns)), key=lambda j: -multiplicity[j])
+    for j in by_multiplicity:
+        pattern = patterns[j]
+        repeat = int(multiplicity[j] + _EPS)
+        repeat = min(repeat, _max_repeat(pattern, remaining))
+        if repeat <= 0 or _narrow_offcut(roll_width, _row_width(types, pattern), min_offcut):
+            continue
+        for t, _, n in pattern:
+            remaining[t] -= n * repeat
+        _append_rows(rows, types, pattern, repeat)
+        if stats is not None:
+            stats.count('pattern_rows', repeat)
+
+    _pack_greedy(types, remaining, roll_width, roll_height, rows, should_stop, order, seed,
+                 min_offcut=min_offcut)
+
+
+def assign_rolls(rows, roll_height):
+    """
+    Distribui as faixas em rolos de comprimento roll_height (bin packing).
+
+    First-fit-decreasing pelas alturas das faixas, seguido de uma passada de
+    melhoria que tenta esvaziar o rolo menos ocupado movendo suas faixas para
+    as sobras dos outros. Os rolos ficam ordenados do mais cheio ao mais vazio,
+    então a sobra de comprimento fica concentrada no último rolo.
+
+    Returns:
+        As faixas agrupadas por rolo, cada uma com row['roll'] (1, 2, ...)
+    """
+    if not rows:
+        return rows
+    
+    order = sorted(range(len(rows)), key=lambda i: -rows[i]['height'])
+    min_height = rows[order[-1]]['height']
+    free = []     # comprimento livre de cada rolo
+    bins = []     # índices das faixas de cada rolo
+    open_bins = []  # rolos que ainda comportam a menor faixa
+    
+    for i in order:
+        height = rows[i]['height']
+        if height > roll_height:
+            raise ValueError(f"Faixa de {height}mm não cabe no rolo de {roll_height}mm")
+        for b in open_bins:
+            if height <= free[b]:
+                break
+        else:
+            b = len(bins)
+            bins.append([])
+            free.append(roll_height)
+            open_bins.append(b)
+        bins[b].append(i)
+        free[b] -= height
+        if free[b] < min_height:
+            open_bins.remove(b)
+    
+    # Melhoria: tenta esvaziar o rolo menos ocupado
+    while len(bins) > 1:
+        lightest = max(range(len(bins)), key=free.__getitem__)
+        trial = free[:]
+        moves = []
+        for i in sorted(bins[lightest], key=lambda i: -rows[i]['height']):
+            height = rows[i]['height']
+            target = None
+            for b in range(len(bins)):
+                if b != lightest and height <= trial[b] and (
+                        target is None or trial[b] < trial[target]):
+                    target = b
+            if target is None:
+                break
+            trial[target] -= height
+            moves.append((i, target))
+        else:
+            for i, target in moves:
+                bins[target].append(i)
+            del bins[lightest]
+            del trial[lightest]
+            free = trial
+            continue
+        break
+    
+    packed = []
+    for number, b in enumerate(sorted(range(len(bins)), key=free.__getitem__), 1):
+        for i in sorted(bins[b]):
+            rows[i]['roll'] = number
+            packed.append(rows[i])
+    return packed
+
+
+def _pack_area(types, remaining, roll_width, roll_height, rows, should_stop=None,
+               order=None, seed=0, min_offcut=0):
+    """Gulosa por aproveitamento de área de cada faixa"""
+    _pack_greedy(types, remaining, roll_width, roll_height, rows, should_stop, order, seed,
+                 _best_row_area, min_offcut)
+
+
+def _pack_exact(types, remaining, roll_width, roll_height, rows, should_stop=None,
+                order=None, seed=0, min_offcut=0):
+    """Gulosa por largura com branch-and-bound: entre as faixas mais largas, a mais baixa"""
+    _pack_greedy(types, remaining, roll_width, roll_height, rows, should_stop, order, seed,
+                 _best_row_exact, min_offcut)
+
+
+STRATEGIES = {
+    'greedy': _pack_greedy,
+    'area': _pack_area,
+    'patterns': _pack_patterns,
+    'exact': _pack_exact,
+}
+
+
+def plan_length(rows, kerf=0):
+    """
+    Comprimento de rolo consumido pelas faixas: soma das alturas e, com
+    kerf, um corte entre faixas vizinhas do mesmo rolo
+    """
+    length = sum(r['height'] for r in rows)
+    if kerf and rows:
+        length += kerf * (len(rows) - len({r.get('roll', 1) for r in rows}))
+    return length
+
+
+def plan_utilization(rows, roll_width):
+    """Percentual da área de rolo consumida que vira peça"""
+    total_area = roll_width * plan_length(rows)
+    used_area = sum(item['w'] * item['h'] for r in rows for item in r['items'])
+    return used_area / total_area * 100 if total_area else 0
+
+
+def _pool_runs(rows):
+    """Soma as peças de um conjunto de faixas em (tipos, quantidades)"""
+    index = {}
+    types = []
+    counts = array('q')
+    for row in rows:
+        for piece_type, _, n in row['runs']:
+            if piece_type not in index:
+                index[piece_type] = len(types)
+                types.append(piece_type)
+                counts.append(0)
+            counts[index[piece_type]] += n
+    return types, counts
+
+
+def _report(progress, stage, rows, roll_width):
+    if progress is not None:
+        progress({'stage': stage, 'rows': len(rows),
+                  'utilization': plan_utilization(rows, roll_width),
+                  'length': plan_length(rows)})
+
+
+def _pack_anytime(types, remaining, roll_width, roll_height, strategy,
+                  expired, cancelled, progress, order=None, seed=0, min_offcut=0):
+    """
+    Otimização com prazo: entrega um plano guloso imediatamente e o melhora
+    até o prazo, primeiro com as outras estratégias e depois reempacotando
+    as piores faixas (busca local). Retorna o melhor plano encontrado.
+    """
+    def report(stage, rows):
+        _report(progress, stage, rows, roll_width)
+
+    best = []
+    remaining_after = array('q', remaining)  # peças que não cabem no rolo
+    _pack_greedy(types, remaining_after, roll_width, roll_height, best, cancelled,
+                 order, seed, min_offcut=min_offcut)
+    if cancelled():
+        return best
+    report('greedy', best)
+
+    # Planos interrompidos pelo prazo são completados pela gulosa
+    for name in [strategy] + [s for s in ('patterns', 'area') if s != strategy]:
+        if name == 'greedy' or expired():
+            continue
+        rows = []
+        counts = array('q', remaining)
+        STRATEGIES[name](types, counts, roll_width, roll_height, rows, expired, order, seed,
+                         min_offcut=min_offcut)
+        _pack_greedy(types, counts, roll_width, roll_height, rows, cancelled, order, seed,
+                     min_offcut=min_offcut)
+        if not cancelled() and plan_length(rows) < plan_length(best):
+            best = rows
+            report(name, best)
+
+    # Busca local: reempacota as k piores faixas (k = 2, 4, 8, ...)
+    k = 2
+    while k <= len(best) and not expired():
+        # Ordena uma cópia: o plano já relatado em progress não muda de ordem
+        ranked = sorted(best, key=lambda r: sum(i['w'] * i['h'] for i in r['items']) / r['height'])
+        worst, kept = ranked[:k], ranked[k:]
+        improved = False
+        for name in ('area', 'patterns', 'greedy'):
+            if expired():
+                break
+            pool_types, pool_counts = _pool_runs(worst)
+            rows = []
+            STRATEGIES[name](pool_types, pool_counts, roll_width, roll_height, rows,
+                             expired, order, seed, min_offcut=min_offcut)
+            _pack_greedy(pool_types, pool_counts, roll_width, roll_height, rows,
+                         cancelled, order, seed, min_offcut=min_offcut)
+            if not cancelled() and plan_length(rows) < plan_length(worst):
+                best = kept + rows
+                report('local', best)
+                improved = True
+                break
+        k = 2 if improved else k * 2
+
+    return best
+
+
+def validate_pieces(pieces, roll_width, roll_height=None, cuts=None):
+    """
+    Levanta ValueError se alguma peça não couber no rolo em nenhuma
+    orientação; com cuts, na largura que sobra depois do refilo
+    """
+    if cuts and cuts.trim:
+        usable = cuts.usable_width(roll_width)
+        if usable <= 0:
+            raise ValueError(f"Refilo de {cuts.trim}mm por borda não deixa largura útil no "
+                             f"rolo de {roll_width}mm!")
+        for piece in pieces:
+            if piece['w'] > usable and piece['h'] > usable:
+                raise ValueError(f"Peça {piece['w']}×{piece['h']}mm não cabe nos {usable}mm "
+                                 f"úteis do rolo de {roll_width}mm, nem mesmo rotacionada!")
+        roll_width = usable
+    for piece in pieces:
+        if piece['w'] > roll_width and piece['h'] > roll_width:
+            raise ValueError(f"Peça {piece['w']}×{piece['h']}mm não cabe no rolo de "
+                             f"{roll_width}mm de largura, nem mesmo rotacionada!")
+        if roll_height and not ((piece['w'] <= roll_width and piece['h'] <= roll_height) or
+                                (piece['h'] <= roll_width and piece['w'] <= roll_height)):
+            raise ValueError(f"Peça {piece['w']}×{piece['h']}mm não cabe no rolo de "
+                             f"{roll_width}×{roll_height}mm em nenhuma orientação!")
+
+
+class PlanCancelled(Exception):
+    """O cálculo do plano foi cancelado pelo usuário"""
+
+
+def pack_pieces(pieces, roll_width=ROLL_WIDTH, roll_height=None, strategy='greedy',
+                time_budget=None, deadline=None, progress=None, cancel=None,
+                order=None, seed=0, cuts=None):
+    """
+    Algoritmo de mochila limitada por tipo de peça para maximizar aproveitamento.
+    Cada faixa é a combinação de tipos e orientações que ocupa a maior largura;
+    a faixa é repetida enquanto houver peças suficientes para ela.
+    Peças iguais são agrupadas em um vetor de quantidades por tipo, então o
+    custo depende do número de tamanhos distintos e não da quantidade total.
+    
+    Args:
+        pieces: Lista de peças com dimensões e quantidades
+        roll_width: Largura do rolo (padrão: 1050mm)
+        roll_height: Comprimento de cada rolo; as faixas são distribuídas em
+            rolos numerados (row['roll']). Padrão: um único rolo sem limite
+        strategy: 'greedy' (melhor faixa por largura), 'area' (melhor faixa
+            por aproveitamento de área, para peças de alturas variadas) ou
+            'patterns' (padrões de corte × multiplicidade, indicado para
+            pedidos grandes e repetitivos) ou 'exact' (maior largura por
+            branch-and-bound, desempatando pela menor perda de área)
+        time_budget: Segundos disponíveis para otimizar. Com prazo, o motor
+            gera um plano rápido e o melhora até o tempo acabar
+        deadline: Prazo absoluto em time.monotonic() (alternativa a time_budget)
+        progress: Função chamada a cada plano melhor, com um dicionário
+            {'stage', 'rows', 'utilization', 'length'}
+        cancel: Evento (threading.Event ou similar); quando marcado, o cálculo
+            para e levanta PlanCancelled
+        order: Ordem de desempate dos tipos ('width', 'height', 'area' ou
+            'random' com seed). Padrão: ordem por dimensões
+        cuts: CutSettings com lâmina, refilo e sobra mínima. As faixas
+            continuam com as dimensões reais das peças; as posições de corte
+            saem de cuts.positions()
+    
+    A lâmina e o refilo entram na capacidade em vez de em cada mochila: cada
+    peça é resolvida com kerf a mais nas duas dimensões, contra a largura
+    útil mais um kerf (a última peça da faixa não precisa de corte) e o
+    comprimento do rolo mais um kerf. Assim as mesmas mochilas, caches e
+    atalhos servem para planos com e sem perdas de corte.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Estratégia desconhecida: {strategy}")
+    
+    stats = profiling.current()
+    start = time.perf_counter()
+    types, remaining = aggregate_pieces(pieces)
+    solve_types, min_offcut = types, 0
+    if cuts:
+        kerf = cuts.kerf
+        solve_types = [PieceType(t.w + kerf, t.h + kerf) for t in types]
+        roll_width = cuts.usable_width(roll_width) + kerf
+        if roll_height:
+            roll_height += kerf
+        if cuts.min_offcut:
+            # A sobra inclui o corte que a separa da última peça
+            min_offcut = cuts.min_offcut + kerf
+    
+    if time_budget is not None:
+        budget_deadline = time.monotonic() + time_budget
+        deadline = budget_deadline if deadline is None else min(deadline, budget_deadline)
+    
+    def cancelled():
+        return cancel is not None and cancel.is_set()
+    
+    def expired():
+        return cancelled() or time.monotonic() >= deadline
+    
+    if deadline is not None:
+        rows = _pack_anytime(solve_types, remaining, roll_width, roll_height, strategy,
+                             expired, cancelled, progress, order, seed, min_offcut)
+    else:
+        rows = []
+        STRATEGIES[strategy](solve_types, remaining, roll_width, roll_height, rows,
+                             cancelled if cancel is not None else None, order, seed,
+                             min_offcut=min_offcut)
+    
+    if cancelled():
+        raise PlanCancelled()
+    if deadline is None:
+        _report(progress, strategy, rows, roll_width)
+    
+    if stats is not None:
+        stats.add_phase('pack', time.perf_counter() - start)
+        start = time.perf_counter()
+    if roll_height:
+        rows = assign_rolls(rows, roll_height)
+    if solve_types is not types:
+        rows = _actual_rows(rows, types, solve_types)
+    if stats is not None:
+        stats.add_phase('assign_rolls', time.perf_counter() - start)
+        stats.count('rows', len(rows))
+    
+    return rows
+
+
+def _actual_rows(rows, types, solve_types):
+    """
+    Faixas resolvidas com as peças alargadas pelo kerf (ver pack_pieces) de
+    volta às dimensões reais. Faixas repetidas continuam compartilhando
+    runs e items.
+    """
+    index = {id(piece_type): t for t, piece_type in enumerate(solve_types)}
+    shared = {}
+    actual = []
+    for row in rows:
+        key = id(row['runs'])
+        if key not in shared:
+            runs, items = _row_runs(types, [(index[id(piece_type)], rotated, n)
+                                            for piece_type, rotated, n in row['runs']])
+            shared[key] = (runs, items, sum(item['w'] for item in items),
+                           max(item['h'] for item in items))
+        runs, items, used_width, height = shared[key]
+        actual_row = {'runs': runs, 'items': items, 'used_width': used_width, 'height': height}
+        if 'roll' in row:
+            actual_row['roll'] = row['roll']
+        actual.append(actual_row)
+    return actual
+
+
+def _fits_any(types, remaining, width, length):
+    """Alguma peça restante cabe em width × length, em alguma orientação"""
+    return any(remaining[t] > 0 and next(_orientations(piece_type, width, length), None)
+               for t, piece_type in enumerate(types))
+
+
+def fill_remnants(pieces, remnants, cuts=None):
+    """
+    Corta o que for possível do pedido em sobras de estoque, antes de abrir
+    rolo novo.
+
+    Cada sobra é tratada como um rolo curto com a largura e o comprimento da
+    sobra, sem refilo (as bordas já foram cortadas), preenchido por faixas
+    gulosas até o comprimento acabar. As sobras são tentadas na ordem
+    recebida; as que não comportam nenhuma peça restante são puladas sem
+    resolver a mochila, então milhares de sobras candidatas custam pouco.
+
+    Args:
+        pieces: Peças do pedido, no formato de pack_pieces
+        remnants: (id, largura, comprimento) das sobras disponíveis
+        cuts: CutSettings; dentro das sobras só a lâmina vale
+
+    Returns:
+        (usos, peças restantes). Cada uso é um dicionário {'remnant', 'width',
+        'length', 'used_length', 'rows'}, com as faixas no formato de
+        pack_pieces (marcadas com row['remnant']); as peças que não couberem
+        em nenhuma sobra voltam no formato de pieces.
+    """
+    types, remaining = aggregate_pieces(pieces)
+    kerf = cuts.kerf if cuts else 0
+    solve_types = [PieceType(t.w + kerf, t.h + kerf) for t in types] if kerf else types
+
+    uses = []
+    for remnant, width, length in remnants:
+        if not any(remaining):
+            break
+        # Mesmo espaço de solução de pack_pieces: a última peça e a última
+        # faixa não precisam de lâmina
+        capacity = width + kerf
+        left = length + kerf
+        rows = []
+        while _fits_any(solve_types, remaining, capacity, left):
+            best_row = row_cache.solve(_best_row, solve_types, remaining, capacity, left)
+            if not best_row:
+                break
+            height = max((solve_types[t].w if rotated else solve_types[t].h)
+                         for t, rotated, _ in best_row)
+            repeat = min(_max_repeat(best_row, remaining), left // height)
+            for t, _, n in best_row:
+                remaining[t] -= n * repeat
+            _append_rows(rows, solve_types, best_row, repeat)
+            left -= height * repeat
+        if not rows:
+            continue
+        if solve_types is not types:
+            rows = _actual_rows(rows, types, solve_types)
+        for row in rows:
+            row['remnant'] = remnant
+        uses.append({'remnant': remnant, 'width': width, 'length': length,
+                     'used_length': length - left, 'rows': rows})
+
+    rest = [{'w': t.w, 'h': t.h, 'qty': n} for t, n in zip(types, remaining) if n > 0]
+    return uses, rest
+
+
+def search_variants(strategies=('greedy', 'area', 'patterns'), seeds=(1, 2, 3, 4)):
+    """
+    Variantes (estratégia, ordem, semente) exploradas pela busca paralela:
+    cada estratégia com as ordens fixas e com desempate aleatório por semente.
+    """
+    variants = []
+    for strategy in strategies:
+        for order in (None, 'width', 'height', 'area'):
+            variants.append((strategy, order, 0))
+        for seed in seeds:
+            variants.append((strategy, 'random', seed))
+    return variants
+
+
+# Evento de cancelamento da busca paralela, visto pelos processos de trabalho
+_search_cancel = None
+
+
+def _init_search_worker(cancel):
+    """Inicializa um processo da busca paralela com o evento de cancelamento compartilhado"""
+    global _search_cancel
+    _search_cancel = cancel
+
+
+def _search_job(pieces, roll_width, roll_height, strategy, order, seed, wall_deadline,
+                cuts=None, cancel=None):
+    """
+    Executa uma variante da busca paralela (em um processo de trabalho).
+    Sem cancel, usa o evento compartilhado recebido por _init_search_worker().
+    """
+    time_budget = None
+    if wall_deadline is not None:
+        # time.monotonic() não é comparável entre processos; o prazo vem em time.time()
+        time_budget = max(0.0, wall_deadline - time.time())
+    return pack_pieces(pieces, roll_width, roll_height, strategy,
+                       time_budget=time_budget, order=order, seed=seed, cuts=cuts,
+                       cancel=cancel or _search_cancel)
+
+
+def pack_pieces_parallel(pieces, roll_width=ROLL_WIDTH, roll_height=None, variants=None,
+                         time_budget=None, workers=None, progress=None, cancel=None,
+                         cuts=None):
+    """
+    Busca paralela: executa várias estratégias e ordens de desempate em
+    processos separados (ProcessPoolExecutor) e fica com o plano de menor
+    comprimento de rolo.
+    
+    Empates são decididos pela posição da variante na lista, então sem prazo
+    o resultado é sempre o mesmo para o mesmo conjunto de sementes. Com
+    time_budget, todas as variantes compartilham o mesmo prazo; as que
+    começam depois dele entregam o plano rápido da sua ordem.
+    
+    Args:
+        variants: Lista de (estratégia, ordem, semente); padrão search_variants()
+        workers: Número de processos (padrão: núcleos da máquina; 1 executa
+            tudo no processo atual)
+        progress, cancel, cuts: Como em pack_pieces(); progress recebe cada
+            plano melhor
+    """
+    variants = variants or search_variants()
+    wall_deadline = time.time() + time_budget if time_budget is not None else None
+    best = None  # (comprimento, índice da variante, faixas)
+    
+    def consider(index, rows):
+        nonlocal best
+        length = plan_length(rows, cuts.kerf if cuts else 0)
+        if best is None or (length, index) < best[:2]:
+            best = (length, index, rows)
+            strategy, order, seed = variants[index]
+            _report(progress, f"{strategy}/{order or 'size'}", rows, roll_width)
+    
+    def cancelled():
+        return cancel is not None and cancel.is_set()
+    
+    if workers == 1:
+        for index, (strategy, order, seed) in enumerate(variants):
+            if cancelled():
+                raise PlanCancelled()
+            consider(index, _search_job(pieces, roll_width, roll_height,
+                                        strategy, order, seed, wall_deadline, cuts, cancel))
+        return best[2]
+    
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+    
+    # Os processos de trabalho conferem este evento a cada faixa: ao cancelar
+    # (ou em caso de erro), as variantes em andamento param em vez de
+    # continuar ocupando os núcleos até o fim
+    context = multiprocessing.get_context()
+    stop = context.Event()
+    executor = ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                   initializer=_init_search_worker, initargs=(stop,))
+    try:
+        futures = {
+            executor.submit(_search_job, pieces, roll_width, roll_height,
+                            strategy, order, seed, wall_deadline, cuts): index
+            for index, (strategy, order, seed) in enumerate(variants)
+        }
+        pending = set(futures)
+        while pending:
+            if cancelled():
+                raise PlanCancelled()
+            done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+            for future in done:
+                consider(futures[future], future.result())
+    finally:
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    return best[2]
+
+
+def _restore_runs(rows):
+    """Recria row['runs'] nas faixas lidas do cache de planos"""
+    piece_types = {}
+    by_items = {}
+    for row in rows:
+        key = id(row['items'])
+        if key not in by_items:
+            runs = []
+            for item in row['items']:
+                dims = (item['orig_w'], item['orig_h'])
+                piece_type = piece_types.setdefault(dims, PieceType(*dims))
+                rotated = item['w'] != item['orig_w']
+                if runs and runs[-1][0] is piece_type and runs[-1][1] == rotated:
+                    runs[-1] = (piece_type, rotated, runs[-1][2] + 1)
+                else:
+                    runs.append((piece_type, rotated, 1))
+            by_items[key] = runs
+        row['runs'] = by_items[key]
+    return rows
+
+
+def pack_pieces_cached(pieces, roll_width=ROLL_WIDTH, roll_height=None,
+                       strategy='greedy', cache=None, time_budget=None, progress=None,
+                       cancel=None, parallel=False, cuts=None):
+    """
+    pack_pieces() com cache persistente de planos: pedidos já calculados
+    (mesmas peças, rolo, perdas de corte, estratégia e versão do motor)
+    retornam na hora. Com parallel=True usa pack_pieces_parallel() (a
+    estratégia é ignorada).
+    """
+    from .plan_cache import PlanCache
+    
+    cache = cache or PlanCache()
+    label = 'parallel' if parallel else strategy
+    if time_budget is not None:
+        label += '+anytime'
+    if cuts:
+        label += f"+kerf{cuts.kerf}+trim{cuts.trim}+offcut{cuts.min_offcut}"
+    
+    def compute():
+        if parallel:
+            return pack_pieces_parallel(pieces, roll_width, roll_height,
+                                        time_budget=time_budget, progress=progress,
+                                        cancel=cancel, cuts=cuts)
+        return pack_pieces(pieces, roll_width, roll_height, strategy,
+                           time_budget=time_budget, progress=progress, cancel=cancel,
+                           cuts=cuts)
+    
+    computed = False
+    
+    def compute_once():
+        nonlocal computed
+        computed = True
+        return compute()
+    
+    rows = cache.cached(pieces, roll_width, roll_height, label, ENGINE_VERSION, compute_once)
+    stats = profiling.current()
+    if not computed and stats is not None:
+        stats.count('plan_cache_hits')
+    if rows and 'runs' not in rows[0]:
+        _restore_runs(rows)
+    return rows
+
+
+def format_measurement(mm):
+    """Converte milímetros para formato mais legível"""
+    if mm >= 1000:
+        return f"{mm/1000:.1f} m"
+    else:
+        return f"{mm} mm"
+
+
+def format_area_m2(mm2):
+    """Converte milímetros quadrados para metros quadrados"""
+    m2 = mm2 / 1_000_000  # 1 m² = 1.000.000 mm²
+    if m2 >= 1:
+        return f"{m2:.2f} m²"
+    else:
+        return f"{m2*10000:.1f} cm²"  # Para áreas muito pequenas, usa cm²
+
+
+def _row_header(row_num, row):
+    """Cabeçalho da faixa (a única parte que muda entre faixas repetidas)"""
+    if 'roll' in row:
+        title = f"🎯 FAIXA NÚMERO {row_num} - ROLO {row['roll']}"
+    elif 'remnant' in row:
+        title = f"🎯 FAIXA NÚMERO {row_num} - SOBRA {row['remnant']} DO ESTOQUE"
+    else:
+        title = f"🎯 FAIXA NÚMERO {row_num} - CORTE ÚNICO"
+    return f"\n{'='*80}\n{title}\n{'='*80}\n\n"
+
+
+def _iter_row_body(row, roll_width, cuts=None):
+    """Gera em partes o desenho e as instruções de corte da faixa"""
+    cuts = cuts or NO_CUTS
+    used_width = row['used_width']
+    height = row['height']
+    positions = cuts.positions(row['items'])
+    usable_end = roll_width - cuts.trim
+    free = cuts.free_width(row, roll_width)
+    offcut = cuts.offcut(row, roll_width)
+    reusable = offcut if cuts.min_offcut and offcut >= cuts.min_offcut else 0
+    leftover = roll_width - used_width - reusable
+    
+    # RESUMO EXECUTIVO ANTES DE TUDO
+    yield "📋 RESUMO EXECUTIVO:\n"
+    yield "─" * 50 + "\n"
+    yield f"   • Quantidade de peças nesta faixa: {len(row['items'])}\n"
+    yield f"   • Altura do corte: {height} mm\n"
+    yield f"   • Largura total utilizada: {used_width} mm\n"
+    if cuts.trim:
+        yield f"   • Refilo: {cuts.trim} mm em cada borda\n"
+    if cuts.kerf:
+        yield f"   • Lâmina: {cuts.kerf} mm por corte\n"
+    if reusable:
+        yield f"   • Sobra aproveitável: {reusable} mm\n"
+    if leftover > 0:
+        yield f"   • Largura desperdiçada: {leftover} mm\n"
+    yield f"   • Aproveitamento: {(used_width/roll_width)*100:.1f}%\n\n"
+    
+    # DESENHO VISUAL DO ROLO COM PEÇAS
+    yield "📐 DESENHO DO CORTE:\n"
+    yield "─" * 50 + "\n"
+    yield f"   Largura total do rolo: {roll_width} mm\n\n"
+    
+    # Desenho do rolo com as peças posicionadas
+    yield "   ┌" + "─" * 76 + "┐\n"
+    yield f"   │{'ROL':^76}│\n"
+    yield f"   │{'DE MANTA 1.050mm':^76}│\n"
+    yield "   └" + "─" * 76 + "┘\n"
+    
+    # Posicionamento das peças no rolo
+    for i, (item, start_pos) in enumerate(zip(row['items'], positions), 1):
+        piece_width = item['w']
+        piece_height = item['h']
+        orig_width = item['orig_w']
+        orig_height = item['orig_h']
+        
+        # Calcula posições
+        end_pos = start_pos + piece_width
+        
+        # Desenho da peça no rolo
+        piece_visual = "─" * (piece_width // 10)  # Escala visual
+        if len(piece_visual) < 3:
+            piece_visual = "───"
+        
+        # Linha superior da peça
+        if start_pos == 0:
+            yield "   ┌" + piece_visual + "┐"
+        else:
+            yield "   " + " " * (start_pos // 10) + "┌" + piece_visual + "┐"
+        
+        # Espaço restante até o final
+        remaining_space = (roll_width - end_pos) // 10
+        if remaining_space > 0:
+            yield " " * remaining_space
+        yield "\n"
+        
+        # Conteúdo da peça
+        if start_pos == 0:
+            yield f"   │{i:^{len(piece_visual)}}│"
+        else:
+            yield "   " + " " * (start_pos // 10) + f"│{i:^{len(piece_visual)}}│"
+        
+        if remaining_space > 0:
+            yield " " * remaining_space
+        yield "\n"
+        
+        # Linha inferior da peça
+        if start_pos == 0:
+            yield "   └" + piece_visual + "┘"
+        else:
+            yield "   " + " " * (start_pos // 10) + "└" + piece_visual + "┘"
+        
+        if remaining_space > 0:
+            yield " " * remaining_space
+        yield "\n"
+    
+    # Legenda das peças
+    yield "\n   LEGENDA:\n"
+    for i, (item, start_pos) in enumerate(zip(row['items'], positions), 1):
+        piece_width = item['w']
+        piece_height = item['h']
+        orig_width = item['orig_w']
+        orig_height = item['orig_h']
+        
+        end_pos = start_pos + piece_width
+        
+        yield f"   [{i}] = {orig_width}×{orig_height}mm → corte de {piece_width}×{piece_height}mm\n"
+        yield f"        posição: {start_pos}mm até {end_pos}mm\n"
+    
+    # Sobra da faixa, depois da última peça
+    if free > 0:
+        last_end = positions[-1] + row['items'][-1]['w']
+        if reusable:
+            yield "\n   ♻️  SOBRA APROVEITÁVEL:\n"
+            yield f"      • {reusable} mm (mínimo aproveitável: {cuts.min_offcut} mm)\n"
+            yield f"      • posição: {last_end + cuts.kerf}mm até {usable_end}mm\n"
+        else:
+            yield "\n   ⚠️  ESPAÇO NÃO UTILIZADO:\n"
+            yield f"      • {free} mm desperdiçados\n"
+            yield f"      • posição: {last_end}mm até {usable_end}mm\n"
+    
+    yield "\n"
+    
+    # INSTRUÇÕES DE CORTE CLARAS
+    yield "✂️  INSTRUÇÕES DE CORTE:\n"
+    yield "─" * 50 + "\n"
+    yield f"1. Corte uma faixa de {height}mm de altura do rolo\n"
+    step = 2
+    if cuts.trim:
+        yield (f"{step}. Refile {cuts.trim}mm de cada borda (faixa útil de {cuts.trim}mm "
+               f"até {usable_end}mm)\n")
+        step += 1
+    yield f"{step}. Na faixa cortada, faça os seguintes cortes verticais:\n\n"
+    
+    for i, (item, start_pos) in enumerate(zip(row['items'], positions), 1):
+        piece_width = item['w']
+        piece_height = item['h']
+        orig_width = item['orig_w']
+        orig_height = item['orig_h']
+        
+        end_pos = start_pos + piece_width
+        
+        if cuts.kerf:
+            yield f"   Corte {i}: na posição {end_pos}mm (lâmina até {end_pos + cuts.kerf}mm)\n"
+        else:
+            yield f"   Corte {i}: na posição {end_pos}mm\n"
+        yield f"   → Resultado: peça {orig_width}×{orig_height}mm\n\n"
+    
+    if len(row['items']) > 1:
+        yield f"   RESULTADO FINAL: {len(row['items'])} peças cortadas lado a lado\n"
+    else:
+        yield "   RESULTADO FINAL: 1 peça cortada\n"
+    
+    yield "\n" + "="*80 + "\n\n"
+
+
+def iter_visual_row(row_num, row, roll_width, cuts=None):
+    """Gera em partes a representação visual da faixa (ver create_visual_row)"""
+    yield _row_header(row_num, row)
+    yield from _iter_row_body(row, roll_width, cuts)
+
+
+def create_visual_row(row_num, row, roll_width, cuts=None):
+    """
+    Cria uma representação visual muito clara e intuitiva da faixa.
+    Com cuts (CutSettings), as posições descontam o refilo e a lâmina.
+    """
+    return ''.join(iter_visual_row(row_num, row, roll_width, cuts))
+
+
+def create_pieces_summary(pieces):
+    """Cria um resumo claro das peças que serão cortadas"""
+    summary = """
+📦 PEÇAS QUE SERÃO CORTADAS:
+
+"""
+    
+    total_pieces = sum(p['qty'] for p in pieces)
+    total_area = sum(p['w'] * p['h'] * p['qty'] for p in pieces)
+    
+    summary += "   📊 RESUMO GERAL:\n"
+    summary += f"   • Total de tipos de peças: {len(pieces)}\n"
+    summary += f"   • Total de peças a cortar: {total_pieces}\n"
+    summary += f"   • Área total necessária: {format_area_m2(total_area)}\n\n"
+    
+    for i, piece in enumerate(pieces, 1):
+        width = piece['w']
+        height = piece['h']
+        qty = piece['qty']
+        area = width * height
+        
+        summary += f"   🔸 TIPO DE PEÇA {i}:\n"
+        summary += f"      • Dimensões originais: {width}mm × {height}mm\n"
+        summary += f"      • Quantidade necessária: {qty} unidades\n"
+        summary += f"      • Área por peça: {format_area_m2(area)}\n"
+        summary += f"      • Área total deste tipo: {format_area_m2(area * qty)}\n\n"
+    
+    return summary
+
+
+def iter_visual_summary(rows, total_height, used_area, loss_area, util, roll_width=ROLL_WIDTH):
+    """Gera em partes o resumo final (ver create_visual_summary)"""
+    rolls = max((r.get('roll', 1) for r in rows), default=1)
+    summary = f"""
+🎯 RESUMO COMPLETO DO CORTE:
+
+📏 MATERIAL NECESSÁRIO:
+   • {rolls} {'manta' if rolls == 1 else 'mantas'} de {format_measurement(roll_width)} de largura
+   • {total_height}mm de comprimento total
+   • Área total: {format_area_m2(roll_width * total_height)}
+
+📦 O QUE VOCÊ VAI PRODUZIR:
+   • {sum(len(r['items']) for r in rows)} peças no total
+   • {len(rows)} faixas de corte
+   • Área utilizada: {format_area_m2(used_area)}
+
+🗑️  O QUE VAI SOBRAR:
+   • {format_area_m2(loss_area)} de material desperdiçado
+   • {util:.1f}% de aproveitamento do material
+
+💡 AVALIAÇÃO:
+"""
+    
+    if util >= 90:
+        summary += "   ✅ EXCELENTE! Você aproveitou quase todo o material\n"
+    elif util >= 80:
+        summary += "   👍 BOM! O aproveitamento está satisfatório\n"
+    elif util >= 70:
+        summary += "   ⚠️  REGULAR! Pode melhorar um pouco\n"
+    else:
+        summary += "   ❌ BAIXO! Muito material está sendo desperdiçado\n"
+    
+    yield summary + "\n📋 LISTA DE FAIXAS:\n"
+    for i, r in enumerate(rows, 1):
+        pieces_count = len(r['items'])
+        used_width = r['used_width']
+        height = r['height']
+        roll = f" (rolo {r['roll']})" if 'roll' in r else ""
+        yield (f"   • Faixa {i}{roll}: {pieces_count} peças, "
+               f"{used_width}mm usado, {height}mm altura\n")
+
+
+def create_visual_summary(rows, total_height, used_area, loss_area, util, roll_width=ROLL_WIDTH):
+    """Cria um resumo visual muito claro"""
+    return ''.join(iter_visual_summary(rows, total_height, used_area, loss_area, util,
+                                       roll_width))
+
+
+def iter_report(pieces, rows, roll_width, roll_height=None, cuts=None):
+    """
+    Gera o relatório completo do plano em partes, faixa a faixa, para ser
+    escrito direto em arquivo, na saída padrão ou na interface sem montar
+    o texto inteiro na memória. Faixas repetidas reaproveitam o corpo já
+    renderizado; só o cabeçalho muda.
+    """
+    cuts = cuts or NO_CUTS
+    total_height = plan_length(rows, cuts.kerf)
+    total_area = roll_width * total_height
+    
+    # Calcula área usada pelas peças
+    used_area = 0
+    for r in rows:
+        for item in r['items']:
+            used_area += item['w'] * item['h']
+    
+    loss_area = total_area - used_area
+    util = used_area / total_area * 100 if total_area else 0
+    
+    # Cabeçalho e informações básicas
+    header = "🎯 PLANO DE CORTE DE MANTAS PRI (OTIMIZADO)\n"
+    header += "=" * 60 + "\n\n"
+    header += "📏 INFORMAÇÕES BÁSICAS:\n"
+    header += "─" * 40 + "\n"
+    header += f"   • Largura da manta: {format_measurement(roll_width)}\n"
+    if cuts.trim:
+        header += (f"   • Refilo: {cuts.trim} mm por borda "
+                   f"({format_measurement(cuts.usable_width(roll_width))} úteis)\n")
+    if cuts.kerf:
+        header += f"   • Lâmina: {cuts.kerf} mm por corte\n"
+    if cuts.min_offcut:
+        header += f"   • Sobra mínima aproveitável: {cuts.min_offcut} mm\n"
+    header += f"   • Total de peças: {sum(p['qty'] for p in pieces)}\n"
+    header += f"   • Total de faixas: {len(rows)}\n"
+    if roll_height:
+        header += (f"   • Rolos necessários: {rows[-1]['roll'] if rows else 0} "
+                   f"(de {format_measurement(roll_height)} cada)\n")
+    header += f"   • Comprimento total: {format_measurement(total_height)}\n"
+    header += f"   • Aproveitamento: {util:.1f}%\n\n"
+    yield header
+    
+    # Resumo das peças que serão cortadas
+    yield create_pieces_summary(pieces)
+    
+    # Visualização detalhada de cada faixa
+    yield "📐 DETALHES DE CADA FAIXA:\n" + "=" * 60 + "\n"
+    
+    bodies = {}  # corpo já renderizado por composição de faixa
+    for i, r in enumerate(rows, 1):
+        key = (id(r['items']), r['used_width'], r['height'])
+        body = bodies.get(key)
+        if body is None:
+            body = bodies[key] = ''.join(_iter_row_body(r, roll_width, cuts))
+        yield _row_header(i, r)
+        yield body
+    
+    stats = profiling.current()
+    if stats is not None:
+        stats.count('report_rows', len(rows))
+        stats.count('report_bodies_rendered', len(bodies))
+    
+    # Resumo final muito claro
+    yield from iter_visual_summary(rows, total_height, used_area, loss_area, util, roll_width)
+
+
+def iter_remnant_report(uses, cuts=None):
+    """
+    Gera em partes a seção das peças cortadas de sobras do estoque (ver
+    fill_remnants()), uma sobra por vez, com o mesmo desenho das faixas.
+    """
+    kerf = cuts.kerf if cuts else 0
+    remnant_cuts = CutSettings(kerf)  # as bordas da sobra já estão cortadas
+    
+    header = "\n♻️  PEÇAS CORTADAS DE SOBRAS DO ESTOQUE:\n" + "=" * 60 + "\n"
+    for use in uses:
+        pieces_count = sum(len(r['items']) for r in use['rows'])
+        header += (f"   • Sobra {use['remnant']}: {use['width']}×{use['length']}mm → "
+                   f"{pieces_count} peças em {len(use['rows'])} faixas "
+                   f"({use['used_length']}mm usados)\n")
+    yield header
+    
+    row_num = 0
+    for use in uses:
+        for row in use['rows']:
+            row_num += 1
+            yield from iter_visual_row(row_num, row, use['width'], remnant_cuts)
+
+
+def write_report(f, pieces, rows, roll_width, roll_height=None, batch=64 * 1024, cuts=None):
+    """Escreve o relatório em f (arquivo, sys.stdout...) em blocos de ~batch caracteres"""
+    stats = profiling.current()
+    start = time.perf_counter()
+    chunks = []
+    size = 0
+    for chunk in iter_report(pieces, rows, roll_width, roll_height, cuts):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= batch:
+            f.write(''.join(chunks))
+            chunks.clear()
+            size = 0
+    f.write(''.join(chunks))
+    if stats is not None:
+        stats.add_phase('report', time.perf_counter() - start)
+
+
+def create_report(pieces, rows, roll_width, roll_height=None, cuts=None):
+    """Cria o relatório completo do plano (o texto mostrado na interface)"""
+    stats = profiling.current()
+    start = time.perf_counter()
+    report = ''.join(iter_report(pieces, rows, roll_width, roll_height, cuts))
+    if stats is not None:
+        stats.add_phase('report', time.perf_counter() - start)
+    return report
@@ -0,0 +1,696 @@
+"""
+Interface gráfica (Tkinter) do otimizador de cortes.
+
+A janela só é construída por main(); importar este módulo não abre janelas.
+"""
+
+import tkinter as tk
+from tkinter import scrolledtext, messagebox, filedialog, ttk
+import os
+import queue
+import threading
+from datetime import datetime
+from itertools import islice
+
+from . import profiling
+from .engine import (TIME_BUDGET, CutSettings, PlanCancelled, pack_pieces, pack_pieces_cached,
+                     validate_pieces, format_measurement, iter_report, write_report,
+                     create_report, create_visual_row)
+from .pdf import write_plan_pdf
+from .plan_format import build_plan, write_json, encode_binary
+from .printing import print_report
+from .roll_layout import write_svg
+from .roll_view import RollView
+
+# Variáveis globais para armazenar o resultado atual
+current_report = None  # (peças, faixas, largura, comprimento) do resultado atual
+current_cuts = None  # perdas de corte (CutSettings) do resultado atual
+current_pieces_data = []
+current_plan = None  # plano estruturado (plan_format.build_plan) do resultado atual
+current_page = 0  # página da lista de faixas
+calc_cancel = None  # evento de cancelamento do cálculo em andamento
+current_profile = None  # perfil (profiling.PlanStats) do último cálculo em modo depuração
+
+PAGE_SIZE = 500  # faixas por página na lista; mantém a Treeview leve com 10 mil faixas
+
+# Colunas da lista de faixas: (título, largura em pixels)
+STRIP_COLUMNS = {
+    'index': ('Faixa', 60),
+    'roll': ('Rolo', 50),
+    'pieces': ('Peças', 60),
+    'height': ('Altura (mm)', 90),
+    'used': ('Usado (mm)', 90),
+    'util': ('Aproveit.', 80),
+}
+
+# Widgets usados pelos callbacks (criados em main())
+root = None
+entries = []
+roll_width_entry = roll_height_entry = None
+kerf_entry = trim_entry = offcut_entry = None
+calc_button = progress_label = result = None
+profile_var = None  # caixa "Depuração": calcula com perfil do motor
+summary_label = strip_tree = strip_canvas = roll_view = None
+page_label = prev_button = next_button = None
+
+
+def export_to_txt():
+    """Exporta o resultado para arquivo TXT"""
+    if current_report is None:
+        messagebox.showwarning("Atenção", "Nenhum resultado para exportar!")
+        return
+    
+    filename = filedialog.asksaveasfilename(
+        defaultextension=".txt",
+        filetypes=[("Arquivo de texto", "*.txt"), ("Todos os arquivos", "*.*")],
+        title="Salvar plano de corte como..."
+    )
+    
+    if filename:
+        try:
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.write("PLANO DE CORTE OTIMIZADO\n")
+                f.write("=" * 50 + "\n")
+                f.write(f"Data: {datetime.now().strftime('%d/%m/%Y %H:%M')}\n")
+                f.write(f"Largura do rolo: {format_measurement(current_report[2])}\n\n")
+                write_report(f, *current_report, cuts=current_cuts)
+            
+            messagebox.showinfo("Sucesso", 
+                              f"Plano salvo em:\n{filename}")
+        except Exception as e:
+            messagebox.showerror("Erro", f"Erro ao salvar arquivo:\n{str(e)}")
+
+
+def export_plan():
+    """Exporta o plano estruturado (JSON ou binário) para máquinas de corte e ERP"""
+    if current_plan is None:
+        messagebox.showwarning("Atenção", "Nenhum resultado para exportar!")
+        return
+    
+    filename = filedialog.asksaveasfilename(
+        defaultextension=".json",
+        filetypes=[("Plano estruturado (JSON)", "*.json"),
+                   ("Plano binário compacto", "*.cutplan")],
+        title="Salvar plano estruturado como..."
+    )
+    
+    if filename:
+        try:
+            if filename.lower().endswith('.cutplan'):
+                with open(filename, 'wb') as f:
+                    f.write(encode_binary(current_plan))
+            else:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    write_json(current_plan, f)
+            
+            messagebox.showinfo("Sucesso", 
+                              f"Plano salvo em:\n{filename}")
+        except Exception as e:
+            messagebox.showerror("Erro", f"Erro ao salvar arquivo:\n{str(e)}")
+
+
+def export_to_svg():
+    """Exporta o desenho do plano inteiro, em escala, para SVG"""
+    if current_plan is None:
+        messagebox.showwarning("Atenção", "Nenhum resultado para exportar!")
+        return
+    
+    filename = filedialog.asksaveasfilename(
+        defaultextension=".svg",
+        filetypes=[("Desenho SVG", "*.svg")],
+        title="Salvar desenho do plano como..."
+    )
+    
+    if filename:
+        try:
+            with open(filename, 'w', encoding='utf-8') as f:
+                write_svg(current_plan, f)
+            
+            messagebox.showinfo("Sucesso", 
+                              f"Desenho salvo em:\n{filename}")
+        except Exception as e:
+            messagebox.showerror("Erro", f"Erro ao salvar arquivo:\n{str(e)}")
+
+
+def copy_to_clipboard():
+    """Copia o resultado para a área de transferência"""
+    if current_report is None:
+        messagebox.showwarning("Atenção", "Nenhum resultado para copiar!")
+        return
+    
+    try:
+        root.clipboard_clear()
+        root.clipboard_append(create_report(*current_report, cuts=current_cuts))
+        messagebox.showinfo("Sucesso", 
+                          "Plano de corte copiado para a área de transferência!")
+    except Exception as e:
+        messagebox.showerror("Erro", f"Erro ao copiar:\n{str(e)}")
+
+
+def print_result():
+    """Envia o relatório ao spooler (lpr) em segundo plano, sem arquivo temporário"""
+    if current_report is None:
+        messagebox.showwarning("Atenção", "Nenhum resultado para imprimir!")
+        return
+    
+    messages = queue.Queue()
+    
+    def worker(report, cuts):
+        try:
+            pages = print_report(*report, progress=lambda n: messages.put(('progress', n)),
+                                 cuts=cuts)
+            messages.put(('done', pages))
+        except Exception as e:
+            messages.put(('error', e))
+    
+    threading.Thread(target=worker, args=(current_report, current_cuts), daemon=True).start()
+    progress_label.config(text="🖨️ Enviando para a impressora...")
+    root.after(100, _poll_printing, messages)
+
+
+def _poll_printing(messages):
+    """Lê as mensagens da impressão em segundo plano (chamado por root.after)"""
+    while True:
+        try:
+            kind, data = messages.get_nowait()
+        except queue.Empty:
+            break
+        
+        if kind == 'progress':
+            progress_label.config(text=f"🖨️ Enviando página {data}...")
+        elif kind == 'done':
+            progress_label.config(text=f"🖨️ {data} páginas enviadas para a impressora")
+            return
+        else:
+            progress_label.config(text="")
+            messagebox.showerror("Erro", f"Erro ao imprimir:\n{str(data)}")
+            return
+    
+    root.after(100, _poll_printing, messages)
+
+
+def export_to_pdf():
+    """Exporta o plano para PDF, com as faixas desenhadas em escala"""
+    if current_plan is None:
+        messagebox.showwarning("Atenção", "Nenhum resultado para exportar!")
+        return
+    
+    filename = filedialog.asksaveasfilename(
+        defaultextension=".pdf",
+        filetypes=[("Arquivo PDF", "*.pdf")],
+        title="Salvar plano de corte como PDF..."
+    )
+    
+    if filename:
+        try:
+            with open(filename, 'wb') as f:
+                write_plan_pdf(f, current_plan, current_pieces_data)
+            messagebox.showinfo("Sucesso", f"Plano salvo como PDF em:\n{filename}")
+        except Exception as e:
+            messagebox.showerror("Erro", f"Erro ao salvar PDF:\n{str(e)}")
+
+
+def export_profile():
+    """Salva o perfil do último cálculo em modo depuração (JSON ou cProfile)"""
+    if current_profile is None:
+        messagebox.showwarning("Atenção", "Nenhum perfil coletado!\n"
+                               "Marque \"Depuração\" e calcule o plano novamente.")
+        return
+    
+    filename = filedialog.asksaveasfilename(
+        defaultextension=".json",
+        filetypes=[("Perfil JSON", "*.json"), ("Perfil cProfile", "*.prof")],
+        title="Salvar perfil do cálculo como..."
+    )
+    
+    if filename:
+        try:
+            if filename.lower().endswith('.prof'):
+                current_profile.dump_cprofile(filename)
+            else:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    current_profile.write_json(f)
+            messagebox.showinfo("Sucesso", f"Perfil salvo em:\n{filename}")
+        except Exception as e:
+            messagebox.showerror("Erro", f"Erro ao salvar perfil:\n{str(e)}")
+
+
+def calculate():
+    if calc_cancel is not None:  # já existe um cálculo em andamento
+        return
+    
+    # Captura dimensões do rolo
+    try:
+        roll_width = int(roll_width_entry.get())
+        roll_height = int(roll_height_entry.get())
+        
+        if roll_width <= 0 or roll_height <= 0:
+            messagebox.showwarning("Atenção", "Dimensões do rolo devem ser maiores que zero")
+            return
+            
+    except ValueError:
+        messagebox.showwarning("Atenção", "Informe dimensões válidas para o rolo")
+        return
+    
+    # Perdas de corte (campo vazio vale zero)
+    try:
+        cuts = CutSettings(*(int(entry.get() or 0)
+                             for entry in (kerf_entry, trim_entry, offcut_entry)))
+    except ValueError:
+        messagebox.showwarning("Atenção", "Lâmina, refilo e sobra mínima devem ser "
+                                          "medidas inteiras maiores ou iguais a zero")
+        return
+    
+    # Captura peças
+    pieces = []
+    for w_e, h_e, q_e in entries:
+        try:
+            w = int(w_e.get())
+            h = int(h_e.get())
+            q = int(q_e.get())
+        except ValueError:
+            continue
+        if w > 0 and h > 0 and q > 0:
+            pieces.append({'w': w, 'h': h, 'qty': q})
+
+    if not pieces:
+        messagebox.showwarning("Atenção", "Informe ao menos uma peça válida")
+        return
+
+    # Validação: verifica se todas as peças cabem no rolo
+    try:
+        validate_pieces(pieces, roll_width, roll_height, cuts)
+    except ValueError as e:
+        messagebox.showwarning("Atenção", str(e))
+        return
+
+    start_calculation(pieces, roll_width, roll_height, cuts or None)
+
+
+def _calculation_worker(pieces, roll_width, roll_height, cancel, messages, profile=False,
+                        cuts=None):
+    """
+    Executa o otimizador fora da thread da interface (não toca em widgets).
+    Com profile, calcula sem cache de planos e sem busca paralela, para que
+    o perfil cubra o motor inteiro, e envia o perfil antes do resultado.
+    """
+    def progress(info):
+        messages.put(('progress', info))
+    
+    try:
+        if profile:
+            with profiling.profile(cprofile=True) as stats:
+                rows = pack_pieces(pieces, roll_width, roll_height, time_budget=TIME_BUDGET,
+                                   progress=progress, cancel=cancel, cuts=cuts)
+            messages.put(('profile', stats))
+        else:
+            rows = pack_pieces_cached(pieces, roll_width, roll_height, time_budget=TIME_BUDGET,
+                                      progress=progress, cancel=cancel,
+                                      parallel=(os.cpu_count() or 1) > 1, cuts=cuts)
+        messages.put(('done', rows))
+    except PlanCancelled:
+        messages.put(('cancelled', None))
+    except Exception as e:
+        messages.put(('error', e))
+
+
+def start_calculation(pieces, roll_width, roll_height, cuts=None):
+    """Inicia o cálculo em segundo plano e transforma o botão em Cancelar"""
+    global calc_cancel, current_profile
+    
+    calc_cancel = threading.Event()
+    current_profile = None
+    messages = queue.Queue()
+    threading.Thread(target=_calculation_worker, daemon=True,
+                     args=(pieces, roll_width, roll_height, calc_cancel, messages,
+                           profile_var.get(), cuts)).start()
+    
+    calc_button.config(text='⛔ CANCELAR CÁLCULO', command=cancel_calculation, bg='#dc3545')
+    progress_label.config(text="⏳ Calculando plano de corte...")
+    root.after(100, _poll_calculation, pieces, roll_width, roll_height, messages, cuts)
+
+
+def cancel_calculation():
+    """Interrompe o cálculo em andamento"""
+    if calc_cancel is not None:
+        calc_cancel.set()
+        progress_label.config(text="⛔ Cancelando...")
+
+
+def _finish_calculation(message):
+    global calc_cancel
+    calc_cancel = None
+    calc_button.config(text='🚀 CALCULAR PLANO DE CORTE OTIMIZADO', command=calculate,
+                       bg='#2E86AB')
+    progress_label.config(text=message)
+
+
+def _poll_calculation(pieces, roll_width, roll_height, messages, cuts=None):
+    """Lê as mensagens do cálculo em segundo plano (chamado por root.after)"""
+    global current_profile
+    
+    while True:
+        try:
+            kind, data = messages.get_nowait()
+        except queue.Empty:
+            break
+        
+        if kind == 'progress':
+            progress_label.config(text=f"⏳ {data['rows']} faixas | "
+                                       f"{data['utilization']:.1f}% de aproveitamento")
+        elif kind == 'profile':
+            current_profile = data
+        elif kind == 'done':
+            if current_profile is None:
+                _finish_calculation("✅ Plano calculado")
+                show_result(pieces, data, roll_width, roll_height, cuts)
+            else:
+                with current_profile.phase('show_result'):
+                    show_result(pieces, data, roll_width, roll_height, cuts)
+                summary = current_profile.summary()
+                _finish_calculation(f"✅ Plano calculado | 🐞 {summary['rows_solved']} faixas "
+                                    f"resolvidas em {summary['row_seconds']:.2f} s "
+                                    f"({summary['rows_cached']} do cache)")
+            return
+        elif kind == 'cancelled':
+            _finish_calculation("⛔ Cálculo cancelado")
+            return
+        else:
+            _finish_calculation("")
+            messagebox.showerror("Erro", f"Erro ao calcular o plano:\n{str(data)}")
+            return
+    
+    root.after(100, _poll_calculation, pieces, roll_width, roll_height, messages, cuts)
+
+
+def show_result(pieces, rows, roll_width, roll_height, cuts=None):
+    """Mostra o plano calculado: resumo, lista de faixas paginada e detalhes sob demanda"""
+    global current_report, current_pieces_data, current_plan, current_cuts
+    
+    current_pieces_data = pieces.copy()
+    current_plan = build_plan(rows, roll_width, roll_height, cuts)
+    
+    # Guarda os dados do plano; o texto é gerado de novo a cada exportação
+    current_report = (pieces, rows, roll_width, roll_height)
+    current_cuts = cuts
+    
+    summary_label.config(text=f"📊 {len(rows)} faixas | {current_plan['rolls']} rolos | "
+                              f"{format_measurement(current_plan['length'])} | "
+                              f"{current_plan['utilization']:.1f}% de aproveitamento")
+    roll_view.set_plan(current_plan)
+    show_page(0)
+
+
+def _show_overview():
+    """Detalhes sem faixa selecionada: cabeçalho do relatório e resumo das peças"""
+    result.delete('1.0', tk.END)
+    result.insert(tk.END, ''.join(islice(iter_report(*current_report, cuts=current_cuts), 2)))
+    strip_canvas.delete('all')
+
+
+def show_page(page):
+    """Mostra uma página da lista de faixas (só PAGE_SIZE itens na Treeview)"""
+    global current_page
+    
+    if current_plan is None:
+        return
+    plan_rows = current_plan['rows']
+    pages = max(1, -(-len(plan_rows) // PAGE_SIZE))
+    current_page = max(0, min(page, pages - 1))
+    start = current_page * PAGE_SIZE
+    end = min(start + PAGE_SIZE, len(plan_rows))
+    
+    strip_tree.delete(*strip_tree.get_children())
+    for row in plan_rows[start:end]:
+        strip_tree.insert('', tk.END, iid=str(row['index']), values=(
+            row['index'], row['roll'], len(row['items']), row['height'],
+            row['used_width'], f"{row['utilization']:.1f}%"))
+    
+    page_label.config(text=f"Faixas {start + 1 if end else 0}–{end} de {len(plan_rows)}")
+    prev_button.config(state=tk.NORMAL if current_page > 0 else tk.DISABLED)
+    next_button.config(state=tk.NORMAL if current_page < pages - 1 else tk.DISABLED)
+    _show_overview()
+
+
+def _selected_index():
+    """Número (1, 2, ...) da faixa selecionada ou None"""
+    selection = strip_tree.selection() if strip_tree is not None else ()
+    return int(selection[0]) if selection else None
+
+
+def _on_strip_select(event=None):
+    """Renderiza só a faixa selecionada: desenho no canvas e instruções de corte"""
+    index = _selected_index()
+    if index is None or current_report is None:
+        return
+    rows, roll_width = current_report[1], current_report[2]
+    
+    result.delete('1.0', tk.END)
+    result.insert(tk.END, create_visual_row(index, rows[index - 1], roll_width, current_cuts))
+    draw_strip(current_plan['rows'][index - 1])
+    roll_view.show_row(index)
+
+
+def draw_strip(plan_row):
+    """Desenha a faixa em escala no canvas: peças numeradas e sobra hachurada"""
+    strip_canvas.delete('all')
+    roll_width = current_plan['roll']['width']
+    pad = 10
+    width = max(strip_canvas.winfo_width(), 100) - 2 * pad
+    height = max(strip_canvas.winfo_height(), 60) - 2 * pad
+    scale = min(width / roll_width, height / plan_row['height'])
+    
+    strip_canvas.create_rectangle(pad, pad, pad + roll_width * scale,
+                                  pad + plan_row['height'] * scale,
+                                  outline='#666666', fill='#eeeeee', stipple='gray25')
+    for number, item in enumerate(plan_row['items'], 1):
+        x0 = pad + item['x'] * scale
+        x1 = x0 + item['w'] * scale
+        y1 = pad + item['h'] * scale
+        strip_canvas.create_rectangle(x0, pad, x1, y1, outline='#1b4f72',
+                                      fill='#f4a261' if item['rotated'] else '#2E86AB')
+        if x1 - x0 > 14:
+            strip_canvas.create_text((x0 + x1) / 2, (pad + y1) / 2, text=str(number),
+                                     fill='white', font=('Arial', 9, 'bold'))
+
+
+def _redraw_selected(event=None):
+    """Redesenha a faixa selecionada quando o canvas muda de tamanho"""
+    index = _selected_index()
+    if index is not None and current_plan is not None:
+        draw_strip(current_plan['rows'][index - 1])
+
+
+def main():
+    """Constrói a janela do otimizador e inicia o loop da interface"""
+    global root, entries, roll_width_entry, roll_height_entry
+    global kerf_entry, trim_entry, offcut_entry
+    global calc_button, progress_label, result, profile_var
+    global summary_label, strip_tree, strip_canvas, roll_view
+    global page_label, prev_button, next_button
+    
+    root = tk.Tk()
+    root.title('🎯 Otimizador de Cortes de Mantas PRI 1.050x50 (OTIMIZADO)')
+    root.geometry('1100x850')
+
+    # Frame principal
+    main_frame = tk.Frame(root, padx=20, pady=20)
+    main_frame.pack(fill=tk.BOTH, expand=True)
+
+    # Título
+    title_label = tk.Label(main_frame, 
+                          text="🎯 OTIMIZADOR DE CORTES DE MANTAS PRI (OTIMIZADO)", 
+                          font=('Arial', 16, 'bold'), fg='#2E86AB')
+    title_label.pack(pady=(0, 20))
+
+    # Frame para dimensões do rolo
+    roll_frame = tk.LabelFrame(main_frame, text="📏 DIMENSÕES DO ROLO", 
+                              font=('Arial', 12, 'bold'), fg='#2E86AB', padx=15, pady=15)
+    roll_frame.pack(fill=tk.X, pady=(0, 20))
+
+    # Campos para dimensões do rolo
+    roll_inputs_frame = tk.Frame(roll_frame)
+    roll_inputs_frame.pack()
+
+    tk.Label(roll_inputs_frame, text='Largura do rolo (mm):', 
+             font=('Arial', 10, 'bold')).grid(row=0, column=0, padx=(0, 10), sticky='e')
+    roll_width_entry = tk.Entry(roll_inputs_frame, width=15, font=('Arial', 10))
+    roll_width_entry.insert(0, "1050")  # Valor padrão
+    roll_width_entry.grid(row=0, column=1, padx=(0, 20))
+
+    tk.Label(roll_inputs_frame, text='Altura máxima (mm):', 
+             font=('Arial', 10, 'bold')).grid(row=0, column=2, padx=(0, 10), sticky='e')
+    roll_height_entry = tk.Entry(roll_inputs_frame, width=15, font=('Arial', 10))
+    roll_height_entry.insert(0, "50000")  # Valor padrão (ilimitada)
+    roll_height_entry.grid(row=0, column=3)
+
+    # Perdas de corte: lâmina, refilo das bordas e menor sobra aproveitável
+    cuts_inputs_frame = tk.Frame(roll_frame)
+    cuts_inputs_frame.pack(pady=(10, 0))
+
+    cut_fields = []
+    for column, label in enumerate(('Lâmina (mm):', 'Refilo por borda (mm):',
+                                    'Sobra mínima (mm):')):
+        tk.Label(cuts_inputs_frame, text=label,
+                 font=('Arial', 10, 'bold')).grid(row=0, column=2 * column, padx=(0, 10),
+                                                  sticky='e')
+        entry = tk.Entry(cuts_inputs_frame, width=8, font=('Arial', 10))
+        entry.insert(0, "0")  # Valor padrão (sem perdas)
+        entry.grid(row=0, column=2 * column + 1, padx=(0, 20))
+        cut_fields.append(entry)
+    kerf_entry, trim_entry, offcut_entry = cut_fields
+
+    # Texto explicativo
+    info_label = tk.Label(roll_frame, 
+                         text="💡 Dica: Altura máxima pode ser deixada alta (50000mm) para rolos longos",
+                         font=('Arial', 9), fg='#666666')
+    info_label.pack(pady=(10, 0))
+
+    # Frame para entrada de dados
+    input_frame = tk.LabelFrame(main_frame, text="📝 DADOS DAS PEÇAS", 
+                               font=('Arial', 12, 'bold'), padx=15, pady=15)
+    input_frame.pack(fill=tk.X, pady=(0, 20))
+
+    # Cabeçalhos das colunas
+    headers_frame = tk.Frame(input_frame)
+    headers_frame.pack(fill=tk.X, pady=(0, 10))
+
+    tk.Label(headers_frame, text='Largura (mm)', 
+             font=('Arial', 10, 'bold')).grid(row=0, column=0, padx=5)
+    tk.Label(headers_frame, text='Altura (mm)', 
+             font=('Arial', 10, 'bold')).grid(row=0, column=1, padx=5)
+    tk.Label(headers_frame, text='Quantidade', 
+             font=('Arial', 10, 'bold')).grid(row=0, column=2, padx=5)
+
+    entries = []
+    for i in range(8):  # Aumentei para 8 linhas
+        row_frame = tk.Frame(input_frame)
+        row_frame.pack(fill=tk.X, pady=2)
+
+        e_w = tk.Entry(row_frame, width=12, font=('Arial', 10))
+        e_h = tk.Entry(row_frame, width=12, font=('Arial', 10))
+        e_q = tk.Entry(row_frame, width=8, font=('Arial', 10))
+
+        e_w.grid(row=0, column=0, padx=5)
+        e_h.grid(row=0, column=1, padx=5)
+        e_q.grid(row=0, column=2, padx=5)
+
+        entries.append((e_w, e_h, e_q))
+
+    # Frame para botões
+    buttons_frame = tk.Frame(main_frame)
+    buttons_frame.pack(pady=20)
+
+    # Botão calcular
+    calc_button = tk.Button(buttons_frame, text='🚀 CALCULAR PLANO DE CORTE OTIMIZADO', 
+                           command=calculate, font=('Arial', 12, 'bold'),
+                           bg='#2E86AB', fg='white', padx=20, pady=10)
+    calc_button.pack(side=tk.LEFT, padx=(0, 10))
+
+    # Modo depuração: coleta o perfil do motor durante o cálculo
+    profile_var = tk.BooleanVar(value=False)
+    tk.Checkbutton(buttons_frame, text='🐞 Depuração', variable=profile_var,
+                   font=('Arial', 9)).pack(side=tk.LEFT, padx=(0, 10))
+
+    # Progresso do cálculo em andamento
+    progress_label = tk.Label(buttons_frame, text="", font=('Arial', 10), fg='#666666')
+    progress_label.pack(side=tk.LEFT)
+
+    # Frame para botões de exportação
+    export_frame = tk.LabelFrame(main_frame, text="📤 EXPORTAR RESULTADO", 
+                                font=('Arial', 10, 'bold'), padx=10, pady=10)
+    export_frame.pack(fill=tk.X, pady=(0, 20))
+
+    # Botões de exportação
+    export_buttons_frame = tk.Frame(export_frame)
+    export_buttons_frame.pack()
+
+    tk.Button(export_buttons_frame, text='📄 Salvar TXT', 
+              command=export_to_txt, font=('Arial', 9),
+              bg='#28a745', fg='white', padx=15, pady=5).pack(side=tk.LEFT, padx=5)
+
+    tk.Button(export_buttons_frame, text='🧾 Salvar Plano (JSON)', 
+              command=export_plan, font=('Arial', 9),
+              bg='#6f42c1', fg='white', padx=15, pady=5).pack(side=tk.LEFT, padx=5)
+
+    tk.Button(export_buttons_frame, text='📋 Copiar', 
+              command=copy_to_clipboard, font=('Arial', 9),
+              bg='#17a2b8', fg='white', padx=15, pady=5).pack(side=tk.LEFT, padx=5)
+
+    tk.Button(export_buttons_frame, text='🖨️  Imprimir', 
+              command=print_result, font=('Arial', 9),
+              bg='#ffc107', fg='black', padx=15, pady=5).pack(side=tk.LEFT, padx=5)
+
+    tk.Button(export_buttons_frame, text='📊 Salvar PDF', 
+              command=export_to_pdf, font=('Arial', 9),
+              bg='#dc3545', fg='white', padx=15, pady=5).pack(side=tk.LEFT, padx=5)
+
+    tk.Button(export_buttons_frame, text='🗺️ Salvar SVG', 
+              command=export_to_svg, font=('Arial', 9),
+              bg='#20c997', fg='white', padx=15, pady=5).pack(side=tk.LEFT, padx=5)
+
+    tk.Button(export_buttons_frame, text='🐞 Salvar Perfil', 
+              command=export_profile, font=('Arial', 9),
+              bg='#6c757d', fg='white', padx=15, pady=5).pack(side=tk.LEFT, padx=5)
+
+    # Área de resultados
+    result_frame = tk.LabelFrame(main_frame, text="📊 RESULTADO", 
+                                font=('Arial', 12, 'bold'))
+    result_frame.pack(fill=tk.BOTH, expand=True)
+
+    summary_label = tk.Label(result_frame, text="", font=('Arial', 10, 'bold'), fg='#2E86AB')
+    summary_label.pack(anchor='w', padx=10, pady=(5, 0))
+
+    notebook = ttk.Notebook(result_frame)
+    notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+    # Aba 1: lista de faixas (paginada) à esquerda; desenho e detalhes da faixa à direita
+    panes = tk.PanedWindow(notebook, orient=tk.HORIZONTAL, sashrelief=tk.RAISED)
+    notebook.add(panes, text='📋 Faixas')
+
+    list_frame = tk.Frame(panes)
+    pager_frame = tk.Frame(list_frame)
+    pager_frame.pack(side=tk.BOTTOM, fill=tk.X, pady=(5, 0))
+    prev_button = tk.Button(pager_frame, text='◀', width=3,
+                            command=lambda: show_page(current_page - 1))
+    prev_button.pack(side=tk.LEFT)
+    next_button = tk.Button(pager_frame, text='▶', width=3,
+                            command=lambda: show_page(current_page + 1))
+    next_button.pack(side=tk.RIGHT)
+    page_label = tk.Label(pager_frame, text="", font=('Arial', 9))
+    page_label.pack(side=tk.LEFT, expand=True)
+
+    strip_tree = ttk.Treeview(list_frame, columns=list(STRIP_COLUMNS), show='headings',
+                              selectmode='browse')
+    for column, (title, width) in STRIP_COLUMNS.items():
+        strip_tree.heading(column, text=title)
+        strip_tree.column(column, width=width, anchor=tk.E)
+    tree_scroll = tk.Scrollbar(list_frame, orient=tk.VERTICAL, command=strip_tree.yview)
+    strip_tree.configure(yscrollcommand=tree_scroll.set)
+    tree_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+    strip_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    strip_tree.bind('<<TreeviewSelect>>', _on_strip_select)
+    panes.add(list_frame, minsize=300)
+
+    detail_frame = tk.Frame(panes)
+    strip_canvas = tk.Canvas(detail_frame, height=140, bg='white')
+    strip_canvas.pack(fill=tk.X)
+    strip_canvas.bind('<Configure>', _redraw_selected)
+    result = scrolledtext.ScrolledText(detail_frame, width=60, height=20, 
+                                     font=('Consolas', 10))
+    result.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
+    panes.add(detail_frame, minsize=300)
+
+    # Aba 2: plano inteiro em escala, com rolagem e zoom
+    roll_view = RollView(notebook)
+    notebook.add(roll_view, text='🗺️ Rolo completo')
+
+    # Instruções
+    instructions = tk.Label(main_frame, 
+                          text=("💡 Dica: Insira as dimensões das peças, calcule e "
+                               "use os botões de exportação para salvar/compartilhar! "
+                               "Algoritmo otimizado para máximo aproveitamento."),
+                          font=('Arial', 10), fg='#666666')
+    instructions.pack(pady=(10, 0))
+
+    root.mainloop()
@@ -0,0 +1,207 @@
+"""
+Exportação do plano em PDF, sem dependências externas.
+
+PDFWriter grava um PDF 1.4 mínimo em modo de fluxo: cada página é escrita no
+arquivo assim que fica pronta e só os deslocamentos dos objetos ficam na
+memória, então planos de centenas de páginas são exportados com memória
+limitada. write_plan_pdf() desenha o plano estruturado (plan_format) com
+uma página de resumo e cada faixa em escala, em vetor.
+"""
+
+import zlib
+from datetime import datetime
+
+from .roll_layout import PIECE_FILL, ROTATED_FILL, PIECE_OUTLINE, LEFTOVER_FILL, ROLL_OUTLINE
+
+PAGE_WIDTH = 595   # A4 em pontos
+PAGE_HEIGHT = 842
+MARGIN = 40
+MAX_STRIP_HEIGHT = 140  # altura máxima do desenho de uma faixa, em pontos
+
+# Objetos reservados: 1 = catálogo, 2 = árvore de páginas, 3 e 4 = fontes
+_CATALOG, _PAGES, _FONT, _FONT_BOLD = 1, 2, 3, 4
+
+
+def _rgb(color):
+    """'#2E86AB' → '0.180 0.525 0.671' (operandos de cor do PDF)"""
+    return ' '.join(f"{int(color[i:i + 2], 16) / 255:.3f}" for i in (1, 3, 5))
+
+
+def _text(value):
+    """Texto como string literal do PDF (WinAnsi; caracteres sem equivalente são omitidos)"""
+    data = str(value).encode('cp1252', errors='ignore')
+    data = data.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)')
+    return b'(' + data.strip() + b')'
+
+
+class PDFWriter:
+    """Escreve um PDF página a página em um arquivo binário já aberto"""
+
+    def __init__(self, f, title="Plano de corte"):
+        self.f = f
+        self.title = title
+        self.offsets = {}
+        self.pages = []
+        self.next_id = 5
+        self.position = 0
+        self._write(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+        self._object(_FONT, b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica '
+                            b'/Encoding /WinAnsiEncoding >>')
+        self._object(_FONT_BOLD, b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold '
+                                 b'/Encoding /WinAnsiEncoding >>')
+
+    def _write(self, data):
+        self.f.write(data)
+        self.position += len(data)
+
+    def _object(self, number, body):
+        self.offsets[number] = self.position
+        self._write(b'%d 0 obj\n' % number + body + b'\nendobj\n')
+
+    def _new_id(self):
+        self.next_id += 1
+        return self.next_id - 1
+
+    def add_page(self, content):
+        """Grava uma página com o fluxo de conteúdo (bytes) comprimido"""
+        stream = zlib.compress(content)
+        content_id = self._new_id()
+        self._object(content_id, b'<< /Length %d /Filter /FlateDecode >>\nstream\n'
+                     % len(stream) + stream + b'\nendstream')
+        page_id = self._new_id()
+        self._object(page_id, b'<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %d %d] '
+                              b'/Resources << /Font << /F1 %d 0 R /F2 %d 0 R >> >> '
+                              b'/Contents %d 0 R >>'
+                     % (_PAGES, PAGE_WIDTH, PAGE_HEIGHT, _FONT, _FONT_BOLD, content_id))
+        self.pages.append(page_id)
+
+    def close(self):
+        """Grava a árvore de páginas, o catálogo e a tabela de referências"""
+        kids = b' '.join(b'%d 0 R' % page for page in self.pages)
+        self._object(_PAGES, b'<< /Type /Pages /Kids [' + kids + b'] /Count %d >>'
+                     % len(self.pages))
+        self._object(_CATALOG, b'<< /Type /Catalog /Pages %d 0 R >>' % _PAGES)
+        info_id = self._new_id()
+        self._object(info_id, b'<< /Title ' + _text(self.title) + b' /Producer '
+                     + _text("Otimizador de Cortes de Mantas PRI") + b' >>')
+
+        xref = self.position
+        count = self.next_id
+        self._write(b'xref\n0 %d\n0000000000 65535 f \n' % count)
+        for number in range(1, count):
+            self._write(b'%010d 00000 n \n' % self.offsets[number])
+        self._write(b'trailer\n<< /Size %d /Root %d 0 R /Info %d 0 R >>\nstartxref\n%d\n%%%%EOF\n'
+                    % (count, _CATALOG, info_id, xref))
+
+
+class _Page:
+    """Fluxo de conteúdo de uma página, com coordenadas a partir do topo"""
+
+    def __init__(self):
+        self.ops = []
+
+    def text(self, x, y, value, size=9, bold=False, color='#000000'):
+        self.ops.append(b'%s rg BT /%s %d Tf %.2f %.2f Td %s Tj ET'
+                        % (_rgb(color).encode(), b'F2' if bold else b'F1', size,
+                           x, PAGE_HEIGHT - y, _text(value)))
+
+    def rect(self, x, y, width, height, fill=None, stroke=None):
+        op = b'B' if fill and stroke else b'f' if fill else b'S'
+        colors = b''
+        if fill:
+            colors += _rgb(fill).encode() + b' rg '
+        if stroke:
+            colors += _rgb(stroke).encode() + b' RG '
+        self.ops.append(colors + b'%.2f %.2f %.2f %.2f re %s'
+                        % (x, PAGE_HEIGHT - y - height, width, height, op))
+
+    def content(self):
+        return b'0.5 w\n' + b'\n'.join(self.ops)
+
+
+def write_plan_pdf(f, plan, pieces=None, title="PLANO DE CORTE OTIMIZADO"):
+    """
+    Grava o plano estruturado em PDF: página de resumo e as faixas em escala,
+    várias por página. f é um arquivo aberto em modo binário.
+    """
+    writer = PDFWriter(f, title)
+    roll_width = plan['roll']['width']
+    drawing_width = PAGE_WIDTH - 2 * MARGIN
+
+    # Página de resumo
+    page = _Page()
+    y = MARGIN + 10
+    page.text(MARGIN, y, title, size=16, bold=True)
+    y += 20
+    page.text(MARGIN, y, f"Data: {datetime.now().strftime('%d/%m/%Y %H:%M')}")
+    lines = [
+        f"Rolo: {roll_width} mm de largura"
+        + (f" x {plan['roll']['height']} mm" if plan['roll']['height'] else ""),
+        f"Refilo: {plan['roll'].get('trim', 0)} mm por borda - "
+        f"lâmina: {plan['roll'].get('kerf', 0)} mm - "
+        f"sobra mínima: {plan['roll'].get('min_offcut', 0)} mm",
+        f"Rolos necessários: {plan['rolls']}",
+        f"Faixas: {len(plan['rows'])}",
+        f"Peças: {plan['pieces']}",
+        f"Comprimento total: {plan['length']} mm",
+        f"Aproveitamento: {plan['utilization']:.1f}%",
+    ]
+    y += 30
+    for line in lines:
+        page.text(MARGIN, y, line, size=11)
+        y += 16
+    if pieces:
+        y += 14
+        page.text(MARGIN, y, "Peças do pedido", size=12, bold=True)
+        y += 16
+        for i, piece in enumerate(pieces, 1):
+            if y > PAGE_HEIGHT - MARGIN:
+                writer.add_page(page.content())
+                page = _Page()
+                y = MARGIN
+            page.text(MARGIN, y, f"{i}. {piece['w']} x {piece['h']} mm - {piece['qty']} unidades")
+            y += 13
+    writer.add_page(page.content())
+
+    # Faixas em escala, uma página de cada vez
+    page = _Page()
+    y = MARGIN
+    for row in plan['rows']:
+        scale = drawing_width / roll_width
+        if row['height'] * scale > MAX_STRIP_HEIGHT:
+            scale = MAX_STRIP_HEIGHT / row['height']
+        block = 16 + row['height'] * scale + 14 + 11 * ((len(row['items']) + 3) // 4) + 10
+        if y + block > PAGE_HEIGHT - MARGIN and page.ops:
+            writer.add_page(page.content())
+            page = _Page()
+            y = MARGIN
+
+        page.text(MARGIN, y + 9, f"Faixa {row['index']} - rolo {row['roll']} - "
+                                 f"altura {row['height']} mm - {row['used_width']} mm usados - "
+                                 f"{row['utilization']:.1f}%", size=10, bold=True)
+        y += 16
+        height = row['height'] * scale
+        page.rect(MARGIN, y, roll_width * scale, height, fill=LEFTOVER_FILL, stroke=ROLL_OUTLINE)
+        for number, item in enumerate(row['items'], 1):
+            x = MARGIN + item['x'] * scale
+            width = item['w'] * scale
+            page.rect(x, y, width, item['h'] * scale, stroke=PIECE_OUTLINE,
+                      fill=ROTATED_FILL if item['rotated'] else PIECE_FILL)
+            if width >= 10 and item['h'] * scale >= 10:
+                page.text(x + width / 2 - 3, y + item['h'] * scale / 2 + 3, number, size=8,
+                          color='#ffffff')
+        y += height + 14
+
+        # Lista das peças: posição e dimensões, quatro por linha
+        for start in range(0, len(row['items']), 4):
+            parts = []
+            for number, item in enumerate(row['items'][start:start + 4], start + 1):
+                turned = " (girada)" if item['rotated'] else ""
+                parts.append(f"[{number}] {item['orig_w']}x{item['orig_h']} em x={item['x']}{turned}")
+            page.text(MARGIN, y, "   ".join(parts), size=8)
+            y += 11
+        y += 10
+
+    if page.ops:
+        writer.add_page(page.content())
+    writer.close()
@@ -0,0 +1,170 @@
+"""
+Cache persistente de planos de corte, compartilhado entre GUI e CLI.
+
+Os planos ficam em um arquivo SQLite local, endereçados pelo hash das peças
+normalizadas, das dimensões do rolo, da estratégia e da versão do motor.
+O arquivo é limitado em tamanho (remove os planos usados há mais tempo) e
+pode ser acessado por vários processos ao mesmo tempo (modo WAL).
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import zlib
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 64 MB
+
+
+def default_path():
+    """Local do arquivo de cache (variável CUT_OPTIMIZER_CACHE ou ~/.cache)"""
+    path = os.environ.get('CUT_OPTIMIZER_CACHE')
+    if path:
+        return path
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'cut_optimizer', 'plans.sqlite3')
+
+
+def plan_key(pieces, roll_width, roll_height, strategy, engine_version):
+    """
+    Hash do pedido normalizado. Peças iguais são somadas e a ordem das linhas
+    não importa, então pedidos equivalentes compartilham o mesmo plano.
+    """
+    totals = {}
+    for p in pieces:
+        key = (p['w'], p['h'])
+        totals[key] = totals.get(key, 0) + p['qty']
+    order = {
+        'engine': engine_version,
+        'strategy': strategy,
+        'roll': [roll_width, roll_height],
+        'pieces': sorted([w, h, qty] for (w, h), qty in totals.items()),
+    }
+    text = json.dumps(order, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def encode_rows(rows):
+    """
+    Serializa as faixas de forma compacta: cada composição distinta de faixa
+    é guardada uma vez e o plano é a sequência de (composição, rolo).
+    """
+    templates = []
+    index = {}
+    sequence = []
+    for row in rows:
+        items = tuple((i['w'], i['h'], i['orig_w'], i['orig_h']) for i in row['items'])
+        if items not in index:
+            index[items] = len(templates)
+            templates.append(items)
+        sequence.append([index[items], row.get('roll')])
+    text = json.dumps({'templates': templates, 'rows': sequence}, separators=(',', ':'))
+    return zlib.compress(text.encode('utf-8'))
+
+
+def decode_rows(blob):
+    """Reconstrói as faixas serializadas por encode_rows()"""
+    data = json.loads(zlib.decompress(blob).decode('utf-8'))
+    shared = []
+    for template in data['templates']:
+        items = [{'w': w, 'h': h, 'orig_w': ow, 'orig_h': oh} for w, h, ow, oh in template]
+        shared.append((items, sum(i['w'] for i in items), max(i['h'] for i in items)))
+    rows = []
+    for t, roll in data['rows']:
+        items, used_width, height = shared[t]
+        row = {'items': items, 'used_width': used_width, 'height': height}
+        if roll is not None:
+            row['roll'] = roll
+        rows.append(row)
+    return rows
+
+
+class PlanCache:
+    """Cache de planos em SQLite com remoção dos menos usados recentemente"""
+
+    def __init__(self, path=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path or default_path()
+        self.max_bytes = max_bytes
+        self._ready = False
+
+    def _connect(self):
+        # Uma conexão por operação: segura entre threads e processos
+        if not self._ready:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        if not self._ready:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""CREATE TABLE IF NOT EXISTS plans (
+                                key TEXT PRIMARY KEY,
+                                data BLOB NOT NULL,
+                                size INTEGER NOT NULL,
+                                last_used REAL NOT NULL)""")
+            conn.execute("CREATE INDEX IF NOT EXISTS plans_last_used ON plans(last_used)")
+            self._ready = True
+        return conn
+
+    def get(self, key):
+        """Retorna as faixas do plano ou None se não estiver no cache"""
+        conn = self._connect()
+        try:
+            found = conn.execute("SELECT data FROM plans WHERE key = ?", (key,)).fetchone()
+            if found is None:
+                return None
+            conn.execute("UPDATE plans SET last_used = ? WHERE key = ?", (time.time(), key))
+            return decode_rows(found[0])
+        finally:
+            conn.close()
+
+    def put(self, key, rows):
+        """Armazena o plano e remove os mais antigos se passar do limite"""
+        blob = encode_rows(rows)
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("INSERT OR REPLACE INTO plans (key, data, size, last_used) "
+                         "VALUES (?, ?, ?, ?)", (key, blob, len(blob), time.time()))
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM plans").fetchone()[0]
+            if total > self.max_bytes:
+                for old_key, size in conn.execute(
+                        "SELECT key, size FROM plans WHERE key != ? ORDER BY last_used",
+                        (key,)).fetchall():
+                    conn.execute("DELETE FROM plans WHERE key = ?", (old_key,))
+                    total -= size
+                    if total <= self.max_bytes:
+                        break
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def clear(self):
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM plans")
+        finally:
+            conn.close()
+
+    def cached(self, pieces, roll_width, roll_height, strategy, engine_version, compute):
+        """
+        Retorna o plano do cache ou executa compute() e armazena o resultado.
+        Falhas do arquivo de cache nunca impedem o cálculo do plano.
+        """
+        key = plan_key(pieces, roll_width, roll_height, strategy, engine_version)
+        try:
+            rows = self.get(key)
+            if rows is not None:
+                return rows
+        except (sqlite3.Error, OSError, ValueError, zlib.error):
+            pass
+        rows = compute()
+        try:
+            self.put(key, rows)
+        except (sqlite3.Error, OSError):
+            pass
+        return rows
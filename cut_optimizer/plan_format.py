@@ -0,0 +1,188 @@
+"""
+Formato estruturado do plano de corte, para máquinas de corte e ERP.
+
+build_plan() descreve o plano com posições explícitas: cada faixa tem rolo,
+posição ao longo do rolo (y) e altura; cada peça tem posição na largura (x),
+dimensões cortadas, dimensões originais e se foi rotacionada. As posições já
+descontam o refilo e a lâmina (plan['roll']: 'trim', 'kerf', 'min_offcut').
+O plano pode ser gravado como JSON (legível) ou em binário compacto
+(struct/array), e o relatório em texto passa a ser apenas uma renderização
+opcional.
+
+Binário (little-endian, versão 2):
+
+    cabeçalho   '<4sHIIIIIII'  b'CUTP', versão, largura do rolo, comprimento
+                               do rolo (0 = sem limite), nº de composições,
+                               nº de faixas, lâmina, refilo, sobra mínima
+    composição  '<I'           nº de peças, seguido de '<IIIB' por peça:
+                               x, largura, altura, rotacionada
+    faixas      array('I')     pares (composição, rolo), na ordem do plano
+
+Arquivos da versão 1 (cabeçalho '<4sHIIII', sem perdas de corte) continuam
+sendo lidos.
+
+Faixas repetidas compartilham a mesma composição, então planos grandes e
+repetitivos ocupam poucos bytes.
+"""
+
+import json
+import struct
+import sys
+from array import array
+
+from .engine import NO_CUTS, CutSettings
+
+PLAN_FORMAT = 'cut-optimizer-plan'
+PLAN_VERSION = 2
+
+_MAGIC = b'CUTP'
+_HEADER = struct.Struct('<4sHIIIIIII')
+_HEADER_V1 = struct.Struct('<4sHIIII')
+_COUNT = struct.Struct('<I')
+_ITEM = struct.Struct('<IIIB')
+
+
+def _layout(items, cuts):
+    """Peças da faixa com posição x e indicação de rotação"""
+    return [{
+        'x': x,
+        'w': item['w'],
+        'h': item['h'],
+        'orig_w': item['orig_w'],
+        'orig_h': item['orig_h'],
+        'rotated': item['w'] != item['orig_w'],
+    } for item, x in zip(items, cuts.positions(items))]
+
+
+def plan_cuts(plan):
+    """Perdas de corte (CutSettings) de um plano estruturado"""
+    roll = plan['roll']
+    return CutSettings(roll.get('kerf', 0), roll.get('trim', 0), roll.get('min_offcut', 0))
+
+
+def build_plan(rows, roll_width, roll_height=None, cuts=None):
+    """
+    Converte as faixas de pack_pieces() no plano estruturado (dicionário
+    pronto para json.dump). Posições em mm; y é contado a partir do início
+    de cada rolo. Com cuts (CutSettings), x começa depois do refilo e há
+    um kerf entre peças vizinhas e entre faixas vizinhas do mesmo rolo.
+    """
+    cuts = cuts or NO_CUTS
+    plan_rows = []
+    layouts = {}  # composições já posicionadas (faixas repetidas)
+    offsets = {}  # comprimento já usado de cada rolo
+    used_area = 0
+
+    for index, row in enumerate(rows, 1):
+        roll = row.get('roll', 1)
+        key = id(row['items'])
+        if key not in layouts:
+            layouts[key] = _layout(row['items'], cuts)
+        area = sum(item['w'] * item['h'] for item in row['items'])
+        used_area += area
+        y = offsets[roll] + cuts.kerf if roll in offsets else 0
+        offsets[roll] = y + row['height']
+        plan_rows.append({
+            'index': index,
+            'roll': roll,
+            'y': y,
+            'height': row['height'],
+            'used_width': row['used_width'],
+            'utilization': round(area / (roll_width * row['height']) * 100, 2),
+            'items': layouts[key],
+        })
+
+    length = sum(offsets.values())
+    return {
+        'format': PLAN_FORMAT,
+        'version': PLAN_VERSION,
+        'roll': dict({'width': roll_width, 'height': roll_height}, **cuts.to_dict()),
+        'rolls': max(offsets, default=0),
+        'length': length,
+        'pieces': sum(len(row['items']) for row in rows),
+        'utilization': round(used_area / (roll_width * length) * 100, 2) if length else 0,
+        'rows': plan_rows,
+    }
+
+
+def plan_rows(plan):
+    """Faixas no formato de pack_pieces() a partir de um plano estruturado"""
+    rows = []
+    for row in plan['rows']:
+        items = [{'w': i['w'], 'h': i['h'], 'orig_w': i['orig_w'], 'orig_h': i['orig_h']}
+                 for i in row['items']]
+        rows.append({'items': items, 'used_width': row['used_width'],
+                     'height': row['height'], 'roll': row['roll']})
+    return rows
+
+
+def write_json(plan, f):
+    """Grava o plano em JSON (uma faixa por linha, para diffs legíveis)"""
+    body = {k: v for k, v in plan.items() if k != 'rows'}
+    text = json.dumps(body, ensure_ascii=False)
+    f.write(text[:-1] + ', "rows": [\n')
+    for i, row in enumerate(plan['rows']):
+        f.write(('  ' if i == 0 else ', ') + json.dumps(row, separators=(',', ':')) + '\n')
+    f.write(']}\n')
+
+
+def encode_binary(plan):
+    """Serializa o plano no formato binário compacto (bytes)"""
+    templates = {}
+    chunks = []
+    refs = array('I')
+    for row in plan['rows']:
+        key = tuple((i['x'], i['w'], i['h'], i['rotated']) for i in row['items'])
+        if key not in templates:
+            templates[key] = len(templates)
+            chunks.append(_COUNT.pack(len(key)))
+            chunks.extend(_ITEM.pack(*item) for item in key)
+        refs.append(templates[key])
+        refs.append(row['roll'])
+    if sys.byteorder != 'little':
+        refs.byteswap()
+    roll = plan['roll']
+    cuts = plan_cuts(plan)
+    header = _HEADER.pack(_MAGIC, PLAN_VERSION, roll['width'], roll['height'] or 0,
+                          len(templates), len(plan['rows']),
+                          cuts.kerf, cuts.trim, cuts.min_offcut)
+    return header + b''.join(chunks) + refs.tobytes()
+
+
+def decode_binary(data):
+    """Reconstrói o plano estruturado a partir de encode_binary()"""
+    magic, version = struct.unpack_from('<4sH', data, 0)
+    if magic != _MAGIC or version not in (1, PLAN_VERSION):
+        raise ValueError("Arquivo de plano binário inválido ou de versão desconhecida")
+    if version == 1:
+        _, _, roll_width, roll_height, n_templates, n_rows = _HEADER_V1.unpack_from(data, 0)
+        cuts = NO_CUTS
+        offset = _HEADER_V1.size
+    else:
+        (_, _, roll_width, roll_height, n_templates, n_rows,
+         kerf, trim, min_offcut) = _HEADER.unpack_from(data, 0)
+        cuts = CutSettings(kerf, trim, min_offcut)
+        offset = _HEADER.size
+
+    templates = []
+    for _ in range(n_templates):
+        (count,) = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+        items = []
+        for _ in range(count):
+            x, w, h, rotated = _ITEM.unpack_from(data, offset)
+            offset += _ITEM.size
+            orig_w, orig_h = (h, w) if rotated else (w, h)
+            items.append({'w': w, 'h': h, 'orig_w': orig_w, 'orig_h': orig_h})
+        templates.append({'items': items, 'used_width': sum(i['w'] for i in items),
+                          'height': max((i['h'] for i in items), default=0)})
+
+    refs = array('I')
+    refs.frombytes(data[offset:offset + 2 * n_rows * refs.itemsize])
+    if sys.byteorder != 'little':
+        refs.byteswap()
+    rows = []
+    for i in range(n_rows):
+        template = templates[refs[2 * i]]
+        rows.append(dict(template, roll=refs[2 * i + 1]))
+    return build_plan(rows, roll_width, roll_height or None, cuts)
@@ -0,0 +1,120 @@
+"""
+Impressão do relatório pelo spooler do sistema (lpr), sem arquivo temporário.
+
+O relatório é gerado em partes (engine.iter_report), agrupado em páginas
+separadas por quebra de página (form feed) e escrito direto na entrada
+padrão do spooler por um pipe, página a página. Planos longos não são
+montados inteiros na memória e impressões simultâneas não disputam arquivo.
+
+O comando vem da variável CUT_OPTIMIZER_PRINT_COMMAND (por exemplo
+"lpr -P plotter" ou, para testes, "cat" ou "tee /tmp/impressao.txt") ou,
+se ela não estiver definida, de PRINT_COMMAND.
+"""
+
+import os
+import shlex
+import subprocess
+from datetime import datetime
+
+from .engine import iter_report
+
+PRINT_COMMAND = 'lpr'
+PAGE_LINES = 60  # linhas por página impressa
+ENCODING = 'utf-8'
+
+
+def print_command():
+    """Comando do spooler como lista de argumentos"""
+    command = os.environ.get('CUT_OPTIMIZER_PRINT_COMMAND') or PRINT_COMMAND
+    return shlex.split(command) if isinstance(command, str) else list(command)
+
+
+def iter_pages(chunks, lines_per_page=PAGE_LINES):
+    """
+    Reagrupa partes de texto em páginas de lines_per_page linhas.
+    Cada página (exceto a última) termina com '\\f'.
+    """
+    lines = []
+    pending = ''
+    for chunk in chunks:
+        parts = (pending + chunk).split('\n')
+        pending = parts.pop()
+        lines.extend(parts)
+        # Só fecha uma página quando já há texto depois dela
+        while len(lines) > lines_per_page:
+            yield '\n'.join(lines[:lines_per_page]) + '\n\f'
+            del lines[:lines_per_page]
+    if pending:
+        lines.append(pending)
+    while lines:
+        page = lines[:lines_per_page]
+        del lines[:lines_per_page]
+        yield '\n'.join(page) + ('\n\f' if lines else '\n')
+
+
+def iter_print_job(pieces, rows, roll_width, roll_height=None, cuts=None):
+    """Texto impresso: cabeçalho com a data seguido do relatório completo"""
+    yield "PLANO DE CORTE OTIMIZADO\n"
+    yield "=" * 50 + "\n"
+    yield f"Data: {datetime.now().strftime('%d/%m/%Y %H:%M')}\n\n"
+    yield from iter_report(pieces, rows, roll_width, roll_height, cuts)
+
+
+def spool(chunks, command=None, progress=None, lines_per_page=PAGE_LINES):
+    """
+    Envia o texto (partes de str) ao spooler pela entrada padrão, página a página.
+
+    Args:
+        command: lista de argumentos ou string; padrão print_command()
+        progress: chamada com o número de páginas já enviadas
+
+    Returns:
+        Número de páginas enviadas
+
+    Raises:
+        RuntimeError: se o spooler não existir ou terminar com erro
+    """
+    if command is None:
+        command = print_command()
+    elif isinstance(command, str):
+        command = shlex.split(command)
+
+    try:
+        process = subprocess.Popen(command, stdin=subprocess.PIPE,
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    except OSError as e:
+        raise RuntimeError(f"Não foi possível executar o spooler {command[0]!r}: {e}") from e
+
+    pages = 0
+    try:
+        for page in iter_pages(chunks, lines_per_page):
+            process.stdin.write(page.encode(ENCODING))
+            pages += 1
+            if progress:
+                progress(pages)
+        process.stdin.close()
+    except BrokenPipeError:
+        pass  # o spooler terminou antes; o código de saída diz o motivo
+    except BaseException:
+        process.kill()
+        process.wait()
+        raise
+    finally:
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+    # stderr só é lido no fim: o spooler escreve pouco nele
+    errors = process.stderr.read().decode(ENCODING, errors='replace').strip()
+    process.stderr.close()
+    if process.wait() != 0:
+        raise RuntimeError(f"O spooler {command[0]!r} terminou com código "
+                           f"{process.returncode}" + (f":\n{errors}" if errors else ""))
+    return pages
+
+
+def print_report(pieces, rows, roll_width, roll_height=None, command=None, progress=None,
+                 cuts=None):
+    """Imprime o relatório do plano; retorna o número de páginas enviadas"""
+    return spool(iter_print_job(pieces, rows, roll_width, roll_height, cuts),
+                 command=command, progress=progress)
@@ -0,0 +1,137 @@
+"""
+Instrumentação opcional do motor, para descobrir onde vai o tempo de um plano.
+
+Desligada por padrão: o motor consulta `profiling.current()` uma vez por
+faixa ou por chamada, então sem perfil o custo é desprezível. Para coletar:
+
+    with profiling.profile() as stats:
+        rows = pack_pieces(pieces, 1050)
+        create_report(pieces, rows, 1050)
+    stats.write_json(open('perfil.json', 'w'))
+
+São registrados o tempo, as combinações avaliadas, os ramos podados e os
+acertos do cache de faixas de cada faixa resolvida, o tempo de cada fase
+(empacotamento, mestre e precificação dos padrões, distribuição em rolos,
+relatório) e, com cprofile=True, um perfil cProfile da coleta inteira.
+
+A coleta vale só para a thread que entrou em profile(): outras threads
+planejando ao mesmo tempo não entram no perfil (nem em perfis próprios,
+que ficam separados), e a busca paralela em vários processos também não.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+# json e cProfile são importados só por write_json() e profile(cprofile=True):
+# o motor importa este módulo, e importar o motor deve continuar barato
+
+
+class _Active(threading.local):
+    stats = None  # PlanStats em coleta nesta thread, ou None (perfil desligado)
+
+
+_active = _Active()
+
+SLOWEST_ROWS = 10  # faixas mais lentas listadas no resumo
+
+
+class PlanStats:
+    """Contadores, tempos por fase e registro de cada faixa resolvida"""
+
+    def __init__(self):
+        self.counters = {}
+        self.phases = {}
+        self.rows = []
+        self.profiler = None
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def add_phase(self, name, seconds):
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, name):
+        """Soma o tempo do bloco à fase name"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(name, time.perf_counter() - start)
+
+    def mark(self):
+        """Contadores de busca no início de uma faixa (ver row())"""
+        return self.counters.get('candidates', 0), self.counters.get('pruned', 0)
+
+    def row(self, solver, seconds, cached, mark, repeat, pieces):
+        """Registra uma faixa resolvida; mark é o valor de mark() antes da busca"""
+        candidates, pruned = self.mark()
+        self.rows.append({
+            'solver': solver,
+            'seconds': round(seconds, 6),
+            'cached': cached,
+            'candidates': candidates - mark[0],
+            'pruned': pruned - mark[1],
+            'pieces': pieces,
+            'repeat': repeat,
+        })
+
+    def summary(self):
+        """Totais e as faixas mais lentas"""
+        slowest = sorted(range(len(self.rows)), key=lambda i: -self.rows[i]['seconds'])
+        return {
+            'rows_solved': len(self.rows),
+            'rows_cached': sum(1 for row in self.rows if row['cached']),
+            'row_seconds': round(sum(row['seconds'] for row in self.rows), 6),
+            'slowest_rows': [dict(self.rows[i], solve=i + 1) for i in slowest[:SLOWEST_ROWS]],
+        }
+
+    def to_dict(self):
+        return {
+            'summary': self.summary(),
+            'phases': {name: round(seconds, 6) for name, seconds in self.phases.items()},
+            'counters': dict(self.counters),
+            'rows': self.rows,
+        }
+
+    def write_json(self, f):
+        """Grava o perfil em JSON (resumo, fases, contadores e uma faixa por linha)"""
+        import json
+        
+        data = self.to_dict()
+        rows = data.pop('rows')
+        text = json.dumps(data, ensure_ascii=False, indent=1)
+        f.write(text[:-2] + ',\n "rows": [\n')
+        for i, row in enumerate(rows):
+            f.write(('  ' if i == 0 else ', ') + json.dumps(row, separators=(',', ':')) + '\n')
+        f.write(']}\n')
+
+    def dump_cprofile(self, path):
+        """Grava o perfil cProfile (abrir com pstats ou snakeviz)"""
+        if self.profiler is None:
+            raise ValueError("Perfil coletado sem cProfile (use profile(cprofile=True))")
+        self.profiler.dump_stats(path)
+
+
+def current():
+    """PlanStats em coleta na thread atual, ou None (perfil desligado)"""
+    return _active.stats
+
+
+@contextmanager
+def profile(stats=None, cprofile=False):
+    """Liga a coleta na thread atual durante o bloco e devolve o PlanStats"""
+    stats = stats or PlanStats()
+    previous = _active.stats
+    _active.stats = stats
+    if cprofile:
+        import cProfile
+        stats.profiler = stats.profiler or cProfile.Profile()
+        stats.profiler.enable()
+    try:
+        yield stats
+    finally:
+        if cprofile:
+            stats.profiler.disable()
+        _active.stats = previous
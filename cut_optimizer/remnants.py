@@ -0,0 +1,248 @@
+"""
+Estoque persistente de sobras de largura, usado pelo planejamento em lote (CLI).
+
+Cada faixa que não ocupa a largura toda do rolo deixa uma sobra (o "ESPAÇO
+NÃO UTILIZADO" do relatório). O estoque guarda as sobras aproveitáveis em um
+arquivo SQLite local, indexado por (largura, comprimento): buscas por faixas
+de medidas percorrem só o trecho do índice que interessa, então continuam
+rápidas com milhares de sobras. Antes de abrir rolo novo, o planejador corta
+o que puder do pedido nessas sobras (ver RemnantStore.reserve()). Como o
+cache de planos, o arquivo pode ser acessado por vários processos ao mesmo
+tempo (modo WAL).
+
+A interface gráfica não usa o estoque: cada novo cálculo daria baixa em
+sobras para planos que talvez nunca sejam cortados.
+"""
+
+import json
+import os
+import sqlite3
+import time
+
+from .engine import NO_CUTS, CutSettings, fill_remnants
+from .plan_format import build_plan
+
+MIN_REMNANT = 100  # menor largura e comprimento de sobra guardados, em mm
+
+
+def default_path():
+    """Local do estoque (variável CUT_OPTIMIZER_REMNANTS ou ~/.local/share)"""
+    path = os.environ.get('CUT_OPTIMIZER_REMNANTS')
+    if path:
+        return path
+    base = os.environ.get('XDG_DATA_HOME') or os.path.join(os.path.expanduser('~'),
+                                                           '.local', 'share')
+    return os.path.join(base, 'cut_optimizer', 'remnants.sqlite3')
+
+
+def plan_remnants(rows, roll_width, cuts=None, min_size=MIN_REMNANT):
+    """
+    Sobras aproveitáveis de um plano, (largura, comprimento) por faixa: a
+    largura depois do corte que separa a última peça, se tiver ao menos
+    min_size (e a sobra mínima de cuts), com a altura da faixa
+    """
+    cuts = cuts or NO_CUTS
+    min_width = max(min_size, cuts.min_offcut)
+    found = []
+    for row in rows:
+        width = cuts.offcut(row, roll_width)
+        if width >= min_width and row['height'] >= min_size:
+            found.append((width, row['height']))
+    return found
+
+
+def write_uses_json(uses, f, cuts=None):
+    """
+    Grava em JSON as sobras usadas em um pedido (uma sobra por linha), com as
+    faixas e posições de corte de cada uma como em build_plan()
+    """
+    remnant_cuts = CutSettings(cuts.kerf if cuts else 0)  # sobras não têm refilo
+    f.write('{"remnants": [\n')
+    for i, use in enumerate(uses):
+        plan = build_plan(use['rows'], use['width'], use['length'], remnant_cuts)
+        entry = {
+            'remnant': use['remnant'],
+            'width': use['width'],
+            'length': use['length'],
+            'used_length': use['used_length'],
+            'pieces': plan['pieces'],
+            'rows': [{k: v for k, v in row.items() if k != 'roll'} for row in plan['rows']],
+        }
+        f.write(('  ' if i == 0 else ', ') + json.dumps(entry, separators=(',', ':')) + '\n')
+    f.write(']}\n')
+
+
+class RemnantStore:
+    """Estoque de sobras em SQLite, consultado por faixas de largura e comprimento"""
+
+    def __init__(self, path=None, min_size=MIN_REMNANT):
+        self.path = path or default_path()
+        self.min_size = min_size
+        self._ready = False
+
+    def _connect(self):
+        # Uma conexão por operação: segura entre threads e processos
+        if not self._ready:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        if not self._ready:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""CREATE TABLE IF NOT EXISTS remnants (
+                                id INTEGER PRIMARY KEY,
+                                width INTEGER NOT NULL,
+                                length INTEGER NOT NULL,
+                                source TEXT,
+                                created REAL NOT NULL)""")
+            conn.execute("CREATE INDEX IF NOT EXISTS remnants_size "
+                         "ON remnants(width, length)")
+            self._ready = True
+        return conn
+
+    def add(self, width, length, source=None):
+        """Guarda uma sobra e retorna o seu número"""
+        if width <= 0 or length <= 0:
+            raise ValueError(f"Sobra inválida: {width}×{length}mm")
+        conn = self._connect()
+        try:
+            return conn.execute("INSERT INTO remnants (width, length, source, created) "
+                                "VALUES (?, ?, ?, ?)",
+                                (width, length, source, time.time())).lastrowid
+        finally:
+            conn.close()
+
+    def add_plan(self, rows, roll_width, cuts=None, source=None):
+        """Guarda as sobras aproveitáveis do plano (plan_remnants()); retorna quantas"""
+        found = plan_remnants(rows, roll_width, cuts, self.min_size)
+        if not found:
+            return 0
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany("INSERT INTO remnants (width, length, source, created) "
+                             "VALUES (?, ?, ?, ?)",
+                             [(width, length, source, now) for width, length in found])
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        return len(found)
+
+    def find(self, min_width=0, min_length=0, max_width=None, max_length=None, limit=None):
+        """
+        Sobras com largura e comprimento nas faixas pedidas (limites
+        inclusivos), da mais estreita para a mais larga e, na mesma largura,
+        da mais curta para a mais longa
+        """
+        query = ("SELECT id, width, length, source, created FROM remnants "
+                 "WHERE width >= ? AND length >= ?")
+        params = [min_width, min_length]
+        if max_width is not None:
+            query += " AND width <= ?"
+            params.append(max_width)
+        if max_length is not None:
+            query += " AND length <= ?"
+            params.append(max_length)
+        query += " ORDER BY width, length, id"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        conn = self._connect()
+        try:
+            return [{'id': id_, 'width': width, 'length': length, 'source': source,
+                     'created': created}
+                    for id_, width, length, source, created in conn.execute(query, params)]
+        finally:
+            conn.close()
+
+    def remove(self, remnant_id):
+        """Tira uma sobra do estoque; retorna False se ela não existir"""
+        conn = self._connect()
+        try:
+            return conn.execute("DELETE FROM remnants WHERE id = ?",
+                                (remnant_id,)).rowcount > 0
+        finally:
+            conn.close()
+
+    def count(self):
+        conn = self._connect()
+        try:
+            return conn.execute("SELECT COUNT(*) FROM remnants").fetchone()[0]
+        finally:
+            conn.close()
+
+    def clear(self):
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM remnants")
+        finally:
+            conn.close()
+
+    def reserve(self, pieces, cuts=None):
+        """
+        Corta o que for possível do pedido nas sobras do estoque, das mais
+        estreitas para as mais largas (fill_remnants()), e dá baixa nas
+        sobras usadas. O comprimento que sobra de uma sobra usada continua
+        no estoque, com o mesmo número, se ainda tiver ao menos min_size.
+
+        Só entram na busca as sobras em que o menor lado da menor peça cabe,
+        lidas pelo índice. Busca e baixa acontecem na mesma transação, então
+        processos em paralelo nunca usam a mesma sobra. Se o plano não for
+        usado (erro ao calcular ou gravar), release(usos) desfaz a baixa.
+
+        Returns:
+            (usos, peças restantes), como em fill_remnants(); cada uso guarda
+            também 'source' e 'created' da sobra, para release()
+        """
+        if not pieces:
+            return [], []
+        kerf = cuts.kerf if cuts else 0
+        smallest = min(min(p['w'], p['h']) for p in pieces)
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            found = conn.execute(
+                "SELECT id, width, length, source, created FROM remnants "
+                "WHERE width >= ? AND length >= ? ORDER BY width, length, id",
+                (smallest, smallest)).fetchall()
+            uses, rest = fill_remnants(pieces, [row[:3] for row in found], cuts)
+            origin = {row[0]: row[3:] for row in found}
+            for use in uses:
+                use['source'], use['created'] = origin[use['remnant']]
+                # Um corte de lâmina separa o trecho usado do resto da sobra
+                tail = use['length'] - use['used_length'] - kerf
+                if tail >= self.min_size:
+                    conn.execute("UPDATE remnants SET length = ? WHERE id = ?",
+                                 (tail, use['remnant']))
+                else:
+                    conn.execute("DELETE FROM remnants WHERE id = ?", (use['remnant'],))
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        return uses, rest
+
+    def release(self, uses):
+        """Devolve ao estoque, com as medidas e números originais, as sobras de reserve()"""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany("INSERT OR REPLACE INTO remnants "
+                             "(id, width, length, source, created) VALUES (?, ?, ?, ?, ?)",
+                             [(use['remnant'], use['width'], use['length'], use['source'],
+                               use['created']) for use in uses])
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
@@ -0,0 +1,99 @@
+"""
+Geometria do desenho do plano inteiro e exportação em SVG.
+
+As faixas são desenhadas em escala, rolo após rolo, ao longo do comprimento
+(eixo y, em mm). layout_plan() calcula a posição de cada faixa no desenho e
+visible_range() encontra por busca binária só as faixas dentro de uma janela,
+para que a interface desenhe apenas o que está visível.
+"""
+
+from bisect import bisect_left, bisect_right
+from xml.sax.saxutils import escape
+
+ROLL_GAP = 200  # espaço entre rolos no desenho, em mm
+
+# Cores compartilhadas pelo canvas e pelo SVG
+PIECE_FILL = '#2E86AB'
+ROTATED_FILL = '#f4a261'
+PIECE_OUTLINE = '#1b4f72'
+LEFTOVER_FILL = '#eeeeee'
+ROLL_OUTLINE = '#666666'
+
+
+def layout_plan(plan):
+    """
+    Posições das faixas de um plano estruturado (plan_format.build_plan) no desenho.
+
+    Returns:
+        (starts, spans, total): starts[i] é o y da faixa plan['rows'][i];
+        spans lista (rolo, y inicial, comprimento) de cada rolo; total é a
+        altura do desenho em mm
+    """
+    starts = []
+    spans = []
+    y = 0
+    kerf = plan['roll'].get('kerf', 0)  # corte entre faixas vizinhas do mesmo rolo
+    for row in plan['rows']:
+        if not spans or spans[-1][0] != row['roll']:
+            if spans:
+                y += ROLL_GAP
+            spans.append([row['roll'], y, 0])
+        elif kerf:
+            y += kerf
+            spans[-1][2] += kerf
+        starts.append(y)
+        y += row['height']
+        spans[-1][2] += row['height']
+    return starts, [tuple(span) for span in spans], y
+
+
+def visible_range(starts, top, bottom):
+    """Índices [primeiro, último) das faixas que cruzam a janela [top, bottom) em mm"""
+    first = max(bisect_right(starts, top) - 1, 0)
+    last = bisect_left(starts, bottom)
+    return first, last
+
+
+def write_svg(plan, f, margin=20):
+    """
+    Grava o plano inteiro em SVG (unidades em mm), faixa a faixa.
+    Cada composição distinta de faixa vira um <symbol> reutilizado com <use>,
+    então planos longos e repetitivos geram arquivos pequenos.
+    """
+    roll_width = plan['roll']['width']
+    starts, spans, total = layout_plan(plan)
+    width = roll_width + 2 * margin
+    height = total + 2 * margin
+
+    f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    f.write(f'<svg xmlns="http://www.w3.org/2000/svg" '
+            f'xmlns:xlink="http://www.w3.org/1999/xlink" '
+            f'width="{width}mm" height="{height}mm" viewBox="0 0 {width} {height}">\n')
+    f.write(f'<g transform="translate({margin},{margin})" font-family="Arial">\n')
+
+    for roll, y, length in spans:
+        f.write(f'<rect x="0" y="{y}" width="{roll_width}" height="{length}" '
+                f'fill="{LEFTOVER_FILL}" stroke="{ROLL_OUTLINE}"/>\n')
+        f.write(f'<text x="-4" y="{y + 12}" font-size="12" text-anchor="end">'
+                f'{escape(f"Rolo {roll}")}</text>\n')
+
+    symbols = {}
+    for row, y in zip(plan['rows'], starts):
+        key = tuple((i['x'], i['w'], i['h'], i['rotated']) for i in row['items'])
+        symbol = symbols.get(key)
+        if symbol is None:
+            symbol = symbols[key] = f"s{len(symbols)}"
+            f.write(f'<defs><symbol id="{symbol}" overflow="visible">')
+            for number, (x, w, h, rotated) in enumerate(key, 1):
+                fill = ROTATED_FILL if rotated else PIECE_FILL
+                f.write(f'<rect x="{x}" y="0" width="{w}" height="{h}" fill="{fill}" '
+                        f'stroke="{PIECE_OUTLINE}"/>')
+                f.write(f'<text x="{x + w / 2}" y="{h / 2}" font-size="{min(24, h / 3, w / 4):.1f}" '
+                        f'fill="white" text-anchor="middle" dominant-baseline="middle">'
+                        f'{number}</text>')
+            f.write('</symbol></defs>\n')
+        f.write(f'<use xlink:href="#{symbol}" y="{y}"/>'
+                f'<line x1="0" y1="{y + row["height"]}" x2="{roll_width}" '
+                f'y2="{y + row["height"]}" stroke="{ROLL_OUTLINE}" stroke-width="0.5"/>\n')
+
+    f.write('</g>\n</svg>\n')
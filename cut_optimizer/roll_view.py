@@ -0,0 +1,208 @@
+"""
+Visualização gráfica do plano inteiro (tk.Canvas) com rolagem e zoom.
+
+Só as faixas dentro da área visível são desenhadas, e o nível de detalhe
+depende do zoom: faixas com menos de um pixel de altura são agrupadas, as
+peças só aparecem quando a faixa tem altura suficiente e os números só
+quando cabem na peça. Assim o número de itens no canvas depende do tamanho
+da janela, não do comprimento do plano.
+"""
+
+import tkinter as tk
+
+from .roll_layout import (layout_plan, visible_range, PIECE_FILL, ROTATED_FILL,
+                          PIECE_OUTLINE, LEFTOVER_FILL, ROLL_OUTLINE)
+
+PAD = 40             # margem do desenho em pixels (espaço para "Rolo n")
+MAX_SCALE = 10.0     # zoom máximo, em pixels por mm
+PIECE_MIN_PX = 4     # altura mínima da faixa para desenhar as peças
+LABEL_MIN_PX = 14    # tamanho mínimo da peça para desenhar o número
+
+
+class RollView(tk.Frame):
+    """Canvas com o desenho do plano inteiro, em escala"""
+
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.plan = None
+        self.starts = []
+        self.spans = []
+        self.total = 0
+        self.scale = None  # pixels por mm (None = ajustar à largura)
+        self.top = 0.0     # y (mm) no topo da janela
+        self.selected = None
+        self._pending = False
+
+        toolbar = tk.Frame(self)
+        toolbar.pack(side=tk.TOP, fill=tk.X)
+        tk.Button(toolbar, text='➖', width=3, command=lambda: self.zoom(1 / 1.5)).pack(side=tk.LEFT)
+        tk.Button(toolbar, text='➕', width=3, command=lambda: self.zoom(1.5)).pack(side=tk.LEFT)
+        tk.Button(toolbar, text='Ajustar à largura', command=self.fit_width).pack(side=tk.LEFT, padx=5)
+        self.info = tk.Label(toolbar, text="", font=('Arial', 9), fg='#666666')
+        self.info.pack(side=tk.LEFT, padx=10)
+
+        self.scrollbar = tk.Scrollbar(self, orient=tk.VERTICAL, command=self.yview)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas = tk.Canvas(self, bg='white', highlightthickness=0)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.canvas.bind('<Configure>', lambda e: self.schedule())
+        self.canvas.bind('<MouseWheel>', self._on_wheel)
+        self.canvas.bind('<Button-4>', lambda e: self._scroll_px(-60))
+        self.canvas.bind('<Button-5>', lambda e: self._scroll_px(60))
+        self.canvas.bind('<Control-MouseWheel>',
+                         lambda e: self.zoom(1.25 if e.delta > 0 else 0.8, e.y))
+        self.canvas.bind('<Control-Button-4>', lambda e: self.zoom(1.25, e.y))
+        self.canvas.bind('<Control-Button-5>', lambda e: self.zoom(0.8, e.y))
+
+    # ---- Dados e navegação ----
+
+    def set_plan(self, plan):
+        """Mostra um novo plano estruturado (plan_format.build_plan)"""
+        self.plan = plan
+        self.starts, self.spans, self.total = layout_plan(plan)
+        self.scale = None
+        self.top = 0.0
+        self.selected = None
+        self.schedule()
+
+    def _size(self):
+        return max(self.canvas.winfo_width(), 100), max(self.canvas.winfo_height(), 100)
+
+    def _scale(self):
+        if self.scale is None:  # ajustado à largura
+            width, _ = self._size()
+            return (width - 2 * PAD) / self.plan['roll']['width']
+        return self.scale
+
+    def _view_mm(self):
+        """Altura da janela em mm na escala atual"""
+        return (self._size()[1] - 2 * PAD) / self._scale()
+
+    def _clamp(self):
+        self.top = max(0.0, min(self.top, self.total - self._view_mm()))
+
+    def fit_width(self):
+        self.scale = None
+        self.schedule()
+
+    def zoom(self, factor, anchor_px=None):
+        """Aproxima/afasta mantendo fixo o ponto sob anchor_px (padrão: centro)"""
+        if self.plan is None:
+            return
+        _, height = self._size()
+        anchor_px = height / 2 if anchor_px is None else anchor_px
+        old = self._scale()
+        anchor_mm = self.top + (anchor_px - PAD) / old
+        min_scale = (height - 2 * PAD) / max(self.total, 1)
+        self.scale = max(min_scale, min(old * factor, MAX_SCALE))
+        self.top = anchor_mm - (anchor_px - PAD) / self.scale
+        self.schedule()
+
+    def yview(self, *args):
+        """Comando da barra de rolagem ('moveto', fração) ou ('scroll', n, unidade)"""
+        if self.plan is None or not args:
+            return
+        if args[0] == 'moveto':
+            self.top = float(args[1]) * self.total
+        elif args[0] == 'scroll':
+            step = self._view_mm() * (0.9 if args[2] == 'pages' else 0.1)
+            self.top += int(args[1]) * step
+        self.schedule()
+
+    def _scroll_px(self, pixels):
+        if self.plan is not None:
+            self.top += pixels / self._scale()
+            self.schedule()
+
+    def _on_wheel(self, event):
+        self._scroll_px(-event.delta if abs(event.delta) >= 120 else -event.delta * 30)
+
+    def show_row(self, index):
+        """Destaca a faixa index (1, 2, ...) e rola até ela se estiver fora da janela"""
+        if self.plan is None:
+            return
+        self.selected = index
+        y = self.starts[index - 1]
+        if not self.top <= y < self.top + self._view_mm():
+            self.top = y - self._view_mm() / 3
+        self.schedule()
+
+    # ---- Desenho ----
+
+    def schedule(self):
+        """Agrupa vários pedidos de redesenho em um só (after_idle)"""
+        if not self._pending:
+            self._pending = True
+            self.after_idle(self.redraw)
+
+    def redraw(self):
+        self._pending = False
+        canvas = self.canvas
+        canvas.delete('all')
+        if self.plan is None or not self.plan['rows']:
+            return
+
+        self._clamp()
+        scale = self._scale()
+        view = self._view_mm()
+        top, bottom = self.top, self.top + view
+        roll_width = self.plan['roll']['width']
+        x_end = PAD + roll_width * scale
+        x_start = PAD + self.plan['roll'].get('trim', 0) * scale  # peças começam depois do refilo
+
+        def to_px(y):
+            return PAD + (y - top) * scale
+
+        # Contorno dos rolos visíveis
+        for roll, y, length in self.spans:
+            if y + length < top or y > bottom:
+                continue
+            canvas.create_rectangle(PAD, to_px(max(y, top)), x_end,
+                                    to_px(min(y + length, bottom)),
+                                    fill=LEFTOVER_FILL, outline=ROLL_OUTLINE)
+            if y >= top:
+                canvas.create_text(PAD - 4, to_px(y), text=f"Rolo {roll}",
+                                   anchor=tk.NE, font=('Arial', 8))
+
+        # Faixas visíveis, com nível de detalhe conforme a altura em pixels
+        first, last = visible_range(self.starts, top, bottom)
+        rows = self.plan['rows']
+        last_px = None
+        drawn = 0
+        for i in range(first, last):
+            row = rows[i]
+            y0 = to_px(self.starts[i])
+            row_px = row['height'] * scale
+            if row_px < 1:
+                # Faixas menores que um pixel: desenha uma por linha de pixel
+                if last_px is not None and int(y0) == last_px:
+                    continue
+                last_px = int(y0)
+                canvas.create_line(x_start, y0, x_start + row['used_width'] * scale, y0,
+                                   fill=PIECE_FILL)
+                drawn += 1
+                continue
+
+            if row_px < PIECE_MIN_PX:
+                canvas.create_rectangle(x_start, y0, x_start + row['used_width'] * scale,
+                                        y0 + row_px, fill=PIECE_FILL, outline='')
+            else:
+                for number, item in enumerate(row['items'], 1):
+                    x0 = PAD + item['x'] * scale
+                    x1 = x0 + item['w'] * scale
+                    y1 = y0 + item['h'] * scale
+                    canvas.create_rectangle(x0, y0, x1, y1, outline=PIECE_OUTLINE,
+                                            fill=ROTATED_FILL if item['rotated'] else PIECE_FILL)
+                    if x1 - x0 >= LABEL_MIN_PX and y1 - y0 >= LABEL_MIN_PX:
+                        canvas.create_text((x0 + x1) / 2, (y0 + y1) / 2, text=str(number),
+                                           fill='white', font=('Arial', 8))
+                canvas.create_line(PAD, y0 + row_px, x_end, y0 + row_px, fill=ROLL_OUTLINE)
+            if row['index'] == self.selected:
+                canvas.create_rectangle(PAD, y0, x_end, y0 + row_px, outline='#dc3545', width=2)
+            drawn += 1
+
+        if self.total:
+            self.scrollbar.set(top / self.total, min(bottom / self.total, 1.0))
+        self.info.config(text=f"{scale:.2f} px/mm | faixas {first + 1}–{last} de {len(rows)} "
+                              f"({drawn} desenhadas)")
@@ -4,141 +4,15 @@ Script launcher para o Otimizador de Cortes
 Detecta automaticamente se pode usar GUI ou precisa usar CLI
 """
 
+import importlib.util
+import multiprocessing
+import os
 import subprocess
 import sys
-import os
 from datetime import datetime
-from itertools import combinations
 
-ROLL_WIDTH = 1050  # largura fixa do rolo em mm
-
-def pack_pieces(pieces):
-    """
-    Algoritmo otimizado de força-bruta inteligente para maximizar aproveitamento.
-    """
-    # Expande peças individuais
-    individual_pieces = []
-    for p in pieces:
-        for _ in range(p['qty']):
-            individual_pieces.append((p['w'], p['h'], p['w'], p['h']))
-
-    rows = []
-    remaining = individual_pieces[:]
-    
-    while remaining:
-        # Gera orientações possíveis para peças restantes
-        orientations = []
-        for i, (w, h, orig_w, orig_h) in enumerate(remaining):
-            orientations.append((i, w, h, orig_w, orig_h))      # original
-            if w != h:  # rotacionada se diferente
-                orientations.append((i, h, w, orig_w, orig_h))
-        
-        # Busca melhor combinação para esta faixa
-        best_combo = []
-        best_fill = -1
-        
-        # Testa combinações de até 6 orientações
-        for r in range(1, min(6, len(orientations)) + 1):
-            for combo in combinations(range(len(orientations)), r):
-                # Verifica se usa peças diferentes
-                used_pieces = set()
-                valid = True
-                total_width = 0
-                
-                for idx in combo:
-                    piece_idx = orientations[idx][0]
-                    if piece_idx in used_pieces:
-                        valid = False
-                        break
-                    used_pieces.add(piece_idx)
-                    total_width += orientations[idx][1]  # largura
-                
-                if valid and total_width <= ROLL_WIDTH and total_width > best_fill:
-                    best_fill = total_width
-                    best_combo = [orientations[idx] for idx in combo]
-                    if best_fill == ROLL_WIDTH:  # preenchimento perfeito
-                        break
-            if best_fill == ROLL_WIDTH:
-                break
-        
-        if not best_combo:
-            break
-            
-        # Remove peças usadas
-        used_indices = sorted([item[0] for item in best_combo], reverse=True)
-        for idx in used_indices:
-            remaining.pop(idx)
-        
-        # Cria faixa
-        used_width = sum(item[1] for item in best_combo)
-        max_height = max(item[2] for item in best_combo)
-        
-        row = {
-            'items': [{'w': item[1], 'h': item[2], 'orig_w': item[3], 'orig_h': item[4]} 
-                      for item in best_combo],
-            'used_width': used_width,
-            'height': max_height
-        }
-        rows.append(row)
-    
-    return rows
-
-def format_measurement(mm):
-    """Converte milímetros para formato mais legível"""
-    if mm >= 1000:
-        return f"{mm/1000:.1f} m"
-    else:
-        return f"{mm} mm"
-
-def create_visual_row(row_num, row, roll_width):
-    """Cria uma representação visual muito clara da faixa"""
-    used_width = row['used_width']
-    leftover = roll_width - used_width
-    height = row['height']
-    
-    visual = f"\n{'='*60}\n🎯 FAIXA NÚMERO {row_num}\n{'='*60}\n\n"
-    visual += "📏 COMO CORTAR ESTA FAIXA:\n" + "─" * 40 + "\n"
-    
-    current_pos = 0
-    for i, item in enumerate(row['items'], 1):
-        piece_width = item['w']
-        piece_height = item['h']
-        orig_width = item['orig_w']
-        orig_height = item['orig_h']
-        
-        start_pos = current_pos
-        end_pos = current_pos + piece_width
-        
-        visual += f"\n🔸 PEÇA {i} ({orig_width}×{orig_height}mm):\n"
-        
-        if piece_width == orig_width:
-            visual += f"   ⬜ DEITADA | {piece_width}mm × {piece_height}mm\n"
-        else:
-            visual += f"   ⬜ EM PÉ | {piece_width}mm × {piece_height}mm\n"
-        
-        visual += f"   📍 Posição: {start_pos}mm a {end_pos}mm\n"
-        current_pos += piece_width
-    
-    if leftover > 0:
-        visual += f"\n⚠️  SOBRA: {leftover}mm (do {used_width}mm ao {roll_width}mm)\n"
-    
-    visual += f"\n📋 RESUMO: {len(row['items'])} peças | {used_width}mm usado | {(used_width/roll_width)*100:.1f}% aproveitamento\n"
-    
-    return visual
-
-def create_pieces_summary(pieces):
-    """Cria um resumo claro das peças"""
-    summary = "\n📦 PEÇAS QUE SERÃO CORTADAS:\n\n"
-    
-    for i, piece in enumerate(pieces, 1):
-        width = piece['w']
-        height = piece['h']
-        qty = piece['qty']
-        area = width * height
-        
-        summary += f"🔸 PEÇA {i}: {width}×{height}mm | {qty} unidades | {area * qty} mm² total\n"
-    
-    return summary
+from cut_optimizer.engine import (TIME_BUDGET, pack_pieces_cached, validate_pieces,
+                                  plan_utilization, write_report)
 
 def get_roll_dimensions():
     """Coleta as dimensões do rolo"""
@@ -181,7 +55,7 @@ def get_pieces_input():
     """Coleta as dimensões das peças do usuário"""
     print("🎯 OTIMIZADOR DE CORTES DE MANTAS PRI (ALGORITMO OTIMIZADO)")
     print("=" * 60)
-    print("Algoritmo: Força-bruta inteligente para máximo aproveitamento")
+    print("Algoritmo: Mochila limitada por tipo de peça para máximo aproveitamento")
     print("\nInsira as dimensões das peças (Enter vazio para finalizar):")
     
     pieces = []
@@ -213,6 +87,11 @@ def get_pieces_input():
 
 def run_cli():
     """Executa versão CLI otimizada"""
+    while plan_interactive():
+        print("\n" + "="*60)
+
+def plan_interactive():
+    """Calcula um plano a partir das respostas do usuário; retorna True para calcular outro"""
     # Coleta dimensões do rolo
     roll_width, roll_height = get_roll_dimensions()
     print(f"   ✅ Rolo configurado: {roll_width}×{roll_height}mm\n")
@@ -222,70 +101,25 @@ def run_cli():
     
     if not pieces:
         print("⚠️ Nenhuma peça foi informada!")
-        return
+        return False
     
     # Validação: verifica se todas as peças cabem no rolo
-    for piece in pieces:
-        if piece['w'] > roll_width and piece['h'] > roll_width:
-            print(f"⚠️ ERRO: Peça {piece['w']}×{piece['h']}mm não cabe no rolo de {roll_width}mm de largura!")
-            return
+    try:
+        validate_pieces(pieces, roll_width, roll_height)
+    except ValueError as e:
+        print(f"⚠️ ERRO: {e}")
+        return False
     
     print("\n🚀 CALCULANDO PLANO OTIMIZADO...")
-    print("   Testando todas as combinações e orientações...")
+    print("   Otimizando combinações e orientações por faixa...")
     
     # Calcula otimização
-    rows = pack_pieces(pieces, roll_width, roll_height)
-    total_height = sum(r['height'] for r in rows)
-    total_area = roll_width * total_height
-    
-    used_area = 0
-    for r in rows:
-        for item in r['items']:
-            used_area += item['w'] * item['h']
-    
-    loss_area = total_area - used_area
-    util = used_area / total_area * 100 if total_area else 0
-    
-    print(f"   ✅ Concluído! {util:.1f}% de aproveitamento")
-    
-    # Monta resultado
-    result = "🎯 PLANO DE CORTE OTIMIZADO\n" + "=" * 60 + "\n\n"
-    
-    # Informações básicas
-    result += "📏 INFORMAÇÕES BÁSICAS:\n" + "─" * 40 + "\n"
-    result += f"   • Largura da manta: {format_measurement(roll_width)}\n"
-    result += f"   • Total de peças: {sum(p['qty'] for p in pieces)}\n"
-    result += f"   • Total de faixas: {len(rows)}\n"
-    result += f"   • Comprimento total: {format_measurement(total_height)}\n"
-    result += f"   • Aproveitamento: {util:.1f}%\n"
+    rows = pack_pieces_cached(pieces, roll_width, roll_height, time_budget=TIME_BUDGET)
+    print(f"   ✅ Concluído! {plan_utilization(rows, roll_width):.1f}% de aproveitamento")
     
-    # Resumo das peças
-    result += create_pieces_summary(pieces)
-    
-    # Detalhes de cada faixa
-    result += "\n📐 DETALHES DE CADA FAIXA:\n" + "=" * 60
-    
-    for i, r in enumerate(rows, 1):
-        visual_row = create_visual_row(i, r, roll_width)
-        result += visual_row
-    
-    # Resumo final
-    result += f"\n\n🎯 RESUMO FINAL:\n"
-    result += f"   • {sum(len(r['items']) for r in rows)} peças em {len(rows)} faixas\n"
-    result += f"   • {used_area} mm² utilizados de {total_area} mm² totais\n"
-    result += f"   • {util:.1f}% de aproveitamento do material\n"
-    
-    if util >= 90:
-        result += "   ✅ EXCELENTE aproveitamento!\n"
-    elif util >= 80:
-        result += "   👍 BOM aproveitamento!\n"
-    elif util >= 70:
-        result += "   ⚠️ Aproveitamento regular.\n"
-    else:
-        result += "   ❌ Baixo aproveitamento.\n"
-    
-    # Exibe resultado
-    print("\n" + result)
+    # Exibe resultado (gerado em partes, direto na saída)
+    print()
+    write_report(sys.stdout, pieces, rows, roll_width, roll_height)
     
     # Pergunta se quer salvar
     try:
@@ -293,41 +127,80 @@ def run_cli():
         if save in ['s', 'sim', 'y', 'yes']:
             filename = f"plano_corte_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
             with open(filename, 'w', encoding='utf-8') as f:
-                f.write(f"PLANO DE CORTE OTIMIZADO\n")
+                f.write("PLANO DE CORTE OTIMIZADO\n")
                 f.write(f"Data: {datetime.now().strftime('%d/%m/%Y %H:%M')}\n\n")
-                f.write(result)
+                write_report(f, pieces, rows, roll_width, roll_height)
             print(f"✅ Arquivo salvo: {filename}")
             
         again = input("\n🔄 Calcular outro plano? (s/n): ").strip().lower()
-        if again in ['s', 'sim', 'y', 'yes']:
-            print("\n" + "="*60)
-            run_cli()
+        return again in ['s', 'sim', 'y', 'yes']
             
     except KeyboardInterrupt:
         print("\n\nFinalizado.")
+        return False
+
+# No macOS, alguns Tk abortam o interpretador inteiro ao iniciar (o Tcl/Tk 8.5 do
+# sistema no macOS 12: "macOS 12 (1207) or later required"), e nenhum except pega
+# isso. Lá o Tk é iniciado antes em outro processo, só com uma janela escondida.
+TK_PROBE = ("import tkinter; root = tkinter.Tk(); root.withdraw(); "
+            "root.update_idletasks(); root.destroy()")
+TK_PROBE_TIMEOUT = 10  # segundos
+
+def tk_starts():
+    """Inicia e fecha o Tk em outro processo; False se ele abortar, falhar ou travar"""
+    try:
+        result = subprocess.run([sys.executable, '-c', TK_PROBE], capture_output=True,
+                                timeout=TK_PROBE_TIMEOUT)
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return result.returncode == 0
 
 def test_gui():
-    """Testa se a GUI funciona"""
+    """
+    Verifica se a interface gráfica pode ser usada: o Tkinter precisa estar
+    instalado e, em sistemas X11/Wayland, precisa haver uma tela (DISPLAY ou
+    WAYLAND_DISPLAY). Nesses sistemas e no Windows, uma falha do Tk ao abrir
+    a janela vira TclError, então a verificação fica no próprio processo. No
+    macOS o Tk pode abortar o processo, então ele é testado antes em outro
+    processo (tk_starts()); aplicativos empacotados levam o próprio Tk e não
+    podem rodar `python -c`, então não são testados.
+    """
+    if importlib.util.find_spec('tkinter') is None:
+        return False
+    if sys.platform == 'darwin':
+        return getattr(sys, 'frozen', False) or tk_starts()
+    if sys.platform != 'win32':
+        return bool(os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
+    return True
+
+def run_gui():
+    """Abre a interface no próprio processo; retorna False se o Tk não iniciar"""
+    import tkinter
+    from cut_optimizer.gui import main as gui_main
+    
     try:
-        # Tenta executar o arquivo GUI original
-        result = subprocess.run([sys.executable, 'cut_optimizer.py'], 
-                              capture_output=True, text=True, timeout=2)
-        return result.returncode == 0
-    except:
+        gui_main()
+    except tkinter.TclError:
         return False
+    return True
 
 def main():
     """Função principal que decide entre GUI e CLI"""
+    if len(sys.argv) > 1:  # modo em lote: run_optimizer.py plan pedidos/*.csv ...
+        from cut_optimizer.cli import main as batch_main
+        sys.exit(batch_main(sys.argv[1:]))
+    
     print("🎯 OTIMIZADOR DE CORTES DE MANTAS PRI")
-    print("Testando disponibilidade da interface gráfica...")
     
     if test_gui():
-        print("✅ Interface gráfica disponível! Abrindo GUI...")
-        subprocess.run([sys.executable, 'cut_optimizer.py'])
-    else:
-        print("⚠️ Interface gráfica não disponível (macOS 12.6)")
-        print("🚀 Executando em modo linha de comando otimizado...\n")
-        run_cli()
+        print("🖥️  Abrindo interface gráfica...")
+        if run_gui():
+            return
+    
+    print("⚠️ Interface gráfica não disponível")
+    print("🚀 Executando em modo linha de comando otimizado...\n")
+    run_cli()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    multiprocessing.freeze_support()
+    main()